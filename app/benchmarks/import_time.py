@@ -0,0 +1,113 @@
+"""
+Presupuesto de tiempo de importación de la API (arranque en frío de un worker).
+
+Uso (desde app/):
+    python -m benchmarks.import_time [--budget-ms 2500] [--runs 5]
+
+Importa main en un proceso nuevo con `python -X importtime`, varias veces, y
+toma la corrida más rápida para quitar ruido del disco y del sistema. Imprime
+el total y los paquetes que más tardan, y termina con código 1 si:
+
+- el total pasa de --budget-ms, o
+- se importó alguno de LAZY_MODULES. Los generadores de PDF (ReportLab, PIL)
+  se cargan en el primer render, dentro de utils/report_pdf.py, y NumPy en la
+  primera consulta de telemetría (routers/equipment.py), para que un worker
+  que nunca los usa no pague su importación al arrancar.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos que no deben importarse al arrancar la API
+LAZY_MODULES = (
+    "reportlab",
+    "PIL",
+    "utils.pdf_generator",
+    "utils.pdf_generator_compact",
+    "utils.pdf_assets",
+    "utils.pdf_flowables",
+    "numpy",
+    "utils.equipment_telemetry",
+)
+
+
+def measure_imports(module: str) -> List[Tuple[str, int, int]]:
+    """(módulo, µs propios, µs acumulados) de cada import, en el orden de -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=APP_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} falló:\n{result.stderr[-2000:]}")
+
+    imports = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        imports.append((name.strip(), int(own), int(cumulative)))
+    return imports
+
+
+def lazy_modules_imported(imports: List[Tuple[str, int, int]]) -> List[str]:
+    """Entradas de LAZY_MODULES que se importaron (el paquete o alguno de sus módulos)."""
+    names = {name for name, _, _ in imports}
+    return [
+        lazy for lazy in LAZY_MODULES
+        if any(name == lazy or name.startswith(lazy + ".") for name in names)
+    ]
+
+
+def time_by_package(imports: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    """Tiempo propio sumado por paquete de primer nivel (fastapi, sqlalchemy, ...)."""
+    totals: Dict[str, int] = {}
+    for name, own, _ in imports:
+        package = name.split(".")[0]
+        totals[package] = totals.get(package, 0) + own
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Presupuesto de tiempo de importación de la API")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--budget-ms", type=float, default=2500,
+                        help="ajustarlo a la máquina donde se mide")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="paquetes a mostrar")
+    args = parser.parse_args()
+
+    best = None
+    for _ in range(args.runs):
+        imports = measure_imports(args.module)
+        total = next(cumulative for name, _, cumulative in reversed(imports) if name == args.module)
+        if best is None or total < best[0]:
+            best = (total, imports)
+    total, imports = best
+
+    print(f"import {args.module}: {total / 1000:.0f} ms (mejor de {args.runs}), {len(imports)} módulos")
+    print(f"\n{'paquete':<30}{'ms':>8}")
+    packages = sorted(time_by_package(imports).items(), key=lambda item: item[1], reverse=True)
+    for package, own in packages[:args.top]:
+        print(f"{package:<30}{own / 1000:>8.1f}")
+
+    failures = []
+    if total / 1000 > args.budget_ms:
+        failures.append(f"import {args.module} tardó {total / 1000:.0f} ms, presupuesto {args.budget_ms:.0f} ms")
+    lazy = lazy_modules_imported(imports)
+    if lazy:
+        failures.append(f"módulos que deberían cargarse al usarse: {', '.join(lazy)}")
+
+    if failures:
+        print()
+        for failure in failures:
+            print(failure)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
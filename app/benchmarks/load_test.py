@@ -0,0 +1,363 @@
+"""
+Prueba de carga HTTP con los flujos principales de la API.
+
+Uso (con la API corriendo, p. ej. docker-compose up):
+    python -m benchmarks.load_test --technicians 20 --supervisors 5 --duration 120
+    python -m benchmarks.load_test --dataset-seed 42 --save-baseline
+    python -m benchmarks.load_test --baseline benchmarks/load_baseline.json --threshold 0.2
+
+Cada usuario virtual es un cliente HTTP con su propia conexión y repite su
+flujo hasta que termina --duration:
+
+- Técnico: login, perfil, plantillas de inspección, clientes y equipos una
+  vez; luego en cada vuelta contactos de un cliente, alta de un reporte con
+  checklist completo y carga de las firmas del técnico y del cliente.
+- Supervisor: login; luego en cada vuelta la lista de pendientes, la lista
+  filtrada por cliente, la aprobación de un pendiente y la descarga de su PDF.
+
+Entre pasos se espera un tiempo aleatorio con media --think-time (0 = tan
+rápido como se pueda, para medir el máximo). Con --dataset-seed los técnicos
+son los de benchmarks/synthetic_data.py con esa semilla; si no, todos entran
+con el operador de los datos iniciales.
+
+Al final imprime por endpoint peticiones, errores, peticiones por segundo y
+p50/p95/p99. Igual que benchmarks/pdf_render.py, el resultado se puede
+guardar como baseline; la comparación termina con código 1 si algún p95
+empeora más que --threshold o si la tasa de errores pasa de --max-error-rate.
+Conviene correrlo desde otra máquina o fuera del contenedor de la API para
+que el generador de carga no le quite CPU.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import sys
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "load_baseline.json")
+
+DEFAULT_TECHNICIAN = "victorlopez@attamontacargas.com"
+DEFAULT_SUPERVISOR = "jefe@attamontacargas.com"
+DEFAULT_PASSWORD = "password123"
+
+# PNG de 1x1, suficiente para el endpoint de firmas
+SIGNATURE_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+SERVICE_TYPES = ["Preventivo", "Correctivo", "Reparación"]
+BILLING_TYPES = ["Facturación", "Renta", "Garantía"]
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class LoadStats:
+    """Latencias y errores por endpoint (método + ruta con parámetros como {id})."""
+
+    def __init__(self):
+        self.timings: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, endpoint: str, seconds: float, ok: bool):
+        self.timings.setdefault(endpoint, []).append(seconds)
+        if not ok:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def summary(self, duration: float) -> List[Dict[str, Any]]:
+        results = []
+        for endpoint, timings in sorted(self.timings.items()):
+            timings = sorted(timings)
+            errors = self.errors.get(endpoint, 0)
+            results.append({
+                "endpoint": endpoint,
+                "requests": len(timings),
+                "errors": errors,
+                "error_rate": round(errors / len(timings), 4),
+                "rps": round(len(timings) / duration, 2),
+                "p50_ms": round(_percentile(timings, 0.50) * 1000, 1),
+                "p95_ms": round(_percentile(timings, 0.95) * 1000, 1),
+                "p99_ms": round(_percentile(timings, 0.99) * 1000, 1),
+                "max_ms": round(timings[-1] * 1000, 1),
+            })
+        return results
+
+
+class VirtualUser:
+    def __init__(self, base_url: str, stats: LoadStats, rng: random.Random, args: argparse.Namespace):
+        self.client = httpx.AsyncClient(base_url=base_url, timeout=args.timeout)
+        self.stats = stats
+        self.rng = rng
+        self.think_time = args.think_time
+        self.deadline = 0.0
+
+    async def request(self, method: str, endpoint: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        """Una petición medida; devuelve None si falló (estado >= 400 o error de red)."""
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+            await response.aread()
+        except httpx.HTTPError:
+            self.stats.record(f"{method} {endpoint}", time.perf_counter() - started, ok=False)
+            return None
+        ok = response.status_code < 400
+        self.stats.record(f"{method} {endpoint}", time.perf_counter() - started, ok=ok)
+        return response if ok else None
+
+    async def login(self, email: str, password: str) -> bool:
+        response = await self.request("POST", "/api/auth/login", "/api/auth/login",
+                                      json={"email": email, "password": password})
+        if response is None:
+            return False
+        self.client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+        return True
+
+    async def think(self):
+        if self.think_time > 0:
+            await asyncio.sleep(min(self.rng.expovariate(1 / self.think_time), max(0.0, self.deadline - time.monotonic())))
+
+    def running(self) -> bool:
+        return time.monotonic() < self.deadline
+
+    async def close(self):
+        await self.client.aclose()
+
+
+class Technician(VirtualUser):
+    async def run(self, email: str, password: str):
+        if not await self.login(email, password):
+            return
+        await self.request("GET", "/api/auth/me", "/api/auth/me")
+        templates = await self.request("GET", "/api/inspection/templates/service-report",
+                                       "/api/inspection/templates/service-report")
+        clients = await self.request("GET", "/api/clients/", "/api/clients/", params={"limit": 100})
+        equipment = await self.request("GET", "/api/equipment/", "/api/equipment/", params={"limit": 100})
+        if not (templates and clients and equipment and clients.json() and equipment.json()):
+            return
+        templates, clients, equipment = templates.json(), clients.json(), equipment.json()
+
+        while self.running():
+            await self.think()
+            client = self.rng.choice(clients)
+            contacts = await self.request("GET", "/api/clients/{id}/contacts", f"/api/clients/{client['id']}/contacts")
+            if not contacts or not contacts.json():
+                continue
+            await self.think()
+            report = await self.request(
+                "POST", "/api/service-reports/", "/api/service-reports/",
+                json=self.report_payload(templates, client, self.rng.choice(contacts.json()), self.rng.choice(equipment))
+            )
+            if report is None:
+                continue
+            report_id = report.json()["id"]
+            for signature_type in ("technician", "client"):
+                await self.think()
+                await self.request(
+                    "POST", "/api/service-reports/{id}/upload-signature",
+                    f"/api/service-reports/{report_id}/upload-signature",
+                    params={"signature_type": signature_type},
+                    files={"file": (f"{signature_type}.png", SIGNATURE_PNG, "image/png")}
+                )
+
+    def report_payload(self, templates: dict, client: dict, contact: dict, equipment: dict) -> dict:
+        """Reporte pendiente con el checklist completo de las plantillas."""
+        rng = self.rng
+        inspection_items = [
+            {
+                "category": items[0]["category"] if items else key.upper(),
+                "items": [
+                    {"id": item["id"], "name": item["name"], "category": item["category"],
+                     "status": rng.choices(["OK", "N/A", "R"], [85, 8, 7])[0], "notes": None}
+                    for item in items
+                ]
+            }
+            for key, items in templates["inspection_categories"].items()
+        ]
+        today = date.today()
+        return {
+            "date": today.isoformat(),
+            "client_id": client["id"],
+            "requested_by_id": contact["id"],
+            "equipment_id": equipment["id"],
+            "service_type": rng.choice(SERVICE_TYPES),
+            "billing_type": rng.choice(BILLING_TYPES),
+            "battery_percentage": rng.randint(20, 100) if equipment["type"] == "Eléctrico" else None,
+            "horometer_readings": {"h1": rng.randint(500, 15000)},
+            "work_performed": "Mantenimiento preventivo e inspección general",
+            "activities_performed": "Cambio de aceite y filtros, revisión del sistema hidráulico",
+            "operation_points": {"velocidad_avance": rng.randint(8, 18), "funciones_auxiliares_operando": "SÍ",
+                                 "paro_emergencia_especificaciones": "SÍ"},
+            "inspection_items": inspection_items,
+            "applied_parts": [{"type": "consumibles", "description": "Aceite hidráulico", "quantity": "4L"}],
+            "work_time": {"fecha": today.strftime("%d/%m/%y"), "hora_entrada": "09:00", "hora_salida": "10:30",
+                          "total_horas": 1.5, "tiempo_extra": 0},
+            "technician_comments": "Equipo en buenas condiciones generales.",
+        }
+
+
+class Supervisor(VirtualUser):
+    async def run(self, email: str, password: str):
+        if not await self.login(email, password):
+            return
+        while self.running():
+            await self.think()
+            pending = await self.request("GET", "/api/service-reports/?status_filter", "/api/service-reports/",
+                                         params={"status_filter": "pending", "limit": 20})
+            if pending is None:
+                continue
+            pending = pending.json()
+
+            await self.think()
+            if pending:
+                client_id = self.rng.choice(pending)["client_id"]
+                await self.request("GET", "/api/service-reports/?client_id", "/api/service-reports/",
+                                   params={"client_id": client_id, "limit": 20})
+            if not pending:
+                continue
+
+            await self.think()
+            report_id = self.rng.choice(pending)["id"]
+            approved = await self.request("PUT", "/api/service-reports/{id}", f"/api/service-reports/{report_id}",
+                                          json={"status": "completed"})
+            if approved is None:
+                continue
+            await self.think()
+            await self.request("GET", "/api/service-reports/{id}/pdf", f"/api/service-reports/{report_id}/pdf")
+
+
+def _technician_emails(args: argparse.Namespace) -> List[str]:
+    if args.dataset_seed is None:
+        return [DEFAULT_TECHNICIAN] * args.technicians
+    # Mismo formato que benchmarks/synthetic_data.py
+    return [
+        f"tecnico{n % args.dataset_technicians + 1}.syn{args.dataset_seed}@synthetic.attamontacargas.com"
+        for n in range(args.technicians)
+    ]
+
+
+async def run_load(args: argparse.Namespace) -> LoadStats:
+    stats = LoadStats()
+    users: List[VirtualUser] = []
+    logins = []
+    for n, email in enumerate(_technician_emails(args)):
+        users.append(Technician(args.base_url, stats, random.Random(args.seed * 1000 + n), args))
+        logins.append(email)
+    for n in range(args.supervisors):
+        users.append(Supervisor(args.base_url, stats, random.Random(args.seed * 1000 + 500 + n), args))
+        logins.append(args.supervisor)
+
+    async def start(user: VirtualUser, email: str, delay: float):
+        # Arranque escalonado durante --ramp-up
+        await asyncio.sleep(delay)
+        try:
+            await user.run(email, args.password)
+        finally:
+            await user.close()
+
+    deadline = time.monotonic() + args.duration
+    for user in users:
+        user.deadline = deadline
+    await asyncio.gather(*(
+        start(user, email, args.ramp_up * n / len(users)) for n, (user, email) in enumerate(zip(users, logins))
+    ))
+    return stats
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float) -> List[str]:
+    """Agrega el cambio del p95 contra el baseline a cada resultado; devuelve los endpoints que empeoraron."""
+    previous = {case["endpoint"]: case for case in baseline}
+    regressions = []
+    for case in results:
+        before = previous.get(case["endpoint"])
+        if not before or not before["p95_ms"]:
+            case["p95_change"] = None
+            continue
+        change = (case["p95_ms"] - before["p95_ms"]) / before["p95_ms"]
+        case["p95_change"] = change
+        if change > threshold:
+            regressions.append(f"{case['endpoint']}: p95 {before['p95_ms']} -> {case['p95_ms']} ms")
+    return regressions
+
+
+def print_results(results: List[Dict[str, Any]], duration: float):
+    print(f"{'endpoint':<52}{'pet.':>7}{'err.':>6}{'pet/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'vs base':>9}")
+    for case in results:
+        change = case.get("p95_change")
+        change_text = f"{change:+.0%}" if change is not None else "-"
+        print(f"{case['endpoint']:<52}{case['requests']:>7}{case['errors']:>6}{case['rps']:>8.1f}"
+              f"{case['p50_ms']:>9.1f}{case['p95_ms']:>9.1f}{case['p99_ms']:>9.1f}{change_text:>9}")
+    total = sum(case["requests"] for case in results)
+    errors = sum(case["errors"] for case in results)
+    print(f"\n{total} peticiones en {duration:.0f}s ({total / duration:.1f}/s), {errors} errores")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga HTTP de la API")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--technicians", type=int, default=20, help="usuarios virtuales técnicos")
+    parser.add_argument("--supervisors", type=int, default=5, help="usuarios virtuales supervisores")
+    parser.add_argument("--duration", type=float, default=60, help="segundos de carga")
+    parser.add_argument("--ramp-up", type=float, default=10, help="segundos para arrancar a todos los usuarios")
+    parser.add_argument("--think-time", type=float, default=1.0, help="espera media entre pasos en segundos")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--dataset-seed", type=int,
+                        help="semilla de benchmarks/synthetic_data.py para usar sus técnicos")
+    parser.add_argument("--dataset-technicians", type=int, default=20,
+                        help="técnicos que creó benchmarks/synthetic_data.py")
+    parser.add_argument("--supervisor", default=DEFAULT_SUPERVISOR)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--baseline", help=f"JSON con una corrida anterior (default {DEFAULT_BASELINE} si existe)")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE,
+                        help="guarda los resultados como baseline")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="empeoramiento máximo del p95 contra el baseline (0.20 = 20%%)")
+    parser.add_argument("--max-error-rate", type=float, default=0.01,
+                        help="tasa máxima de errores por endpoint")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    stats = asyncio.run(run_load(args))
+    duration = time.perf_counter() - started
+    results = stats.summary(duration)
+    if not results:
+        print("No se hizo ninguna petición")
+        sys.exit(1)
+
+    baseline_path = args.baseline or (DEFAULT_BASELINE if os.path.exists(DEFAULT_BASELINE) else None)
+    regressions = []
+    if baseline_path and not args.save_baseline:
+        with open(baseline_path) as f:
+            regressions = compare(results, json.load(f)["results"], args.threshold)
+    regressions += [
+        f"{case['endpoint']}: {case['errors']} errores de {case['requests']} peticiones"
+        for case in results if case["error_rate"] > args.max_error_rate
+    ]
+
+    print_results(results, duration)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump({"created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "base_url": args.base_url,
+                       "technicians": args.technicians, "supervisors": args.supervisors,
+                       "duration": args.duration, "think_time": args.think_time, "results": results}, f, indent=2)
+        print(f"Baseline guardado en {args.save_baseline}")
+
+    if regressions:
+        print(f"\nRegresiones (p95 mayor a {args.threshold:.0%} o errores sobre {args.max_error_rate:.0%}):")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
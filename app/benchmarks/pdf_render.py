@@ -0,0 +1,308 @@
+"""
+Benchmark del render de reportes en PDF.
+
+Uso (desde app/):
+    python -m benchmarks.pdf_render [--iterations 100]
+    python -m benchmarks.pdf_render --suite [--save-baseline]
+    python -m benchmarks.pdf_render --suite --baseline benchmarks/baseline.json
+
+No necesita base de datos: los reportes se arman con los catálogos de
+inspection_data.py y seed_data.py. Sin --suite imprime el tiempo por reporte
+del PDF compacto, útil para comparar rápido antes y después de un cambio.
+
+Con --suite corre cada generador contra varios reportes de prueba (checklist
+chico, típico y máximo, narrativas largas, muchas refacciones) y reporta
+p50/p99, reportes por segundo por núcleo y RSS máximo. Cada caso corre en un
+proceso nuevo para que el RSS sea el suyo. El resultado se puede guardar como
+baseline y comparar en corridas posteriores; la comparación termina con
+código 1 si algún p50 empeora más que --threshold.
+
+benchmarks/baseline.json está en el repositorio y se usa por defecto, así que
+--suite compara desde la primera corrida. Sus tiempos dependen de la máquina
+(ver cpu_count y created_at): en otro hardware conviene guardar uno propio
+con --save-baseline antes del cambio que se quiere medir.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from inspection_data import get_inspection_categories
+from seed_data import INSPECTION_ITEMS
+from utils.pdf_generator_compact import generate_service_report_pdf_compact
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+LONG_TEXT = (
+    "Se revisó el sistema hidráulico completo, encontrando fugas en las conexiones del "
+    "cilindro de inclinación y desgaste en las mangueras de alta presión. Se recomienda "
+    "programar el reemplazo de las mangueras en el siguiente servicio preventivo. "
+)
+
+
+def build_sample_report(report_number: int = 1) -> dict:
+    """Reporte típico: checklist completo, narrativas cortas y pocas refacciones."""
+    statuses = ["OK", "OK", "OK", "N/A", "R"]
+    inspection_items = [
+        {
+            "category": category["name"],
+            "items": [
+                {"id": str(item["order_index"]), "name": item["name"],
+                 "status": statuses[i % len(statuses)], "category": category["name"], "notes": None}
+                for i, item in enumerate(category["items"])
+            ]
+        }
+        for category in get_inspection_categories()
+    ]
+    return {
+        "report_number": report_number,
+        "date": "2025-01-15",
+        "client": {"name": "Industrias del Norte S.A. de C.V.", "address": "Av. Industrial 123, Guadalajara, Jal."},
+        "requested_by": {"name": "Juan Pérez", "position": "Jefe de Mantenimiento"},
+        "equipment": {"type": "Montacargas", "brand": "Toyota", "model": "FG25", "serial_number": "TOY-FG25-12345"},
+        "technician": {"name": "Victor Angel Lopez Romero", "position": "Técnico"},
+        "created_by": {"name": "Victor Angel Lopez Romero", "position": "Técnico"},
+        "service_type": "Preventivo",
+        "billing_type": "Facturación",
+        "battery_percentage": 85,
+        "horometer_readings": {"h1": 1250, "h2": 1300, "h3": 850, "h4": 1120},
+        "work_performed": "Cambio de aceite hidráulico, filtros e inspección preventiva completa",
+        "detected_damages": "Fuga menor en sistema hidráulico en conexiones",
+        "possible_causes": [
+            {"id": "1", "name": "Daño Operativo", "selected": False},
+            {"id": "2", "name": "Desgaste por Vida Util", "selected": True},
+            {"id": "3", "name": "Vicio Oculto", "selected": False}
+        ],
+        "activities_performed": "Reemplazo de aceite hidráulico, cambio de filtros y reparación de conexiones",
+        "operation_points": {
+            "velocidad_avance": 12,
+            "funciones_auxiliares_operando": "SÍ",
+            "paro_emergencia_especificaciones": "SÍ"
+        },
+        "inspection_items": inspection_items,
+        "technician_comments": "Equipo en buenas condiciones generales.",
+        "applied_parts": [
+            {"type": "consumibles", "description": "Aceite hidráulico", "quantity": "4L"},
+            {"type": "consumibles", "description": "Filtro de aceite", "quantity": "1"}
+        ],
+        "work_time": {"fecha": "15/01/25", "hora_entrada": "09:30", "hora_salida": "11:45",
+                      "total_horas": 2.25, "tiempo_extra": 0.0},
+        "status": "completed"
+    }
+
+
+def build_small_report() -> dict:
+    """Checklist de una sola categoría con pocos puntos."""
+    report = build_sample_report()
+    first = report["inspection_items"][0]
+    report["inspection_items"] = [{**first, "items": first["items"][:3]}]
+    return report
+
+
+def build_max_checklist_report() -> dict:
+    """
+    El checklist más largo que puede traer un reporte: los puntos de los dos
+    catálogos (inspection_data.py y seed_data.py, que conviven en bases
+    sembradas antes de unificarlos), todos en R con notas, y todas las causas
+    marcadas. Los PDF no imprimen las notas; lo que pesa son los renglones.
+    """
+    report = build_sample_report()
+    categories = {category["category"]: category["items"] for category in report["inspection_items"]}
+    for item in INSPECTION_ITEMS:
+        items = categories.setdefault(item["category"], [])
+        if all(existing["name"] != item["name"] for existing in items):
+            items.append({"id": str(len(items) + 1), "name": item["name"], "category": item["category"]})
+    report["inspection_items"] = [{"category": name, "items": items} for name, items in categories.items()]
+    for items in categories.values():
+        for item in items:
+            item["status"] = "R"
+            item["notes"] = f"Requiere reparación en el siguiente servicio: {item['name'].lower()}"
+    for cause in report["possible_causes"]:
+        cause["selected"] = True
+    return report
+
+
+def build_long_narratives_report() -> dict:
+    """Textos libres de varios párrafos en trabajo, daños, actividades y comentarios."""
+    report = build_sample_report()
+    report["work_performed"] = LONG_TEXT * 3
+    report["detected_damages"] = LONG_TEXT * 2
+    report["activities_performed"] = LONG_TEXT * 3
+    report["technician_comments"] = LONG_TEXT * 4
+    return report
+
+
+def build_many_parts_report() -> dict:
+    """Servicio correctivo con muchas refacciones aplicadas."""
+    report = build_sample_report()
+    report["applied_parts"] = [
+        {"type": "refacciones" if i % 3 else "consumibles",
+         "description": f"Refacción de prueba número {i + 1}", "quantity": str(i % 4 + 1)}
+        for i in range(40)
+    ]
+    return report
+
+
+FIXTURES: Dict[str, Callable[[], dict]] = {
+    "small": build_small_report,
+    "typical": build_sample_report,
+    "max_checklist": build_max_checklist_report,
+    "long_narratives": build_long_narratives_report,
+    "many_parts": build_many_parts_report,
+}
+
+
+def _render_compact(report: dict):
+    return generate_service_report_pdf_compact(report)
+
+
+def _render_full(report: dict):
+    from utils.pdf_generator import generate_service_report_pdf
+    return generate_service_report_pdf(report)
+
+
+GENERATORS: Dict[str, Callable[[dict], Any]] = {
+    "compact": _render_compact,
+    "full": _render_full,
+}
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(generator: str, fixture: str, iterations: int, warmup: int) -> Dict[str, Any]:
+    """Mide un generador con un reporte de prueba en el proceso actual."""
+    render = GENERATORS[generator]
+    report = FIXTURES[fixture]()
+    for _ in range(warmup):
+        render(report)
+
+    timings = []
+    size = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        size = len(render(report).getvalue())
+        timings.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+
+    timings.sort()
+    return {
+        "generator": generator,
+        "fixture": fixture,
+        "iterations": iterations,
+        "p50_ms": round(_percentile(timings, 0.50) * 1000, 2),
+        "p99_ms": round(_percentile(timings, 0.99) * 1000, 2),
+        # Un solo hilo de render: reportes por segundo de un núcleo
+        "reports_per_sec_core": round(iterations / elapsed, 1),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "pdf_kb": round(size / 1024, 1),
+    }
+
+
+def _run_case_args(args: tuple) -> Dict[str, Any]:
+    return run_case(*args)
+
+
+def run_suite(generators: List[str], fixtures: List[str], iterations: int, warmup: int) -> List[Dict[str, Any]]:
+    """Corre cada combinación en un proceso nuevo (spawn) para aislar el RSS."""
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for generator in generators:
+        for fixture in fixtures:
+            with context.Pool(1) as pool:
+                results.append(pool.apply(_run_case_args, ((generator, fixture, iterations, warmup),)))
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float) -> List[str]:
+    """Agrega el cambio contra el baseline a cada resultado; devuelve los casos que empeoraron."""
+    previous = {(case["generator"], case["fixture"]): case for case in baseline}
+    regressions = []
+    for case in results:
+        before = previous.get((case["generator"], case["fixture"]))
+        if not before:
+            case["p50_change"] = None
+            continue
+        change = (case["p50_ms"] - before["p50_ms"]) / before["p50_ms"]
+        case["p50_change"] = change
+        if change > threshold:
+            regressions.append(f"{case['generator']}/{case['fixture']}: p50 {before['p50_ms']} -> {case['p50_ms']} ms")
+    return regressions
+
+
+def print_results(results: List[Dict[str, Any]]):
+    print(f"{'generador':<16}{'reporte':<17}{'p50 ms':>9}{'p99 ms':>9}{'rep/s/núcleo':>14}"
+          f"{'RSS MB':>9}{'PDF KB':>9}{'vs base':>9}")
+    for case in results:
+        change = case.get("p50_change")
+        change_text = f"{change:+.0%}" if change is not None else "-"
+        print(f"{case['generator']:<16}{case['fixture']:<17}{case['p50_ms']:>9.1f}{case['p99_ms']:>9.1f}"
+              f"{case['reports_per_sec_core']:>14.1f}{case['peak_rss_mb']:>9.1f}{case['pdf_kb']:>9.1f}"
+              f"{change_text:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de los PDF de reportes")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--suite", action="store_true", help="todos los generadores y reportes de prueba")
+    parser.add_argument("--generators", nargs="+", choices=list(GENERATORS), default=list(GENERATORS))
+    parser.add_argument("--fixtures", nargs="+", choices=list(FIXTURES), default=list(FIXTURES))
+    parser.add_argument("--baseline", help=f"JSON con una corrida anterior (default {DEFAULT_BASELINE} si existe)")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE,
+                        help="guarda los resultados como baseline")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="empeoramiento máximo del p50 contra el baseline (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    if not args.suite:
+        report = build_sample_report()
+        for _ in range(args.warmup):
+            generate_service_report_pdf_compact(report)
+
+        started = time.perf_counter()
+        for _ in range(args.iterations):
+            generate_service_report_pdf_compact(report)
+        elapsed = time.perf_counter() - started
+
+        print(f"{args.iterations} reportes en {elapsed:.2f}s: {elapsed / args.iterations * 1000:.1f} ms/reporte")
+        return
+
+    results = run_suite(args.generators, args.fixtures, args.iterations, args.warmup)
+
+    baseline_path = args.baseline or (DEFAULT_BASELINE if os.path.exists(DEFAULT_BASELINE) else None)
+    regressions = []
+    if baseline_path and not args.save_baseline:
+        with open(baseline_path) as f:
+            regressions = compare(results, json.load(f)["results"], args.threshold)
+
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump({"created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "cpu_count": os.cpu_count(),
+                       "results": results}, f, indent=2)
+        print(f"Baseline guardado en {args.save_baseline}")
+
+    if regressions:
+        print(f"\nRegresiones mayores a {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,447 @@
+"""
+Generador de un dataset sintético de tamaño de producción.
+
+Uso (desde app/, con la base migrada):
+    python -m benchmarks.synthetic_data --clients 500 --reports 200000 --seed 42
+    python -m benchmarks.synthetic_data --reports 100000 --end-date 2025-06-30
+
+Crea técnicos, clientes con sus contactos y flotas de equipos, y reportes de
+servicio con checklist completo (catálogo de inspection_data.py), puntos de
+operación, refacciones, tiempo de mano de obra y horómetros. Cada equipo
+tiene su propia serie de horómetros que crece con el uso diario, así que los
+reportes de un equipo ordenados por fecha tienen lecturas crecientes.
+
+Con la misma semilla y los mismos argumentos (incluida --end-date, que por
+default es hoy) el resultado es idéntico. Los números de serie y correos
+llevan la semilla (SYN42-...), por lo que dos corridas con semillas distintas
+conviven en la misma base; repetir una semilla se rechaza.
+
+En Postgres los reportes se escriben con COPY en lotes de --batch-size; en
+otras bases (SQLite de desarrollo) con INSERT en bloque. Los técnicos entran
+con la contraseña de los datos iniciales (password123).
+"""
+import argparse
+import csv
+import io
+import json
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List
+
+from sqlalchemy import insert
+
+from core.security import get_password_hash
+from database import SessionLocal, engine
+from inspection_data import get_common_parts, get_inspection_categories
+from models import Client, Contact, Equipment, ServiceReport, User
+from utils.report_stats import rebuild_report_stats
+
+PASSWORD = "password123"
+
+FIRST_NAMES = ["Juan", "María", "Carlos", "Ana", "Luis", "Sofía", "Jorge", "Laura", "Miguel", "Fernanda",
+               "Ricardo", "Gabriela", "Alejandro", "Patricia", "Roberto", "Daniela", "Eduardo", "Claudia"]
+LAST_NAMES = ["García", "Hernández", "López", "Martínez", "González", "Pérez", "Rodríguez", "Sánchez",
+              "Ramírez", "Torres", "Flores", "Rivera", "Gómez", "Díaz", "Cruz", "Morales", "Reyes", "Ortiz"]
+POSITIONS = ["Jefe de Mantenimiento", "Gerente de Operaciones", "Supervisor de Almacén", "Coordinador de Logística",
+             "Gerente de Planta", "Encargado de Compras"]
+COMPANY_WORDS = ["Industrial", "Logística", "Distribuidora", "Almacenes", "Manufacturas", "Transportes",
+                 "Alimentos", "Aceros", "Plásticos", "Empaques", "Comercializadora", "Textiles"]
+COMPANY_PLACES = ["del Norte", "del Bajío", "de Occidente", "del Pacífico", "Jalisco", "Tapatía", "Central",
+                  "Mexicana", "del Valle", "Integral"]
+COMPANY_SUFFIXES = ["S.A. de C.V.", "S. de R.L. de C.V.", "S.A.P.I. de C.V."]
+STREETS = ["Av. Industrial", "Blvd. Transportistas", "Calle Manufactura", "Av. López Mateos", "Periférico Sur",
+           "Av. Vallarta", "Carretera a Chapala", "Av. Lázaro Cárdenas"]
+CITIES = ["Guadalajara, Jalisco", "Zapopan, Jalisco", "Tlaquepaque, Jalisco", "Tonalá, Jalisco",
+          "El Salto, Jalisco", "Tlajomulco, Jalisco"]
+
+# (tipo, marca, modelos, capacidad, combustible)
+EQUIPMENT_MODELS = [
+    ("Combustión", "Toyota", ["FG25", "FG30", "8FGU25"], "2.5 ton", "GLP"),
+    ("Combustión", "Caterpillar", ["GP25N", "DP30N"], "3.0 ton", "Diésel"),
+    ("Combustión", "Hyster", ["H50FT", "H60FT"], "2.5 ton", "GLP"),
+    ("Eléctrico", "Yale", ["ERP030", "ERC050"], "1.5 ton", "Eléctrico"),
+    ("Eléctrico", "Crown", ["FC4500", "RR5700", "SC5200"], "1.8 ton", "Eléctrico"),
+    ("Eléctrico", "Jungheinrich", ["EFG 320", "ETV 216"], "2.0 ton", "Eléctrico"),
+    ("Manual", "Noblelift", ["AC25"], "2.5 ton", None),
+]
+
+SERVICE_TYPES = ["Preventivo", "Correctivo", "Reparación", "Instalación", "Otro"]
+SERVICE_WEIGHTS = [55, 25, 12, 3, 5]
+BILLING_TYPES = ["Facturación", "Renta", "Garantía", "Sin costo"]
+BILLING_WEIGHTS = [60, 25, 10, 5]
+INSPECTION_STATUSES = ["OK", "N/A", "R"]
+INSPECTION_WEIGHTS = [85, 8, 7]
+INSPECTION_NOTES = ["Revisar en el siguiente servicio", "Desgaste visible", "Requiere reemplazo",
+                    "Ajuste realizado", "Fuga menor detectada"]
+POSSIBLE_CAUSES = ["Daño Operativo", "Desgaste por Vida Util", "Vicio Oculto"]
+PENDING_REASONS = ["Esperando aprobación del supervisor para refacciones adicionales",
+                   "Pendiente firma del cliente", "En espera de refacciones"]
+
+WORK_TEXTS = {
+    "Preventivo": ("Mantenimiento preventivo completo según especificaciones del fabricante",
+                   "Cambio de aceite y filtros, lubricación de cadenas y revisión general"),
+    "Correctivo": ("Reparación de falla reportada por el cliente",
+                   "Diagnóstico, desmontaje del componente dañado y reemplazo de refacciones"),
+    "Reparación": ("Reparación mayor del sistema hidráulico",
+                   "Reemplazo de mangueras y sellos, calibración de presión del sistema"),
+    "Instalación": ("Instalación y puesta en marcha del equipo",
+                    "Instalación de accesorios, pruebas de operación y capacitación al operador"),
+    "Otro": ("Revisión general a solicitud del cliente",
+             "Inspección visual y pruebas de funcionamiento"),
+}
+DAMAGES = ["Fuga menor en sistema hidráulico", "Desgaste en llantas de tracción", "Espejo retrovisor roto",
+           "Cadena de elevación con elongación", "Balatas desgastadas", "Batería con baja retención de carga"]
+COMMENTS = ["Equipo operando correctamente después del servicio.",
+            "Se recomienda programar el reemplazo de llantas en el siguiente preventivo.",
+            "Equipo en buenas condiciones generales.",
+            "Operador capacitado en el uso correcto del equipo."]
+OBSERVATIONS = ["Conforme con el servicio realizado.", "Cliente satisfecho con el trabajo realizado.", None]
+
+# Nombres de los cuatro horómetros y su proporción respecto a h1
+HOROMETER_FACTORS = (("h1", 1.0), ("h2", 1.04), ("h3", 0.68), ("h4", 0.9))
+
+
+class SyntheticDataError(RuntimeError):
+    """Los datos de esta semilla ya existen en la base."""
+
+
+def _person(rng: random.Random) -> str:
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def _slug(text: str) -> str:
+    replacements = str.maketrans("áéíóúñ", "aeioun")
+    return "".join(ch for ch in text.lower().translate(replacements) if ch.isalnum())
+
+
+class DatasetGenerator:
+    """Genera las filas a partir de una sola secuencia aleatoria (la semilla)."""
+
+    def __init__(self, seed: int, end_date: date, days: int):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.prefix = f"SYN{seed}"
+        self.end_date = end_date
+        self.days = days
+        self.start_date = end_date - timedelta(days=days - 1)
+        self.catalog = [
+            (category["name"], [(str(item["order_index"]), item["name"]) for item in category["items"]])
+            for category in get_inspection_categories()
+        ]
+        self.parts = get_common_parts()
+
+    # ---- catálogos de clientes, contactos, equipos y técnicos ----
+
+    def technicians(self, count: int) -> List[Dict[str, Any]]:
+        hashed_password = get_password_hash(PASSWORD)
+        rows = []
+        for n in range(1, count + 1):
+            name = _person(self.rng)
+            rows.append({
+                "name": name,
+                "email": f"tecnico{n}.{self.prefix.lower()}@synthetic.attamontacargas.com",
+                "hashed_password": hashed_password,
+                "role": "operador",
+                "position": "Técnico de Servicio",
+                "is_active": True,
+            })
+        return rows
+
+    def clients(self, count: int) -> List[Dict[str, Any]]:
+        rows = []
+        for n in range(1, count + 1):
+            name = (f"{self.rng.choice(COMPANY_WORDS)} {self.rng.choice(COMPANY_PLACES)} "
+                    f"{self.rng.choice(COMPANY_SUFFIXES)} ({self.prefix}-{n:05d})")
+            address = (f"{self.rng.choice(STREETS)} #{self.rng.randint(1, 9999)}, "
+                       f"Zona Industrial, {self.rng.choice(CITIES)}")
+            rows.append({"name": name, "address": address})
+        return rows
+
+    def contacts(self, client_ids: List[int], max_per_client: int) -> List[Dict[str, Any]]:
+        rows = []
+        for client_id in client_ids:
+            for n in range(self.rng.randint(1, max_per_client)):
+                name = _person(self.rng)
+                rows.append({
+                    "client_id": client_id,
+                    "name": name,
+                    "position": self.rng.choice(POSITIONS),
+                    "phone": f"33{self.rng.randint(10000000, 99999999)}",
+                    "email": f"{_slug(name.split()[0])}.{client_id}.{n}@cliente.example.com",
+                })
+        return rows
+
+    def equipment(self, client_ids: List[int], max_per_client: int) -> List[Dict[str, Any]]:
+        """Flota de cada cliente; la llave 'client_id' no es columna y se quita antes de insertar."""
+        rows = []
+        for client_id in client_ids:
+            for _ in range(self.rng.randint(1, max_per_client)):
+                equipment_type, brand, models, capacity, fuel = self.rng.choice(EQUIPMENT_MODELS)
+                rows.append({
+                    "type": equipment_type,
+                    "brand": brand,
+                    "model": self.rng.choice(models),
+                    "serial_number": f"{self.prefix}-{len(rows) + 1:07d}",
+                    "client_id": client_id,
+                    "capacity": capacity,
+                    "fuel_type": fuel,
+                    "model_year": str(self.rng.randint(2012, self.end_date.year)),
+                    # Serie de horómetros: horas al inicio del periodo y uso diario
+                    "base_hours": self.rng.randint(200, 12000),
+                    "hours_per_day": round(self.rng.uniform(1.5, 14.0), 2),
+                })
+        return rows
+
+    # ---- reportes ----
+
+    def _inspection_items(self) -> List[Dict[str, Any]]:
+        rng = self.rng
+        groups = []
+        for category, items in self.catalog:
+            statuses = rng.choices(INSPECTION_STATUSES, INSPECTION_WEIGHTS, k=len(items))
+            groups.append({
+                "category": category,
+                "items": [
+                    {"id": item_id, "name": name, "status": status, "category": category,
+                     "notes": rng.choice(INSPECTION_NOTES) if status == "R" else None}
+                    for (item_id, name), status in zip(items, statuses)
+                ]
+            })
+        return groups
+
+    def _applied_parts(self, service_type: str) -> List[Dict[str, Any]]:
+        rng = self.rng
+        count = rng.randint(1, 3) if service_type == "Preventivo" else rng.randint(0, 8)
+        parts = []
+        for _ in range(count):
+            part_type = "consumibles" if rng.random() < 0.6 else "refacciones"
+            quantity = f"{rng.randint(1, 20)}L" if part_type == "consumibles" and rng.random() < 0.4 else str(rng.randint(1, 4))
+            parts.append({"type": part_type, "description": rng.choice(self.parts[part_type]), "quantity": quantity})
+        return parts
+
+    def reports(self, count: int, context: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Reportes en orden de fecha, repartidos sobre el periodo. Cada uno es
+        de un equipo al azar, con un contacto de su cliente y un técnico.
+        """
+        rng = self.rng
+        equipment = context["equipment"]
+        contacts_by_client = context["contacts_by_client"]
+        technician_ids = context["technician_ids"]
+
+        for index in range(count):
+            day = index * self.days // count
+            report_date = self.start_date + timedelta(days=day)
+            unit = rng.choice(equipment)
+            technician_id = rng.choice(technician_ids)
+            service_type = rng.choices(SERVICE_TYPES, SERVICE_WEIGHTS)[0]
+            work_performed, activities = WORK_TEXTS[service_type]
+
+            hours = unit["base_hours"] + unit["hours_per_day"] * day
+            horometers = {key: int(hours * factor) for key, factor in HOROMETER_FACTORS}
+
+            check_in = 7 * 60 + rng.randint(0, 9 * 60)
+            duration = rng.choice([45, 60, 90, 120, 150, 180, 240, 300])
+            check_out = check_in + duration
+            overtime = max(0, check_out - 18 * 60) / 60
+            started_at = datetime(report_date.year, report_date.month, report_date.day,
+                                  check_in // 60, check_in % 60, tzinfo=timezone.utc)
+
+            pending = index >= count - count // 50 or rng.random() < 0.03
+            causes = [{"id": str(n), "name": name, "selected": rng.random() < 0.35}
+                      for n, name in enumerate(POSSIBLE_CAUSES, start=1)]
+
+            yield {
+                "date": report_date.isoformat(),
+                "created_by": technician_id,
+                "client_id": unit["client_id"],
+                "requested_by_id": rng.choice(contacts_by_client[unit["client_id"]]),
+                "equipment_id": unit["id"],
+                "technician_id": technician_id,
+                "service_type": service_type,
+                "billing_type": rng.choices(BILLING_TYPES, BILLING_WEIGHTS)[0],
+                "battery_percentage": rng.randint(15, 100) if unit["type"] == "Eléctrico" else None,
+                "horometer_readings": horometers,
+                "equipment_specifications": {
+                    "model_year": unit["model_year"], "capacity": unit["capacity"], "fuel_type": unit["fuel_type"]
+                },
+                "work_performed": work_performed,
+                "detected_damages": rng.choice(DAMAGES) if service_type != "Preventivo" or rng.random() < 0.3 else None,
+                "possible_causes": causes,
+                "activities_performed": activities,
+                "operation_points": {
+                    "velocidad_avance": rng.randint(8, 18),
+                    "funciones_auxiliares_operando": "SÍ" if rng.random() < 0.95 else "NO",
+                    "paro_emergencia_especificaciones": "SÍ" if rng.random() < 0.97 else "NO",
+                    "sistema": "OBJETO DE INSPECCIÓN",
+                    "objeto_inspeccion": f"Montacargas {unit['brand']} {unit['model']}",
+                },
+                "inspection_items": self._inspection_items(),
+                "applied_parts": self._applied_parts(service_type),
+                "work_time": {
+                    "fecha": report_date.strftime("%d/%m/%y"),
+                    "hora_entrada": f"{check_in // 60:02d}:{check_in % 60:02d}",
+                    "hora_salida": f"{check_out // 60:02d}:{check_out % 60:02d}",
+                    "total_horas": round(duration / 60, 2),
+                    "tiempo_extra": round(overtime, 2),
+                },
+                "technician_comments": rng.choice(COMMENTS),
+                "client_observations": None if pending else rng.choice(OBSERVATIONS),
+                "status": "pending" if pending else "completed",
+                "pending_reason": rng.choice(PENDING_REASONS) if pending else None,
+                "created_at": started_at,
+            }
+
+
+# ---- escritura ----
+
+REPORT_COLUMNS = [
+    "date", "created_by", "client_id", "requested_by_id", "equipment_id", "technician_id",
+    "service_type", "billing_type", "battery_percentage", "horometer_readings", "equipment_specifications",
+    "work_performed", "detected_damages", "possible_causes", "activities_performed", "operation_points",
+    "inspection_items", "applied_parts", "work_time", "technician_comments", "client_observations",
+    "status", "pending_reason", "created_at",
+]
+COPY_NULL = "\\N"
+
+
+def _insert_returning_ids(model, rows: List[Dict[str, Any]], batch_size: int) -> List[int]:
+    """INSERT en bloque que devuelve los ids en el orden de las filas."""
+    ids: List[int] = []
+    statement = insert(model).returning(model.id, sort_by_parameter_order=True)
+    with engine.begin() as connection:
+        for start in range(0, len(rows), batch_size):
+            ids.extend(connection.execute(statement, rows[start:start + batch_size]).scalars())
+    return ids
+
+
+def _copy_value(value: Any) -> Any:
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _copy_reports(batch: List[Dict[str, Any]]):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for report in batch:
+        writer.writerow([_copy_value(report[column]) for column in REPORT_COLUMNS])
+    buffer.seek(0)
+
+    connection = engine.raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY service_reports ({', '.join(REPORT_COLUMNS)}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+                buffer
+            )
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def _insert_reports(batch: List[Dict[str, Any]]):
+    with engine.begin() as connection:
+        connection.execute(insert(ServiceReport), batch)
+
+
+def write_reports(reports: Iterator[Dict[str, Any]], count: int, batch_size: int) -> float:
+    """Escribe los reportes por lotes (cada lote en su transacción); devuelve los segundos."""
+    write_batch = _copy_reports if engine.dialect.name == "postgresql" else _insert_reports
+    started = time.perf_counter()
+    written = 0
+    batch: List[Dict[str, Any]] = []
+    for report in reports:
+        batch.append(report)
+        if len(batch) == batch_size:
+            write_batch(batch)
+            written += len(batch)
+            batch = []
+            elapsed = time.perf_counter() - started
+            print(f"  {written}/{count} reportes ({written / elapsed * 60:,.0f}/min)", end="\r", flush=True)
+    if batch:
+        write_batch(batch)
+    print()
+    return time.perf_counter() - started
+
+
+def generate(args: argparse.Namespace):
+    generator = DatasetGenerator(args.seed, args.end_date, args.days)
+
+    db = SessionLocal()
+    try:
+        if db.query(Equipment.id).filter(Equipment.serial_number.like(f"{generator.prefix}-%")).first():
+            raise SyntheticDataError(
+                f"Ya hay datos de la semilla {args.seed} ({generator.prefix}-...); usa otra semilla"
+            )
+    finally:
+        db.close()
+
+    started = time.perf_counter()
+    technicians = generator.technicians(args.technicians)
+    technician_ids = _insert_returning_ids(User, technicians, args.batch_size)
+
+    client_ids = _insert_returning_ids(Client, generator.clients(args.clients), args.batch_size)
+
+    contacts = generator.contacts(client_ids, args.contacts_per_client)
+    contact_ids = _insert_returning_ids(Contact, contacts, args.batch_size)
+    contacts_by_client: Dict[int, List[int]] = {}
+    for contact, contact_id in zip(contacts, contact_ids):
+        contacts_by_client.setdefault(contact["client_id"], []).append(contact_id)
+
+    equipment = generator.equipment(client_ids, args.equipment_per_client)
+    columns = {column.key for column in Equipment.__table__.columns}
+    equipment_ids = _insert_returning_ids(
+        Equipment, [{k: v for k, v in unit.items() if k in columns} for unit in equipment], args.batch_size
+    )
+    for unit, equipment_id in zip(equipment, equipment_ids):
+        unit["id"] = equipment_id
+    print(f"{len(technician_ids)} técnicos, {len(client_ids)} clientes, {len(contact_ids)} contactos, "
+          f"{len(equipment_ids)} equipos en {time.perf_counter() - started:.1f}s")
+
+    context = {"equipment": equipment, "contacts_by_client": contacts_by_client, "technician_ids": technician_ids}
+    elapsed = write_reports(generator.reports(args.reports, context), args.reports, args.batch_size)
+    rate = args.reports / elapsed * 60 if elapsed else 0
+    print(f"{args.reports} reportes en {elapsed:.1f}s ({rate:,.0f} reportes/min)")
+
+    # COPY/INSERT en bloque no pasa por los eventos del ORM que mantienen report_monthly_stats
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        rows = rebuild_report_stats(db)
+        print(f"report_monthly_stats: {rows} filas en {time.perf_counter() - started:.1f}s")
+    finally:
+        db.close()
+    print(f"Reproducible con: --seed {args.seed} --end-date {args.end_date.isoformat()} --days {args.days} "
+          f"--clients {args.clients} --reports {args.reports}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera un dataset sintético para pruebas de carga")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--contacts-per-client", type=int, default=3, help="máximo por cliente")
+    parser.add_argument("--equipment-per-client", type=int, default=6, help="máximo por cliente")
+    parser.add_argument("--technicians", type=int, default=20)
+    parser.add_argument("--reports", type=int, default=100000)
+    parser.add_argument("--days", type=int, default=730, help="días que cubren los reportes")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=date.today(),
+                        help="fecha del último reporte, AAAA-MM-DD (default hoy)")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    try:
+        generate(args)
+    except SyntheticDataError as e:
+        print(e)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Comprobaciones y tiempos de la telemetría de equipos (utils/equipment_telemetry.py).
+
+Uso (desde app/):
+    python -m benchmarks.telemetry [--runs 5]
+    python -m benchmarks.telemetry --check      # solo los casos, sin base de datos (CI)
+
+Primero corre compute_telemetry sobre series construidas a mano (CASES) y
+compara con los valores esperados; luego mide load_readings y
+compute_telemetry sobre toda la flotilla de DATABASE_URL (útil con el dataset
+de benchmarks/synthetic_data.py). Si falla un caso termina con código 1 sin
+medir la flotilla.
+"""
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, List
+
+import numpy as np
+
+from utils.equipment_telemetry import compute_telemetry, load_readings
+
+START = date(2025, 1, 1)
+TODAY = date(2025, 1, 22)
+
+
+def _readings(series: List[tuple]) -> Dict[str, np.ndarray]:
+    """(equipo, día desde START, horómetro, batería, preventivo) -> arreglos de load_readings."""
+    equipment_id, day, horometer, battery, preventive = zip(*series)
+    return {
+        "equipment_id": np.array(equipment_id, dtype=np.int64),
+        "day": np.array(day, dtype=np.int64) + START.toordinal(),
+        "horometer": np.array(horometer, dtype=float),
+        "battery": np.array(battery, dtype=float),
+        "preventive": np.array(preventive, dtype=bool),
+    }
+
+
+# nombre -> (lecturas, valores esperados por equipo)
+CASES: Dict[str, tuple] = {
+    "uso constante": (
+        [(1, 0, 1000, 80, True), (1, 10, 1100, 70, False), (1, 20, 1200, None, False)],
+        {1: {"usage_hours_per_day": 10.0, "hours_since_preventive": 200.0,
+             "projected_next_service_date": START + timedelta(days=25), "service_overdue": False,
+             "battery_trend_per_30_days": -30.0}},
+    ),
+    "servicio vencido": (
+        [(1, 0, 1000, None, True), (1, 30, 1300, None, False)],
+        {1: {"hours_since_preventive": 300.0, "service_overdue": True}},
+    ),
+    # Pendiente positiva pero mínima: la proyección pasaría del año 9999
+    "uso casi nulo": (
+        [(1, 11, 1001, None, True), (1, 89, 1000, None, False), (1, 119, 1001, None, False),
+         (1, 140, 1001, None, False)],
+        {1: {"projected_next_service_date": None, "service_overdue": False}},
+    ),
+    "sin preventivo": (
+        [(1, 0, 500, None, False), (1, 10, 600, None, False)],
+        {1: {"usage_hours_per_day": 10.0, "projected_next_service_date": None}},
+    ),
+    "una sola lectura": (
+        [(1, 0, 500, None, True)],
+        {1: {"usage_hours_per_day": None, "projected_next_service_date": None}},
+    ),
+    "sin horómetro": (
+        [(1, 0, None, 50, False)],
+        {1: {"last_horometer": None, "battery_percentage": 50.0}},
+    ),
+}
+
+
+def check_cases() -> List[str]:
+    failures = []
+    for name, (series, expected) in CASES.items():
+        try:
+            telemetry = compute_telemetry(_readings(series), TODAY)
+        except Exception as e:
+            failures.append(f"{name}: {type(e).__name__}: {e}")
+            continue
+        for equipment_id, values in expected.items():
+            for field, value in values.items():
+                actual = telemetry[equipment_id][field]
+                if actual != value:
+                    failures.append(f"{name}: {field} = {actual!r}, se esperaba {value!r}")
+    return failures
+
+
+def time_fleet(runs: int) -> Dict[str, Any]:
+    # Solo aquí se necesita la base de datos (--check no la usa)
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        best_load = best_compute = None
+        for _ in range(runs):
+            started = time.perf_counter()
+            readings = load_readings(db)
+            loaded = time.perf_counter()
+            telemetry = compute_telemetry(readings, date.today())
+            computed = time.perf_counter()
+            best_load = min(best_load or loaded - started, loaded - started)
+            best_compute = min(best_compute or computed - loaded, computed - loaded)
+        return {
+            "readings": len(readings["day"]), "equipment": len(telemetry),
+            "load_ms": best_load * 1000, "compute_ms": best_compute * 1000,
+        }
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Comprobaciones y tiempos de la telemetría de equipos")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--check", action="store_true", help="solo los casos, sin medir la flotilla (no usa la base de datos)")
+    args = parser.parse_args()
+
+    failures = check_cases()
+    print(f"{len(CASES) - len({f.split(':')[0] for f in failures})}/{len(CASES)} casos correctos")
+    if failures:
+        print()
+        for failure in failures:
+            print(failure)
+        sys.exit(1)
+    if args.check:
+        return
+
+    fleet = time_fleet(args.runs)
+    print(f"{fleet['readings']} lecturas de {fleet['equipment']} equipos: "
+          f"load_readings {fleet['load_ms']:.0f} ms, compute_telemetry {fleet['compute_ms']:.1f} ms "
+          f"(mejor de {args.runs})")
+
+
+if __name__ == "__main__":
+    main()
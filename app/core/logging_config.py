@@ -0,0 +1,125 @@
+"""
+Logging configuration for the API and the job workers.
+
+Records are formatted and written by a background QueueListener thread, so
+a log call in a request handler only puts the record on an in-memory queue
+and never blocks the event loop on stdout. Messages use %-style arguments
+(logger.info("Report %s", report_id)), which are only formatted when the
+record passes the level check.
+
+Levels come from Settings: LOG_LEVEL for the root logger and LOG_LEVELS for
+per-module overrides, e.g.
+    LOG_LEVELS='{"routers.service_reports": "DEBUG", "sqlalchemy.engine": "INFO"}'
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+
+from core.config import settings
+
+# Attributes every LogRecord has; anything else was passed with extra={...}
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_configured_pid: Optional[int] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with the fields passed in extra={...}."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.processName,
+            "pid": record.process,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Puts records on the queue with the message already merged, but without
+    the str() of the whole record that the stdlib handler does.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            # Tracebacks can't be pickled or outlive the frame; keep the text
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _make_formatter() -> logging.Formatter:
+    if settings.log_format == "json":
+        return JsonFormatter()
+    return logging.Formatter("%(asctime)s %(processName)s[%(process)d] %(levelname)s %(name)s: %(message)s")
+
+
+def setup_logging(force: bool = False):
+    """
+    Install the queue handler on the root logger and start the listener.
+    Safe to call more than once; in a forked child process (job workers) it
+    starts a new listener, since the parent's thread does not exist there.
+    """
+    global _listener, _configured_pid
+    if _configured_pid == os.getpid() and not force:
+        return
+    if _listener is not None and _configured_pid == os.getpid():
+        _listener.stop()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_make_formatter())
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_QueueHandler(log_queue))
+    root.setLevel(settings.log_level.upper())
+
+    for name, level in settings.log_levels.items():
+        logging.getLogger(name).setLevel(str(level).upper())
+
+    # Uvicorn installs its own stdout handlers; send its records through the queue too
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        # Gunicorn's UvicornWorker shares its own handler lists here; don't clear them in place
+        uvicorn_logger.handlers = []
+        uvicorn_logger.propagate = True
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    _configured_pid = os.getpid()
+
+
+def stop_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None and _configured_pid == os.getpid():
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,210 @@
+"""
+Prometheus metrics for the API, served at /metrics.
+
+MetricsMiddleware times every HTTP request and labels it with the route
+template (/api/service-reports/{report_id}, not the raw path) so the number
+of series stays bounded. The request count per route and status is the
+_count of the latency histogram. SQL statements and database time per
+request come from core.query_stats.
+
+Database pool and job queue figures are read when /metrics is scraped, so
+they cost nothing per request. Under Gunicorn, PROMETHEUS_MULTIPROC_DIR is
+set (gunicorn.conf.py) and the counters and histograms of all the workers
+are aggregated on each scrape; pool figures are always those of the process
+that answers.
+"""
+import logging
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+)
+from prometheus_client.core import GaugeMetricFamily
+
+logger = logging.getLogger(__name__)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency, until the last byte of the response is sent",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being handled",
+    multiprocess_mode="livesum",
+)
+DB_STATEMENTS = Histogram(
+    "http_request_db_statements",
+    "SQL statements run by an HTTP request",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 200),
+)
+DB_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "Time an HTTP request spent waiting on SQL statements",
+    ["method", "route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+PDF_RENDER_DURATION = Histogram(
+    "pdf_render_duration_seconds",
+    "Time to render a PDF",
+    ["kind"],  # report, history
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+DB_READ_SESSIONS = Counter(
+    "db_read_sessions_total",
+    "Sessions opened for read-only handlers, by the database that served them",
+    ["database", "reason"],  # reason: replica, sticky, fallback, no_replica
+)
+CACHE_REQUESTS = Counter(
+    "app_cache_requests_total",
+    "In-process cache lookups",
+    ["cache", "result"],  # result: hit, miss
+)
+
+UNMATCHED_ROUTE = "unmatched"
+# Anything else is reported as "other" so clients can't create new series
+HTTP_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+
+def cache_counters(cache: str) -> Tuple[Counter, Counter]:
+    """(hits, misses) counters of a cache, bound once so lookups only pay for inc()."""
+    return CACHE_REQUESTS.labels(cache, "hit"), CACHE_REQUESTS.labels(cache, "miss")
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware; does not buffer or wrap the response body."""
+
+    def __init__(self, app):
+        self.app = app
+        # endpoint -> route template, built from the app's routes on first use
+        self._routes: Optional[Dict[object, str]] = None
+        self._series: Dict[Tuple[str, str, int], Histogram] = {}
+        self._db_series: Dict[Tuple[str, str], Tuple[Histogram, Histogram]] = {}
+
+    def _route_template(self, scope) -> str:
+        if self._routes is None:
+            routes = {}
+            for route in scope["app"].routes:
+                # Mounts (e.g. /uploads) report their app as the endpoint
+                endpoint = getattr(route, "endpoint", None) or getattr(route, "app", None)
+                routes.setdefault(endpoint, route.path)
+            self._routes = routes
+        # The router records the matched endpoint in the (shared) scope
+        return self._routes.get(scope.get("endpoint"), UNMATCHED_ROUTE)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_PROGRESS.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            REQUESTS_IN_PROGRESS.dec()
+            method = scope["method"] if scope["method"] in HTTP_METHODS else "other"
+            key = (method, self._route_template(scope), status_code)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = REQUEST_DURATION.labels(key[0], key[1], str(status_code))
+            series.observe(elapsed)
+
+            # Set by QueryStatsMiddleware
+            query_stats = scope.get("query_stats")
+            if query_stats is not None:
+                db_key = key[:2]
+                db_series = self._db_series.get(db_key)
+                if db_series is None:
+                    db_series = self._db_series[db_key] = (DB_STATEMENTS.labels(*db_key), DB_DURATION.labels(*db_key))
+                db_series[0].observe(query_stats.statements)
+                db_series[1].observe(query_stats.seconds)
+
+
+class DatabasePoolCollector:
+    """Connection pool state of this process, read at scrape time."""
+
+    def describe(self):
+        # Keeps the registry from calling collect() when registering
+        return []
+
+    def collect(self):
+        from database import engine, read_engine
+
+        pools = {"primary": engine.pool}
+        if read_engine is not None:
+            pools["replica"] = read_engine.pool
+        stats = {
+            "db_pool_size": ("Connections the pool keeps open", "size"),
+            "db_pool_checked_out": ("Connections in use", "checkedout"),
+            "db_pool_checked_in": ("Idle connections in the pool", "checkedin"),
+            "db_pool_overflow": ("Connections open beyond the pool size", "overflow"),
+        }
+        for name, (documentation, method) in stats.items():
+            family = GaugeMetricFamily(name, documentation, labels=["database"])
+            for database, pool in pools.items():
+                # NullPool/StaticPool (tests, SQLite) don't track these
+                if hasattr(pool, method):
+                    family.add_metric([database], getattr(pool, method)())
+            if family.samples:
+                yield family
+
+
+class JobQueueCollector:
+    """Queued and running background jobs per type, counted in the jobs table."""
+
+    def describe(self):
+        return []
+
+    def collect(self):
+        from sqlalchemy import func
+        from database import SessionLocal
+        from models import Job
+
+        depth = GaugeMetricFamily("job_queue_jobs", "Background jobs waiting or running",
+                                  labels=["job_type", "status"])
+        db = SessionLocal()
+        try:
+            rows = db.query(Job.job_type, Job.status, func.count(Job.id)).filter(
+                Job.status.in_(("queued", "running"))
+            ).group_by(Job.job_type, Job.status).all()
+        except Exception as e:
+            logger.warning("Could not read job queue depth: %s", e)
+            return
+        finally:
+            db.close()
+        for job_type, status, count in rows:
+            depth.add_metric([job_type, status], count)
+        yield depth
+
+
+_custom_collectors = (DatabasePoolCollector(), JobQueueCollector())
+for _collector in _custom_collectors:
+    REGISTRY.register(_collector)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Exposition text of every metric and its content type."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        for collector in _custom_collectors:
+            registry.register(collector)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
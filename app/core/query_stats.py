@@ -0,0 +1,128 @@
+"""
+Per-request SQL statement count and database time.
+
+Engine event hooks count every statement a request runs and the time spent
+waiting on the database. QueryStatsMiddleware returns both in a
+Server-Timing header (shown by the browser's network tab):
+
+    Server-Timing: db;dur=12.4;desc="7 queries"
+
+and MetricsMiddleware adds them to the per-route histograms. Statements
+slower than SQL_SLOW_QUERY_MS are logged with their normalized SQL.
+
+SQL_QUERY_BUDGET is a development guard: when set, a request that runs more
+statements than the budget fails with QueryBudgetExceeded at the statement
+that went over, so N+1 loops show up as errors instead of slow pages. With
+APP_ENV other than development the request goes on and the overrun is only
+logged, once per request.
+"""
+import logging
+import re
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PLACEHOLDERS = re.compile(r"%\(\w+\)s|%s|(?<!:):\w+|\?")
+_VALUE_LISTS = re.compile(r"\(\?(?:\s*,\s*\?)+\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """A request ran more statements than settings.sql_query_budget."""
+
+
+class QueryStats:
+    __slots__ = ("statements", "seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+
+
+# Stats of the request being handled; also seen by threadpool endpoints
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def normalize_sql(statement: str) -> str:
+    """SQL with literals and bound values replaced by ?, so equal queries group together."""
+    statement = _LITERALS.sub("?", statement)
+    statement = _PLACEHOLDERS.sub("?", statement)
+    # IN (?, ?, ?) with any number of values
+    statement = _VALUE_LISTS.sub("(?...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+    stats = _current.get()
+    if stats is not None:
+        stats.statements += 1
+        budget = settings.sql_query_budget
+        if budget and stats.statements > budget:
+            message = f"Request exceeded the budget of {budget} SQL statements at: {normalize_sql(statement)}"
+            if settings.app_env == "development":
+                raise QueryBudgetExceeded(message)
+            if stats.statements == budget + 1:
+                logger.warning(message)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.seconds += elapsed
+    if elapsed * 1000 >= settings.sql_slow_query_ms:
+        logger.warning(
+            "Slow query (%.0f ms): %s", elapsed * 1000, normalize_sql(statement),
+            extra={"duration_ms": round(elapsed * 1000, 1)}
+        )
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute doesn't run for failed (or over budget) statements
+    started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def instrument_engine(engine: Engine):
+    """Install the statement hooks on an engine."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class QueryStatsMiddleware:
+    """Collects the statements of each HTTP request and adds the Server-Timing header."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        # Read by MetricsMiddleware once the request is done
+        scope["query_stats"] = stats
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                server_timing = f'db;dur={stats.seconds * 1000:.1f};desc="{stats.statements} queries"'
+                message["headers"] = [*message.get("headers", []), (b"server-timing", server_timing.encode())]
+            await send(message)
+
+        token = _current.set(stats)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
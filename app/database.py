@@ -1,13 +1,67 @@
+"""
+Database engines and the session dependencies for the routers.
+
+get_db opens a session on the primary. get_read_db is for handlers that
+only read (lists, details, templates, dashboard): with DATABASE_READ_URL set
+it opens the session on the read replica instead, except when
+
+- the authenticated user wrote something in the last
+  DATABASE_READ_STICKY_SECONDS, so they see their own writes even if the
+  replica lags behind. ReadYourWritesMiddleware answers each successful
+  write with a signed X-Read-Primary-Until header, which the client sends
+  back on its next requests, and also remembers the time in this process.
+  Neither check touches the database, or
+- the replica can't be reached; reads then stay on the primary for
+  DATABASE_READ_RETRY_SECONDS before trying it again.
+
+Without a replica get_read_db is the same as get_db.
+"""
+import hashlib
+import hmac
+import logging
+import time
+from typing import Dict, Optional
+
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from core.config import settings
+from core.metrics import DB_READ_SESSIONS
+from core.query_stats import instrument_engine
+from core.security import verify_token
+
+logger = logging.getLogger(__name__)
 
 engine = create_engine(settings.database_url)
+instrument_engine(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+read_engine = None
+ReadSessionLocal = None
+if settings.database_read_url:
+    # pre_ping: a connection lost when the replica restarts is replaced, not handed to a request
+    read_engine = create_engine(settings.database_read_url, pool_pre_ping=True)
+    instrument_engine(read_engine)
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
 Base = declarative_base()
 
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+# Writes that don't pin the user's reads to the primary
+STICKY_EXEMPT_PATHS = {"/api/auth/login"}
+# "<until>.<signature>": time.time() until which the user's reads go to the primary
+READ_PRIMARY_HEADER = "X-Read-Primary-Until"
+# Pruned of expired entries when it grows past this
+RECENT_WRITES_MAX_SIZE = 10000
+
+# user id -> time.time() until which their reads go to the primary, per process
+_recent_writes: Dict[int, float] = {}
+
+# time.monotonic() until which the replica is considered down, per process
+_replica_down_until = 0.0
+
 def get_db():
     """Get database session."""
     db = SessionLocal()
@@ -15,3 +69,118 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def _user_id(authorization: Optional[str]) -> Optional[int]:
+    """User id of a valid "Bearer <token>" Authorization header."""
+    scheme, _, token = (authorization or "").partition(" ")
+    payload = verify_token(token) if scheme.lower() == "bearer" and token else None
+    try:
+        return int(payload["sub"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+def _read_primary_signature(user_id: int, until: str) -> str:
+    message = f"{user_id}:{until}".encode()
+    return hmac.new(settings.jwt_secret_key.encode(), message, hashlib.sha256).hexdigest()[:32]
+
+def _header_until(user_id: int, value: Optional[str]) -> float:
+    """Time from a X-Read-Primary-Until header issued to this user, or 0."""
+    until, _, signature = (value or "").partition(".")
+    if not until.isdigit() or not hmac.compare_digest(signature, _read_primary_signature(user_id, until)):
+        return 0.0
+    return float(until)
+
+def _wrote_recently(request: Request) -> bool:
+    marker = request.headers.get(READ_PRIMARY_HEADER)
+    if marker is None and not _recent_writes:
+        # No write marker anywhere: skip decoding the token
+        return False
+    user_id = _user_id(request.headers.get("authorization"))
+    if user_id is None:
+        return False
+    until = max(_recent_writes.get(user_id, 0.0), _header_until(user_id, marker))
+    now = time.time()
+    # Signed values never exceed the window; the cap covers a changed setting
+    return now < until <= now + settings.database_read_sticky_seconds + 1
+
+def mark_user_write(user_id: int) -> str:
+    """
+    Record that the user just wrote, so get_read_db sends their next reads to
+    the primary. Returns the X-Read-Primary-Until value for the response.
+    """
+    now = time.time()
+    until = int(now + settings.database_read_sticky_seconds) + 1
+    if len(_recent_writes) >= RECENT_WRITES_MAX_SIZE:
+        for expired in [key for key, value in _recent_writes.items() if value <= now]:
+            del _recent_writes[expired]
+    _recent_writes[user_id] = until
+    return f"{until}.{_read_primary_signature(user_id, str(until))}"
+
+def _replica_session() -> Optional[Session]:
+    """Session on the replica, or None if it can't be reached."""
+    global _replica_down_until
+    if time.monotonic() < _replica_down_until:
+        return None
+    db = ReadSessionLocal()
+    try:
+        # Checks out (and pings) the connection now, while falling back is still possible
+        db.connection()
+        return db
+    except OperationalError as e:
+        db.close()
+        _replica_down_until = time.monotonic() + settings.database_read_retry_seconds
+        logger.warning(
+            "Read replica unavailable, reading from the primary for %ss: %s",
+            settings.database_read_retry_seconds, e
+        )
+        return None
+
+def get_read_db(request: Request):
+    """Get a session for read-only handlers (replica when configured, see module docstring)."""
+    db = None
+    if ReadSessionLocal is None:
+        reason = "no_replica"
+    elif _wrote_recently(request):
+        reason = "sticky"
+    else:
+        db = _replica_session()
+        reason = "replica" if db is not None else "fallback"
+    DB_READ_SESSIONS.labels("replica" if db is not None else "primary", reason).inc()
+
+    if db is None:
+        db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+class ReadYourWritesMiddleware:
+    """
+    Records the authenticated user's successful write requests (any method
+    but GET/HEAD/OPTIONS, except login) with mark_user_write and adds the
+    X-Read-Primary-Until header to the response.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS or scope["path"] in STICKY_EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        user_id = _user_id(headers.get(b"authorization", b"").decode("latin-1"))
+        if user_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_after_marking(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                marker = mark_user_write(user_id)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (READ_PRIMARY_HEADER.lower().encode("latin-1"), marker.encode("latin-1"))
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_after_marking)
@@ -0,0 +1,74 @@
+"""
+Gunicorn configuration for production: several Uvicorn worker processes.
+
+    gunicorn main:app -c gunicorn.conf.py
+
+Values come from Settings (SERVER_* environment variables). The app is
+imported once in the master (preload_app) and the workers are forked from
+it, sharing the imported code copy-on-write. ReportLab and the PDF
+generators are not part of that import: each worker loads them on its first
+render (see benchmarks/import_time.py). The reloader is never enabled here;
+use `uvicorn main:app --reload` for development.
+
+Prometheus metrics run in multiprocess mode: each worker writes its values
+to PROMETHEUS_MULTIPROC_DIR and /metrics adds up all of them (see
+core.metrics).
+"""
+import os
+
+from core.config import settings
+
+
+def _cpu_count() -> int:
+    # CPUs this container may use, not the host's total
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# Read by prometheus_client when it is imported, so before preload_app loads the app
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc")
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+bind = settings.server_bind
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = settings.server_workers or _cpu_count()
+preload_app = True
+reload = False
+
+keepalive = settings.server_keepalive
+timeout = settings.server_timeout
+graceful_timeout = settings.server_graceful_timeout
+max_requests = settings.server_max_requests
+max_requests_jitter = settings.server_max_requests // 10
+
+# Logs go through core.logging_config; the access log is uvicorn's
+accesslog = None
+
+
+def on_starting(server):
+    # Files left by a previous run would be added to this run's counters
+    multiproc_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    for name in os.listdir(multiproc_dir):
+        if name.endswith(".db"):
+            os.remove(os.path.join(multiproc_dir, name))
+
+
+def post_fork(server, worker):
+    from core.logging_config import setup_logging
+    from database import engine, read_engine
+
+    # Connections opened by the master while importing must not be shared
+    engine.dispose(close=False)
+    if read_engine is not None:
+        read_engine.dispose(close=False)
+    # The master's log listener thread does not exist in the worker
+    setup_logging()
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    # Drops the live gauges (requests in progress) of the dead worker
+    multiprocess.mark_process_dead(worker.pid)
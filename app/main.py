@@ -1,14 +1,23 @@
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import OperationalError
+import logging
 import os
 
-from database import engine, get_db
-from models import Base
+from database import get_db, read_engine, READ_PRIMARY_HEADER, ReadYourWritesMiddleware
+from migrate import check_schema_revision
 from routers import auth, users, clients, equipment, service_reports
 from core.config import settings
+from core.logging_config import setup_logging, stop_logging
+from core.metrics import MetricsMiddleware, render_metrics
+from core.query_stats import QueryStatsMiddleware
+from utils.s3_manager import s3_manager
+from utils.static_files import UploadsStaticFiles
+
+setup_logging()
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="ATTA MONTACARGAS API",
@@ -18,14 +27,21 @@ app = FastAPI(
 
 @app.on_event("startup")
 async def startup_event():
-    """Create database tables on startup."""
+    """Check that the database schema matches the code (see migrate.py)."""
     try:
-        # Only create tables if database is available
-        Base.metadata.create_all(bind=engine)
-        print("✓ Database tables created/verified")
+        # Only reads alembic_version; migrations run in the release step
+        check_schema_revision()
     except OperationalError as e:
-        print(f"Warning: Could not create tables: {e}")
-        # Don't fail startup - tables might be created by init script
+        logger.warning("Could not check the database schema: %s", e)
+        # Don't fail startup - the database may still be starting
+    if settings.metrics_enabled and settings.app_env != "development" and not settings.metrics_token:
+        logger.warning("METRICS_TOKEN is not set: /metrics is disabled outside development")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release background resources."""
+    s3_manager.shutdown()
+    stop_logging()
 
 # CORS middleware
 app.add_middleware(
@@ -34,14 +50,27 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Read by the frontend and sent back for read-your-writes (database.py)
+    expose_headers=[READ_PRIMARY_HEADER],
 )
 
-# Mount static files for uploads
-os.makedirs("/uploads", exist_ok=True)
-app.mount("/uploads", StaticFiles(directory="/uploads"), name="uploads")
+# SQL statements and DB time per request (Server-Timing header)
+app.add_middleware(QueryStatsMiddleware)
+
+# With a read replica, a client's reads go to the primary right after it writes
+if read_engine is not None:
+    app.add_middleware(ReadYourWritesMiddleware)
+
+# Request count/latency per route, served at /metrics
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+# Mount static files for uploads (uuid-named, so cached as immutable)
+os.makedirs(settings.uploads_dir, exist_ok=True)
+app.mount(settings.uploads_url, UploadsStaticFiles(directory=settings.uploads_dir), name="uploads")
 
 # Import routers
-from routers import auth, users, clients, equipment, service_reports, inspection_catalog
+from routers import auth, users, clients, equipment, service_reports, inspection_catalog, jobs, admin, analytics
 
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
@@ -50,6 +79,9 @@ app.include_router(clients.router, prefix="/api/clients", tags=["Clients"])
 app.include_router(equipment.router, prefix="/api/equipment", tags=["Equipment"])
 app.include_router(service_reports.router, prefix="/api/service-reports", tags=["Service Reports"])
 app.include_router(inspection_catalog.router, prefix="/api/inspection", tags=["Inspection Catalog"])
+app.include_router(jobs.router, prefix="/api/jobs", tags=["Background Jobs"])
+app.include_router(admin.router, prefix="/api/admin", tags=["Admin"])
+app.include_router(analytics.router, prefix="/api/analytics", tags=["Analytics"])
 
 @app.get("/")
 async def root():
@@ -69,3 +101,15 @@ async def health_check(db: Session = Depends(get_db)):
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"Database connection failed: {str(e)}")
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus metrics."""
+    # Outside development the endpoint needs a token: it exposes routes, pool and queue state
+    if not settings.metrics_enabled or not (settings.metrics_token or settings.app_env == "development"):
+        raise HTTPException(status_code=404, detail="Not Found")
+    if settings.metrics_token and request.headers.get("authorization") != f"Bearer {settings.metrics_token}":
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    # The scrape queries the jobs table; keep it off the event loop
+    content, content_type = await run_in_threadpool(render_metrics)
+    return Response(content=content, headers={"Content-Type": content_type})
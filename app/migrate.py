@@ -0,0 +1,97 @@
+"""
+Database schema migrations (Alembic, see migrations/).
+
+Release step, run once per deploy before the API starts:
+
+    python migrate.py
+
+Databases created by Base.metadata.create_all before migrations existed
+have the tables but no alembic_version; they are stamped with the initial
+revision and then upgraded. The API only compares the stored revision with
+the head at startup (check_schema_revision) and never changes the schema.
+
+New migration after changing models.py:
+
+    alembic revision --autogenerate -m "add column x"
+"""
+import logging
+import os
+import sys
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+from database import engine
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini")
+# Schema that create_all produced before migrations were introduced
+BASELINE_REVISION = "0001"
+
+
+def alembic_config() -> Config:
+    config = Config(ALEMBIC_INI)
+    # Logging is already configured by the caller
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def head_revision() -> str:
+    """Latest revision in migrations/versions."""
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current_revision(connection: Connection) -> Optional[str]:
+    """Revision stored in the database, or None if it was never migrated."""
+    try:
+        return connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+    except Exception:
+        connection.rollback()
+        return None
+
+
+def upgrade_database():
+    """Bring the database to the head revision."""
+    config = alembic_config()
+    with engine.connect() as connection:
+        revision = current_revision(connection)
+        has_tables = inspect(connection).has_table("users")
+    if revision is None and has_tables:
+        logger.info("Existing schema without migrations; stamping revision %s", BASELINE_REVISION)
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
+    logger.info("Database at revision %s", head_revision())
+
+
+def check_schema_revision() -> bool:
+    """
+    Compare the database revision with the code's head; a single indexed
+    read, cheap enough for every worker start. Logs and returns False on a
+    mismatch.
+    """
+    expected = head_revision()
+    with engine.connect() as connection:
+        revision = current_revision(connection)
+    if revision != expected:
+        logger.error(
+            "Database schema is at revision %s but the code expects %s; run `python migrate.py`",
+            revision, expected
+        )
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    from core.logging_config import setup_logging
+
+    setup_logging()
+    try:
+        upgrade_database()
+    except Exception:
+        logger.exception("Migration failed")
+        sys.exit(1)
@@ -0,0 +1,166 @@
+"""initial schema
+
+Tables as created by Base.metadata.create_all before migrations were
+introduced; existing databases are stamped with this revision.
+
+Revision ID: 0001
+Revises: 
+Create Date: 2025-08-10 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('clients',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('address', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_clients_id'), 'clients', ['id'], unique=False)
+    op.create_table('equipment',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('type', sa.String(), nullable=False),
+    sa.Column('brand', sa.String(), nullable=False),
+    sa.Column('model', sa.String(), nullable=False),
+    sa.Column('serial_number', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('serial_number')
+    )
+    op.create_index(op.f('ix_equipment_id'), 'equipment', ['id'], unique=False)
+    op.create_table('inspection_categories',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('order_index', sa.Integer(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_index(op.f('ix_inspection_categories_id'), 'inspection_categories', ['id'], unique=False)
+    op.create_table('operation_point_templates',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('display_name', sa.String(), nullable=False),
+    sa.Column('field_type', sa.String(), nullable=False),
+    sa.Column('options', sa.JSON(), nullable=True),
+    sa.Column('validation_rules', sa.JSON(), nullable=True),
+    sa.Column('order_index', sa.Integer(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_operation_point_templates_id'), 'operation_point_templates', ['id'], unique=False)
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('hashed_password', sa.String(), nullable=False),
+    sa.Column('role', sa.String(), nullable=False),
+    sa.Column('position', sa.String(), nullable=True),
+    sa.Column('avatar', sa.String(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_table('contacts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('position', sa.String(), nullable=True),
+    sa.Column('phone', sa.String(), nullable=True),
+    sa.Column('email', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_contacts_id'), 'contacts', ['id'], unique=False)
+    op.create_table('inspection_item_templates',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('order_index', sa.Integer(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['category_id'], ['inspection_categories.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_inspection_item_templates_id'), 'inspection_item_templates', ['id'], unique=False)
+    op.create_table('service_reports',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.String(), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('requested_by_id', sa.Integer(), nullable=False),
+    sa.Column('equipment_id', sa.Integer(), nullable=False),
+    sa.Column('technician_id', sa.Integer(), nullable=False),
+    sa.Column('service_type', sa.String(), nullable=False),
+    sa.Column('billing_type', sa.String(), nullable=False),
+    sa.Column('battery_percentage', sa.Integer(), nullable=True),
+    sa.Column('horometer_readings', sa.JSON(), nullable=True),
+    sa.Column('equipment_specifications', sa.JSON(), nullable=True),
+    sa.Column('work_performed', sa.Text(), nullable=True),
+    sa.Column('detected_damages', sa.Text(), nullable=True),
+    sa.Column('possible_causes', sa.JSON(), nullable=True),
+    sa.Column('activities_performed', sa.Text(), nullable=True),
+    sa.Column('operation_points', sa.JSON(), nullable=True),
+    sa.Column('inspection_items', sa.JSON(), nullable=True),
+    sa.Column('applied_parts', sa.JSON(), nullable=True),
+    sa.Column('work_time', sa.JSON(), nullable=True),
+    sa.Column('technician_comments', sa.Text(), nullable=True),
+    sa.Column('client_observations', sa.Text(), nullable=True),
+    sa.Column('signatures', sa.JSON(), nullable=True),
+    sa.Column('client_signature', sa.String(), nullable=True),
+    sa.Column('technician_signature', sa.String(), nullable=True),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('pending_reason', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['equipment_id'], ['equipment.id'], ),
+    sa.ForeignKeyConstraint(['requested_by_id'], ['contacts.id'], ),
+    sa.ForeignKeyConstraint(['technician_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_service_reports_id'), 'service_reports', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_service_reports_id'), table_name='service_reports')
+    op.drop_table('service_reports')
+    op.drop_index(op.f('ix_inspection_item_templates_id'), table_name='inspection_item_templates')
+    op.drop_table('inspection_item_templates')
+    op.drop_index(op.f('ix_contacts_id'), table_name='contacts')
+    op.drop_table('contacts')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_operation_point_templates_id'), table_name='operation_point_templates')
+    op.drop_table('operation_point_templates')
+    op.drop_index(op.f('ix_inspection_categories_id'), table_name='inspection_categories')
+    op.drop_table('inspection_categories')
+    op.drop_index(op.f('ix_equipment_id'), table_name='equipment')
+    op.drop_table('equipment')
+    op.drop_index(op.f('ix_clients_id'), table_name='clients')
+    op.drop_table('clients')
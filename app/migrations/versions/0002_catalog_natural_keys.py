@@ -0,0 +1,33 @@
+"""catalog natural keys
+
+Unique (category_id, name) for inspection items and unique name for
+operation points, so the initial data can be upserted with ON CONFLICT.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 03:47:30
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Batch mode so SQLite (which can't add constraints in place) works too
+    with op.batch_alter_table('inspection_item_templates') as batch_op:
+        batch_op.create_unique_constraint('uq_inspection_item_templates_category_name', ['category_id', 'name'])
+    with op.batch_alter_table('operation_point_templates') as batch_op:
+        batch_op.create_unique_constraint('uq_operation_point_templates_name', ['name'])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('operation_point_templates') as batch_op:
+        batch_op.drop_constraint('uq_operation_point_templates_name', type_='unique')
+    with op.batch_alter_table('inspection_item_templates') as batch_op:
+        batch_op.drop_constraint('uq_inspection_item_templates_category_name', type_='unique')
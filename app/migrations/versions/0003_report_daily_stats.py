@@ -0,0 +1,70 @@
+"""report daily stats
+
+Daily rollup of service reports for analytics (see utils/report_stats.py),
+filled from the existing reports.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 04:10:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('report_daily_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('service_type', sa.String(), nullable=False),
+    sa.Column('billing_type', sa.String(), nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('technician_id', sa.Integer(), nullable=False),
+    sa.Column('report_count', sa.Integer(), nullable=False),
+    sa.Column('total_hours', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('day', 'status', 'service_type', 'billing_type', 'client_id', 'technician_id', name='uq_report_daily_stats_dimensions')
+    )
+    op.create_index(op.f('ix_report_daily_stats_day'), 'report_daily_stats', ['day'], unique=False)
+
+    # Backfill; table definitions here so later model changes don't affect this revision
+    service_reports = sa.table('service_reports',
+        sa.column('date', sa.String()),
+        sa.column('status', sa.String()),
+        sa.column('service_type', sa.String()),
+        sa.column('billing_type', sa.String()),
+        sa.column('client_id', sa.Integer()),
+        sa.column('technician_id', sa.Integer()),
+        sa.column('work_time', sa.JSON()),
+    )
+    report_daily_stats = sa.table('report_daily_stats',
+        sa.column('day'), sa.column('status'), sa.column('service_type'), sa.column('billing_type'),
+        sa.column('client_id'), sa.column('technician_id'), sa.column('report_count'), sa.column('total_hours'),
+    )
+    status = sa.func.coalesce(service_reports.c.status, 'pending')
+    dimensions = [
+        service_reports.c.date, status, service_reports.c.service_type, service_reports.c.billing_type,
+        service_reports.c.client_id, service_reports.c.technician_id,
+    ]
+    rollup = sa.select(
+        *dimensions,
+        sa.func.count(),
+        sa.func.coalesce(sa.func.sum(service_reports.c.work_time['total_horas'].as_float()), 0),
+    ).group_by(*dimensions)
+    op.execute(report_daily_stats.insert().from_select(
+        ['day', 'status', 'service_type', 'billing_type', 'client_id', 'technician_id', 'report_count', 'total_hours'],
+        rollup
+    ))
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_report_daily_stats_day'), table_name='report_daily_stats')
+    op.drop_table('report_daily_stats')
@@ -0,0 +1,104 @@
+"""merge fallback inspection catalog
+
+Databases seeded before the catalog was upserted could have the catalog from
+inspection_data.py instead of seed_data.py (category FUGAS_DE_ACEITE, other
+item names, operation points sistema/objeto_inspeccion). The catalog upsert
+would add the standard entries next to them, so the checklist showed both.
+
+When that catalog is found, FUGAS_DE_ACEITE is renamed to the standard name
+(or deactivated if the standard category already exists) and the entries
+that only the fallback catalog has are deactivated; create_initial_data then
+adds the missing standard ones. Nothing is deleted: reports store their
+checklist by name, not by id. Other databases are left as they are.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 05:20:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+FALLBACK_CATEGORY = 'FUGAS_DE_ACEITE'
+STANDARD_CATEGORY = 'FUGAS DE ACEITE'
+
+# Items of inspection_data.py that seed_data.py doesn't have, by category
+FALLBACK_ONLY_ITEMS = {
+    'ESTRUCTURAL': [
+        'SOLDADURA FISURADAS', 'TORNILLERÍA COMPLETA Y FIJA', 'PARTES SUELTAS / FRACTURADAS', 'DELANTERAS',
+        'TRASERAS',
+    ],
+    'RUEDAS': [
+        'DIFERENCIAL', 'CAJA POSTERIOR DIRECCIÓN', 'FRENOS', 'EXTINTOR', 'PALO DE EMERGENCIA', 'TORRETA',
+        'ALARMA DE TRASLADO', 'SILBATO / CLAXON', 'ESPEJO RETROVISIOR', 'CONECTORES BATERÍA Y GAS', 'INDICADORES',
+    ],
+    'SEGURIDAD': [
+        'EMERGENCIA EN PISO', 'MANGUERAS', 'CILINDROS DE ELEVACIÓN', 'CILINDROS DE INCLINACIÓN',
+        'DESPLAZAMIENTO LATERAL', 'ACCESORIOS',
+    ],
+    'FUNCIONALES': [
+        'DESPLAZAMIENTO LATERAL', 'DIRECCIÓN HIDRÁULICA', 'FRENOS', 'FONDO DE ESTACIONAMIENTO', 'FONDO DE 5 HORAS',
+    ],
+    STANDARD_CATEGORY: [
+        'TANQUE HIDRÁULICO', 'BOMBA', 'VÁLVULAS', 'MANGUERAS', 'CILINDROS ELEVACIÓN', 'CILINDROS INCLINACIÓN',
+        'CILINDROS REACH',
+    ],
+}
+FALLBACK_ONLY_OPERATION_POINTS = ['sistema', 'objeto_inspeccion']
+
+categories = sa.table('inspection_categories',
+    sa.column('id', sa.Integer()),
+    sa.column('name', sa.String()),
+    sa.column('is_active', sa.Boolean()),
+)
+items = sa.table('inspection_item_templates',
+    sa.column('category_id', sa.Integer()),
+    sa.column('name', sa.String()),
+    sa.column('is_active', sa.Boolean()),
+)
+operation_points = sa.table('operation_point_templates',
+    sa.column('name', sa.String()),
+    sa.column('is_active', sa.Boolean()),
+)
+
+
+def _category_id(connection, name):
+    return connection.execute(sa.select(categories.c.id).where(categories.c.name == name)).scalar()
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    fallback_id = _category_id(connection, FALLBACK_CATEGORY)
+    if fallback_id is None:
+        return
+
+    if _category_id(connection, STANDARD_CATEGORY) is None:
+        op.execute(categories.update().where(categories.c.id == fallback_id).values(name=STANDARD_CATEGORY))
+    else:
+        op.execute(categories.update().where(categories.c.id == fallback_id).values(is_active=False))
+        op.execute(items.update().where(items.c.category_id == fallback_id).values(is_active=False))
+
+    for category, names in FALLBACK_ONLY_ITEMS.items():
+        category_ids = sa.select(categories.c.id).where(categories.c.name == category).scalar_subquery()
+        op.execute(
+            items.update()
+            .where(items.c.category_id == category_ids, items.c.name.in_(names))
+            .values(is_active=False)
+        )
+    op.execute(
+        operation_points.update()
+        .where(operation_points.c.name.in_(FALLBACK_ONLY_OPERATION_POINTS))
+        .values(is_active=False)
+    )
+
+
+def downgrade() -> None:
+    # Data cleanup only: the catalog is left as it is
+    pass
@@ -0,0 +1,28 @@
+"""user last write at
+
+Time of each user's last successful write request, so reads right after it
+go to the primary instead of the read replica (see database.py).
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 05:40:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('last_write_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('last_write_at')
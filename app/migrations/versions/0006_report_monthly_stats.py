@@ -0,0 +1,99 @@
+"""report monthly stats
+
+Replaces report_daily_stats with report_monthly_stats: one row per month and
+value of each dimension instead of per day and combination of dimensions,
+which had about one row per report (see utils/report_stats.py). Also indexes
+service_reports.technician_id, which operators' analytics and report lists
+filter on.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 06:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+# Table definitions here so later model changes don't affect this revision
+service_reports = sa.table('service_reports',
+    sa.column('date', sa.String()),
+    sa.column('status', sa.String()),
+    sa.column('service_type', sa.String()),
+    sa.column('billing_type', sa.String()),
+    sa.column('client_id', sa.Integer()),
+    sa.column('technician_id', sa.Integer()),
+    sa.column('work_time', sa.JSON()),
+)
+DIMENSIONS = {
+    'status': sa.func.coalesce(service_reports.c.status, 'pending'),
+    'service_type': service_reports.c.service_type,
+    'billing_type': service_reports.c.billing_type,
+    'client': service_reports.c.client_id,
+    'technician': service_reports.c.technician_id,
+}
+total_hours = sa.func.coalesce(sa.func.sum(service_reports.c.work_time['total_horas'].as_float()), 0)
+
+
+def upgrade() -> None:
+    op.drop_index('ix_report_daily_stats_day', table_name='report_daily_stats')
+    op.drop_table('report_daily_stats')
+    op.create_table('report_monthly_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('month', sa.String(), nullable=False),
+    sa.Column('dimension', sa.String(), nullable=False),
+    sa.Column('value', sa.String(), nullable=False),
+    sa.Column('report_count', sa.Integer(), nullable=False),
+    sa.Column('total_hours', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('month', 'dimension', 'value', name='uq_report_monthly_stats_month_dimension_value')
+    )
+    op.create_index(op.f('ix_service_reports_technician_id'), 'service_reports', ['technician_id'], unique=False)
+
+    report_monthly_stats = sa.table('report_monthly_stats',
+        sa.column('month'), sa.column('dimension'), sa.column('value'), sa.column('report_count'),
+        sa.column('total_hours'),
+    )
+    month = sa.func.substr(service_reports.c.date, 1, 7)
+    for dimension, value in DIMENSIONS.items():
+        rollup = sa.select(
+            month, sa.literal(dimension), sa.cast(value, sa.String()), sa.func.count(), total_hours
+        ).group_by(month, value)
+        op.execute(report_monthly_stats.insert().from_select(
+            ['month', 'dimension', 'value', 'report_count', 'total_hours'], rollup
+        ))
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_service_reports_technician_id'), table_name='service_reports')
+    op.drop_table('report_monthly_stats')
+    op.create_table('report_daily_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('service_type', sa.String(), nullable=False),
+    sa.Column('billing_type', sa.String(), nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('technician_id', sa.Integer(), nullable=False),
+    sa.Column('report_count', sa.Integer(), nullable=False),
+    sa.Column('total_hours', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('day', 'status', 'service_type', 'billing_type', 'client_id', 'technician_id', name='uq_report_daily_stats_dimensions')
+    )
+    op.create_index('ix_report_daily_stats_day', 'report_daily_stats', ['day'], unique=False)
+
+    report_daily_stats = sa.table('report_daily_stats',
+        sa.column('day'), sa.column('status'), sa.column('service_type'), sa.column('billing_type'),
+        sa.column('client_id'), sa.column('technician_id'), sa.column('report_count'), sa.column('total_hours'),
+    )
+    dimensions = [service_reports.c.date, *DIMENSIONS.values()]
+    op.execute(report_daily_stats.insert().from_select(
+        ['day', 'status', 'service_type', 'billing_type', 'client_id', 'technician_id', 'report_count', 'total_hours'],
+        sa.select(*dimensions, sa.func.count(), total_hours).group_by(*dimensions)
+    ))
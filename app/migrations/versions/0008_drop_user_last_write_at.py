@@ -0,0 +1,28 @@
+"""drop user last write at
+
+Read-your-writes no longer stores each user's last write in the database
+(see database.py), so users.last_write_at from 0005 is dropped.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 09:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('last_write_at')
+
+
+def downgrade() -> None:
+    op.add_column('users', sa.Column('last_write_at', sa.DateTime(timezone=True), nullable=True))
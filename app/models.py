@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Numeric, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Numeric, Float, ForeignKey, JSON, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from database import Base
 
 class User(Base):
@@ -74,7 +74,7 @@ class ServiceReport(Base):
     client_id = Column(Integer, ForeignKey("clients.id"), nullable=False)
     requested_by_id = Column(Integer, ForeignKey("contacts.id"), nullable=False)
     equipment_id = Column(Integer, ForeignKey("equipment.id"), nullable=False)
-    technician_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    technician_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     
     # Service Information
     service_type = Column(String, nullable=False)  # Preventivo, Correctivo, etc.
@@ -161,6 +161,23 @@ class ServiceReport(Base):
     requested_by = relationship("Contact", back_populates="service_reports")
     equipment = relationship("Equipment", back_populates="service_reports")
 
+# Analytics
+class ReportMonthlyStats(Base):
+    """Service reports per month and dimension value, kept up to date by utils/report_stats.py."""
+    __tablename__ = "report_monthly_stats"
+    __table_args__ = (
+        # One row per month and value; report writes upsert into it
+        UniqueConstraint("month", "dimension", "value", name="uq_report_monthly_stats_month_dimension_value"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    month = Column(String, nullable=False)  # ServiceReport.date[:7], YYYY-MM
+    dimension = Column(String, nullable=False)  # status, service_type, billing_type, client or technician
+    # Derived data: ids are stored as text with no foreign keys, so it never blocks deleting a client or user
+    value = Column(String, nullable=False)
+    report_count = Column(Integer, nullable=False, default=0)
+    total_hours = Column(Float, nullable=False, default=0)  # sum of work_time.total_horas
+
 # Inspection Catalog Models
 class InspectionCategory(Base):
     __tablename__ = "inspection_categories"
@@ -177,6 +194,10 @@ class InspectionCategory(Base):
 
 class InspectionItemTemplate(Base):
     __tablename__ = "inspection_item_templates"
+    __table_args__ = (
+        # Natural key used by the initial data upserts
+        UniqueConstraint("category_id", "name", name="uq_inspection_item_templates_category_name"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     category_id = Column(Integer, ForeignKey("inspection_categories.id"), nullable=False)
@@ -192,6 +213,9 @@ class InspectionItemTemplate(Base):
 
 class OperationPointTemplate(Base):
     __tablename__ = "operation_point_templates"
+    __table_args__ = (
+        UniqueConstraint("name", name="uq_operation_point_templates_name"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)  # velocidad_avance, funciones_auxiliares_operando, etc.
@@ -203,3 +227,33 @@ class OperationPointTemplate(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+# Background Jobs
+class Job(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Used by workers to claim the next runnable job
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+        # At most one queued job per dedupe key (see enqueue_job)
+        Index(
+            "ux_jobs_dedupe_key_queued", "dedupe_key", unique=True,
+            postgresql_where=text("status = 'queued'"),
+            sqlite_where=text("status = 'queued'")
+        ),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_type = Column(String, nullable=False)  # report_pdf_export, etc.
+    status = Column(String, nullable=False, default="queued")  # queued, running, succeeded, failed
+    payload = Column(JSON)  # Handler arguments
+    result = Column(JSON)  # {"artifact": {"storage": "s3", "key": "..."}, ...}
+    error = Column(Text)
+    dedupe_key = Column(String, index=True)  # Avoids queuing the same work twice
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=3)
+    created_by = Column(Integer, ForeignKey("users.id"))
+    run_after = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -0,0 +1,54 @@
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+
+from core.config import settings
+from models import User
+from routers.auth import get_current_active_user
+from utils.profiler import ProfilerBusy, profile_filename, sample_stacks
+
+router = APIRouter()
+
+@router.post("/profile", response_class=PlainTextResponse)
+async def profile_process(
+    seconds: float = Query(30, gt=0, le=300),
+    include_idle: bool = False,
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Sample the process handling this request for the given seconds and
+    return its collapsed stacks (flame graph input). Only the worker process
+    that receives the request is profiled.
+    """
+    if not settings.profiler_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profiler is disabled"
+        )
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can profile the API"
+        )
+    
+    started = time.time()
+    try:
+        # Samples from a pool thread; the event loop keeps serving (and is profiled)
+        stacks, samples = await run_in_threadpool(
+            sample_stacks, seconds, settings.profiler_interval, include_idle
+        )
+    except ProfilerBusy as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    
+    return PlainTextResponse(
+        stacks,
+        headers={
+            "Content-Disposition": f"attachment; filename={profile_filename(started)}",
+            "X-Profile-Samples": str(samples)
+        }
+    )
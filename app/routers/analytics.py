@@ -0,0 +1,118 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from database import get_read_db
+from models import User, Client, ReportMonthlyStats, ServiceReport
+from routers.auth import get_current_active_user
+from utils.report_stats import DEFAULT_STATUS, DIMENSIONS  # also keeps report_monthly_stats up to date on report writes
+
+router = APIRouter()
+
+GROUPS = ["month", *DIMENSIONS]
+# Response field for the groups that are ids
+GROUP_FIELDS = {"client": "client_id", "technician": "technician_id"}
+
+def _parse_month(value: Optional[str], name: str) -> Optional[str]:
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m").strftime("%Y-%m")
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid '{name}' month. Use YYYY-MM"
+        )
+
+def _rollup_query(db: Session, dimension: Optional[str], groups: list):
+    """Counts from report_monthly_stats. Every report has one status, so without a dimension the status rows are summed."""
+    columns = {"month": ReportMonthlyStats.month}
+    if dimension:
+        columns[dimension] = ReportMonthlyStats.value
+    query = db.query(
+        *(columns[group].label(GROUP_FIELDS.get(group, group)) for group in groups),
+        func.sum(ReportMonthlyStats.report_count).label("report_count"),
+        func.sum(ReportMonthlyStats.total_hours).label("total_hours")
+    ).filter(ReportMonthlyStats.dimension == (dimension or "status"))
+    return query, ReportMonthlyStats.month, [columns[group] for group in groups]
+
+def _reports_query(db: Session, dimension: Optional[str], groups: list, technician_id: int):
+    """Counts straight from one technician's service reports."""
+    columns = {"month": func.substr(ServiceReport.date, 1, 7)}
+    if dimension:
+        columns[dimension] = getattr(ServiceReport, DIMENSIONS[dimension])
+        if dimension == "status":
+            columns[dimension] = func.coalesce(columns[dimension], DEFAULT_STATUS)
+    query = db.query(
+        *(columns[group].label(GROUP_FIELDS.get(group, group)) for group in groups),
+        func.count(ServiceReport.id).label("report_count"),
+        func.coalesce(func.sum(ServiceReport.work_time["total_horas"].as_float()), 0).label("total_hours")
+    ).filter(ServiceReport.technician_id == technician_id)
+    return query, columns["month"], [columns[group] for group in groups]
+
+@router.get("/reports")
+async def get_report_analytics(
+    group_by: str = Query("month", description=f"month and/or one of: {', '.join(DIMENSIONS)}"),
+    month_from: Optional[str] = Query(None, alias="from", description="First month, YYYY-MM"),
+    month_to: Optional[str] = Query(None, alias="to", description="Last month, YYYY-MM"),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Report counts and summed work hours per month and/or one dimension, read
+    from the monthly rollup (report_monthly_stats) instead of the reports.
+    Operators only see their own work, counted from their reports.
+    """
+    groups = [group.strip() for group in group_by.split(",") if group.strip()]
+    dimensions = [group for group in groups if group != "month"]
+    invalid = [group for group in groups if group not in GROUPS]
+    if not groups or invalid or len(set(groups)) != len(groups) or len(dimensions) > 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid group_by. Use month and/or one of: {', '.join(DIMENSIONS)}"
+        )
+    dimension = dimensions[0] if dimensions else None
+    first_month = _parse_month(month_from, "from")
+    last_month = _parse_month(month_to, "to")
+
+    if current_user.role == "operador":
+        query, month, columns = _reports_query(db, dimension, groups, current_user.id)
+    else:
+        query, month, columns = _rollup_query(db, dimension, groups)
+    if first_month:
+        query = query.filter(month >= first_month)
+    if last_month:
+        query = query.filter(month <= last_month)
+
+    rows = query.group_by(*columns).order_by(*columns).all()
+
+    results = [
+        {**row._asdict(), "total_hours": round(row.total_hours or 0, 2)}
+        for row in rows
+        if row.report_count > 0
+    ]
+
+    # The rollup stores ids as text, so they are converted and sorted here; names in one query
+    if dimension in GROUP_FIELDS:
+        field = GROUP_FIELDS[dimension]
+        model = Client if dimension == "client" else User
+        for row in results:
+            row[field] = int(row[field])
+        results.sort(key=lambda row: tuple(row[GROUP_FIELDS.get(group, group)] for group in groups))
+        names = dict(db.query(model.id, model.name).filter(model.id.in_({row[field] for row in results})))
+        for row in results:
+            row[f"{dimension}_name"] = names.get(row[field])
+
+    return {
+        "group_by": groups,
+        "from": first_month,
+        "to": last_month,
+        "totals": {
+            "report_count": sum(row["report_count"] for row in results),
+            "total_hours": round(sum(row["total_hours"] for row in results), 2),
+        },
+        "rows": results,
+    }
@@ -2,10 +2,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
 
-from database import get_db
-from models import User, Client, Contact
+from database import get_db, get_read_db
+from models import User, Client, Contact, ServiceReport
 from schemas import ClientCreate, ClientUpdate, ClientResponse, ContactCreate, ContactResponse
 from routers.auth import get_current_active_user
+from utils.report_pdf import reports_pdf_response
 
 router = APIRouter()
 
@@ -13,7 +14,7 @@ router = APIRouter()
 async def get_clients(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get all clients."""
@@ -23,7 +24,7 @@ async def get_clients(
 @router.get("/{client_id}", response_model=ClientResponse)
 async def get_client(
     client_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get client by ID."""
@@ -35,6 +36,23 @@ async def get_client(
         )
     return client
 
+@router.get("/{client_id}/reports.pdf")
+async def get_client_reports_pdf(
+    client_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Download every service report of a client as a single PDF."""
+    client = db.query(Client).filter(Client.id == client_id).first()
+    if not client:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Client not found"
+        )
+    
+    query = db.query(ServiceReport).filter(ServiceReport.client_id == client_id)
+    return await reports_pdf_response(query, current_user, f"reportes_cliente_{client_id}.pdf")
+
 @router.post("/", response_model=ClientResponse)
 async def create_client(
     client_data: ClientCreate,
@@ -106,7 +124,7 @@ async def delete_client(
 @router.get("/{client_id}/contacts", response_model=List[ContactResponse])
 async def get_client_contacts(
     client_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get all contacts for a client."""
@@ -1,11 +1,16 @@
+from datetime import date, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from database import get_db
-from models import User, Equipment
-from schemas import EquipmentCreate, EquipmentUpdate, EquipmentResponse
+from database import get_db, get_read_db
+from models import User, Equipment, ServiceReport
+from schemas import (
+    EquipmentCreate, EquipmentUpdate, EquipmentResponse,
+    EquipmentTelemetryResponse, EquipmentTelemetryDetailResponse
+)
 from routers.auth import get_current_active_user
+from utils.report_pdf import reports_pdf_response
 
 router = APIRouter()
 
@@ -14,7 +19,7 @@ async def get_equipment(
     skip: int = 0,
     limit: int = 100,
     equipment_type: str = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get all equipment with optional type filter."""
@@ -26,10 +31,59 @@ async def get_equipment(
     equipment = query.offset(skip).limit(limit).all()
     return equipment
 
+def _telemetry_response(equipment: Equipment, telemetry: dict) -> dict:
+    return {
+        "equipment_id": equipment.id,
+        "type": equipment.type,
+        "brand": equipment.brand,
+        "model": equipment.model,
+        "serial_number": equipment.serial_number,
+        "reading_count": 0,
+        **telemetry.get(equipment.id, {})
+    }
+
+# Declared before /{equipment_id} so "telemetry" isn't parsed as an id
+@router.get("/telemetry", response_model=List[EquipmentTelemetryResponse])
+async def get_fleet_telemetry(
+    equipment_type: str = None,
+    due_within_days: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Hour meter usage and projected preventive service for the fleet, soonest
+    service first. due_within_days keeps the equipment due by then (overdue included).
+    """
+    # NumPy is loaded on the first telemetry request, not at API startup
+    from utils.equipment_telemetry import compute_telemetry, load_readings
+
+    query = db.query(Equipment)
+    if equipment_type:
+        query = query.filter(Equipment.type == equipment_type)
+    equipment = query.all()
+
+    # Readings of the whole fleet in one query; a subset when filtered by type
+    equipment_ids = [unit.id for unit in equipment] if equipment_type else None
+    telemetry = compute_telemetry(load_readings(db, equipment_ids), date.today())
+    results = [_telemetry_response(unit, telemetry) for unit in equipment]
+
+    if due_within_days is not None:
+        due_by = date.today() + timedelta(days=due_within_days)
+        results = [
+            result for result in results
+            if result.get("projected_next_service_date") and result["projected_next_service_date"] <= due_by
+        ]
+    results.sort(key=lambda result: (
+        result.get("projected_next_service_date") or date.max, result["equipment_id"]
+    ))
+    return results[skip:skip + limit]
+
 @router.get("/{equipment_id}", response_model=EquipmentResponse)
 async def get_equipment_by_id(
     equipment_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get equipment by ID."""
@@ -41,6 +95,43 @@ async def get_equipment_by_id(
         )
     return equipment
 
+@router.get("/{equipment_id}/history.pdf")
+async def get_equipment_history_pdf(
+    equipment_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Download the service history of an equipment as a single PDF."""
+    equipment = db.query(Equipment).filter(Equipment.id == equipment_id).first()
+    if not equipment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Equipment not found"
+        )
+    
+    query = db.query(ServiceReport).filter(ServiceReport.equipment_id == equipment_id)
+    return await reports_pdf_response(query, current_user, f"historial_equipo_{equipment_id}.pdf")
+
+@router.get("/{equipment_id}/telemetry", response_model=EquipmentTelemetryDetailResponse)
+async def get_equipment_telemetry(
+    equipment_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Hour meter and battery readings of an equipment with its usage and next preventive service."""
+    equipment = db.query(Equipment).filter(Equipment.id == equipment_id).first()
+    if not equipment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Equipment not found"
+        )
+    
+    from utils.equipment_telemetry import compute_telemetry, load_readings, reading_series
+    
+    readings = load_readings(db, [equipment_id])
+    telemetry = compute_telemetry(readings, date.today())
+    return {**_telemetry_response(equipment, telemetry), "readings": reading_series(readings)}
+
 @router.post("/", response_model=EquipmentResponse)
 async def create_equipment(
     equipment_data: EquipmentCreate,
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
 
-from database import get_db
+from database import get_db, get_read_db
 from models import InspectionCategory, InspectionItemTemplate, OperationPointTemplate
 from schemas import (
     InspectionCategoryCreate, InspectionCategoryResponse,
@@ -18,7 +18,7 @@ router = APIRouter()
 
 @router.get("/categories", response_model=List[InspectionCategoryResponse])
 async def get_inspection_categories(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get all inspection categories"""
@@ -61,7 +61,7 @@ async def create_inspection_category(
 @router.get("/categories/{category_id}/items", response_model=List[InspectionItemTemplateResponse])
 async def get_inspection_items_by_category(
     category_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get all inspection items for a specific category"""
@@ -73,7 +73,7 @@ async def get_inspection_items_by_category(
 
 @router.get("/items", response_model=List[InspectionItemTemplateResponse])
 async def get_all_inspection_items(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get all inspection items grouped by category"""
@@ -118,7 +118,7 @@ async def create_inspection_item(
 
 @router.get("/operation-points", response_model=List[OperationPointTemplateResponse])
 async def get_operation_point_templates(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get all operation point templates"""
@@ -150,7 +150,7 @@ async def create_operation_point_template(
 
 @router.get("/templates/service-report")
 async def get_service_report_templates(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get combined templates for creating service reports"""
@@ -160,13 +160,18 @@ async def get_service_report_templates(
         InspectionCategory.is_active == True
     ).order_by(InspectionCategory.order_index).all()
     
+    # All active items in one query, grouped by category
+    items_by_category = {}
+    items = db.query(InspectionItemTemplate).filter(
+        InspectionItemTemplate.category_id.in_([category.id for category in categories]),
+        InspectionItemTemplate.is_active == True
+    ).order_by(InspectionItemTemplate.order_index).all()
+    for item in items:
+        items_by_category.setdefault(item.category_id, []).append(item)
+    
     inspection_template = {}
     for category in categories:
-        items = db.query(InspectionItemTemplate).filter(
-            InspectionItemTemplate.category_id == category.id,
-            InspectionItemTemplate.is_active == True
-        ).order_by(InspectionItemTemplate.order_index).all()
-        
+        items = items_by_category.get(category.id, [])
         category_key = category.name.lower().replace(" ", "_")
         inspection_template[category_key] = [
             {
@@ -0,0 +1,151 @@
+import mimetypes
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from database import get_db
+from models import User, Job, ServiceReport
+from schemas import JobResponse, ReportPdfExportRequest
+from routers.auth import get_current_active_user
+from utils.job_queue import enqueue_job
+from utils.report_stats import REPORT_STATS_REBUILD_JOB
+from utils.s3_manager import s3_manager
+from utils.static_files import RangeFileResponse
+
+router = APIRouter()
+
+def _job_response(job: Job) -> JobResponse:
+    """Build the job response, adding a download URL for finished artifacts."""
+    response = JobResponse.model_validate(job)
+    artifact = (job.result or {}).get("artifact")
+    if job.status == "succeeded" and artifact:
+        # Local artifacts are not public; they are sent by get_job_artifact
+        response.artifact_url = s3_manager.artifact_url(artifact) or f"/api/jobs/{job.id}/artifact"
+    return response
+
+def _get_visible_job(db: Session, job_id: int, current_user: User) -> Job:
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    # Users can only see their own jobs; admin and jefe can see all
+    if current_user.role not in ["admin", "jefe"] and job.created_by != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+    return job
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Get background job status and result."""
+    return _job_response(_get_visible_job(db, job_id, current_user))
+
+@router.get("/{job_id}/artifact")
+async def get_job_artifact(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Download the artifact of a finished job."""
+    job = _get_visible_job(db, job_id, current_user)
+    artifact = (job.result or {}).get("artifact")
+    if job.status != "succeeded" or not artifact:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job has no artifact"
+        )
+    
+    # Keys are jobs/<id>/<uuid>_<filename>
+    filename = os.path.basename(artifact["key"]).split("_", 1)[-1]
+    media_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    headers = {"Cache-Control": "private, no-store"}
+    if artifact.get("storage") == "local":
+        try:
+            stat_result = os.stat(artifact["path"])
+        except OSError:
+            stat_result = None
+        if stat_result is not None:
+            return RangeFileResponse(
+                artifact["path"],
+                stat_result=stat_result,
+                media_type=media_type,
+                filename=filename,
+                headers=headers
+            )
+    else:
+        opened = await s3_manager.run_in_executor(s3_manager.get_artifact_body, artifact)
+        if opened:
+            body, content_length = opened
+            return StreamingResponse(
+                body.iter_chunks(64 * 1024),
+                media_type=media_type,
+                headers={
+                    "Content-Disposition": f"attachment; filename={filename}",
+                    "Content-Length": str(content_length),
+                    **headers
+                }
+            )
+    
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Artifact no longer available"
+    )
+
+@router.post("/report-pdf-export", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_report_pdf_export(
+    export_data: ReportPdfExportRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Queue a ZIP export of service report PDFs."""
+    report_ids = sorted(set(export_data.report_ids))
+    
+    # Operators can only export reports they created
+    if current_user.role == "operador":
+        own_count = db.query(ServiceReport).filter(
+            ServiceReport.id.in_(report_ids),
+            ServiceReport.created_by == current_user.id
+        ).count()
+        if own_count != len(report_ids):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not enough permissions"
+            )
+    
+    job = enqueue_job(
+        db,
+        "report_pdf_export",
+        payload={"report_ids": report_ids},
+        created_by=current_user.id
+    )
+    return _job_response(job)
+
+@router.post("/report-stats-rebuild", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_report_stats_rebuild(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Queue a rebuild of the analytics rollup from the service reports (admin only)."""
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+    
+    job = enqueue_job(
+        db,
+        REPORT_STATS_REBUILD_JOB,
+        created_by=current_user.id,
+        dedupe_key=REPORT_STATS_REBUILD_JOB
+    )
+    return _job_response(job)
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import desc
 from typing import List, Optional
 import os
 import uuid
 
-from database import get_db
+from database import get_db, get_read_db
 from models import User, ServiceReport, Client, Contact, Equipment
 from schemas import (
     ServiceReportCreate, ServiceReportUpdate, ServiceReportResponse,
@@ -13,8 +14,17 @@ from schemas import (
 )
 from routers.auth import get_current_active_user
 from core.config import settings
-from utils.pdf_generator import generate_service_report_pdf
-from fastapi.responses import Response
+from utils.report_pdf import (
+    build_report_pdf_data, render_report_pdf_data, report_pdf_filename, enqueue_report_pdf,
+    find_stored_report_pdf
+)
+from utils.s3_manager import s3_manager
+from utils.static_files import RangeFileResponse
+import utils.report_stats  # noqa: F401 - keeps report_monthly_stats up to date on report writes
+from fastapi.responses import Response, StreamingResponse
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -25,21 +35,16 @@ async def get_service_reports(
     status_filter: Optional[str] = None,
     client_id: Optional[int] = None,
     technician_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get service reports with filters."""
-    print(f"🔍 SERVICE REPORTS GET: User {current_user.name} (ID: {current_user.id}, Role: {current_user.role}) requesting reports")
-    
     query = db.query(ServiceReport)
     
     # Role-based filtering
     if current_user.role == "operador":
         # Operators can only see reports they created
-        print(f"🔒 FILTERING for operador: Only showing reports where created_by = {current_user.id}")
         query = query.filter(ServiceReport.created_by == current_user.id)
-    else:
-        print(f"🔓 NO FILTERING: User role '{current_user.role}' can see all reports")
     
     # Apply filters
     if status_filter:
@@ -51,20 +56,23 @@ async def get_service_reports(
     if technician_id and current_user.role in ["admin", "jefe"]:
         query = query.filter(ServiceReport.technician_id == technician_id)
     
-    # Order by id descending (newest first)
-    reports = query.order_by(desc(ServiceReport.id)).offset(skip).limit(limit).all()
+    # Order by id descending (newest first); the response includes every relation
+    reports = query.options(
+        joinedload(ServiceReport.client).selectinload(Client.contacts),
+        joinedload(ServiceReport.requested_by),
+        joinedload(ServiceReport.equipment),
+        joinedload(ServiceReport.technician),
+        joinedload(ServiceReport.created_by_user)
+    ).order_by(desc(ServiceReport.id)).offset(skip).limit(limit).all()
     
-    print(f"📊 QUERY RESULT: Found {len(reports)} reports for user {current_user.name}")
-    if reports:
-        for report in reports:
-            print(f"  - Report #{report.id}: technician_id={report.technician_id}, created_by={report.created_by}")
+    logger.debug("Listed %d service reports for user %s (role %s)", len(reports), current_user.id, current_user.role)
     
     return reports
 
 @router.get("/{report_id}", response_model=ServiceReportResponse)
 async def get_service_report(
     report_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get service report by ID."""
@@ -91,9 +99,11 @@ async def create_service_report(
     current_user: User = Depends(get_current_active_user)
 ):
     """Create new service report."""
-    print(f"🔍 CREATE REPORT DEBUG - Status received: {getattr(report_data, 'status', 'NOT_SET')}")
-    print(f"🔍 CREATE REPORT DEBUG - Pending reason: {getattr(report_data, 'pending_reason', 'NOT_SET')}")
-    print(f"🔍 CREATE REPORT DEBUG - User: {current_user.name} (Role: {current_user.role})")
+    logger.debug(
+        "Creating service report: user %s (role %s), status %s, pending reason %s",
+        current_user.id, current_user.role,
+        getattr(report_data, 'status', None), getattr(report_data, 'pending_reason', None)
+    )
     
     # Validate client exists
     client = db.query(Client).filter(Client.id == report_data.client_id).first()
@@ -197,6 +207,9 @@ async def create_service_report(
     db.commit()
     db.refresh(db_report)
     
+    if db_report.status == "completed":
+        enqueue_report_pdf(db, db_report, created_by=current_user.id)
+    
     return db_report
 
 @router.put("/{report_id}", response_model=ServiceReportResponse)
@@ -207,10 +220,7 @@ async def update_service_report(
     current_user: User = Depends(get_current_active_user)
 ):
     """Update service report."""
-    # Debug logging
-    print(f"🔍 DEBUG: Updating report {report_id}")
-    print(f"🔍 DEBUG: Request data type: {type(report_data)}")
-    print(f"🔍 DEBUG: Request data: {report_data}")
+    logger.debug("Updating service report %s, fields: %s", report_id, report_data.model_fields_set)
     
     report = db.query(ServiceReport).filter(ServiceReport.id == report_id).first()
     if not report:
@@ -293,6 +303,10 @@ async def update_service_report(
     for field, value in update_data.items():
         setattr(report, field, value)
     
+    # Completed reports get their PDF pre-rendered (again, if edited afterwards)
+    if report.status == "completed":
+        enqueue_report_pdf(db, report, created_by=current_user.id, commit=False)
+    
     db.commit()
     db.refresh(report)
     
@@ -369,10 +383,11 @@ async def upload_signature(
     # Create filename
     file_extension = file.filename.split('.')[-1] if '.' in file.filename else 'png'
     filename = f"{signature_type}_signature_{report_id}_{uuid.uuid4().hex}.{file_extension}"
-    file_path = f"/uploads/signatures/{filename}"
+    signatures_dir = os.path.join(settings.uploads_dir, "signatures")
+    file_path = os.path.join(signatures_dir, filename)
     
     # Create directory if not exists
-    os.makedirs("/uploads/signatures", exist_ok=True)
+    os.makedirs(signatures_dir, exist_ok=True)
     
     # Save file
     with open(file_path, "wb") as buffer:
@@ -380,10 +395,15 @@ async def upload_signature(
         buffer.write(content)
     
     # Update report
+    signature_url = f"{settings.uploads_url}/signatures/{filename}"
     if signature_type == "client":
-        report.client_signature = f"/uploads/signatures/{filename}"
+        report.client_signature = signature_url
     else:
-        report.technician_signature = f"/uploads/signatures/{filename}"
+        report.technician_signature = signature_url
+    
+    # The stored PDF must be re-rendered to include the new signature
+    if report.status == "completed":
+        enqueue_report_pdf(db, report, created_by=current_user.id, commit=False)
     
     db.commit()
     
@@ -391,7 +411,7 @@ async def upload_signature(
 
 @router.get("/statistics/dashboard")
 async def get_dashboard_statistics(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get dashboard statistics."""
@@ -440,8 +460,9 @@ async def generate_report_pdf(
     Generate and download PDF for service report.
     
     Este endpoint genera un PDF del reporte de servicio usando ReportLab.
-    El PDF se genera al momento sin guardarse en disco y se envía como respuesta
-    para descarga directa.
+    Los reportes completados se pre-renderizan en segundo plano; si el PDF
+    almacenado está vigente se envía directamente desde el almacenamiento.
+    En otro caso el PDF se genera al momento sin guardarse en disco.
     
     Args:
         report_id: ID del reporte de servicio
@@ -456,8 +477,14 @@ async def generate_report_pdf(
         403: Si el usuario no tiene permisos para ver el reporte
         500: Si hay error generando el PDF
     """
-    # Buscar el reporte en la base de datos
-    report = db.query(ServiceReport).filter(ServiceReport.id == report_id).first()
+    # Buscar el reporte en la base de datos, con los registros que muestra el PDF
+    report = db.query(ServiceReport).options(
+        joinedload(ServiceReport.client),
+        joinedload(ServiceReport.requested_by),
+        joinedload(ServiceReport.equipment),
+        joinedload(ServiceReport.technician),
+        joinedload(ServiceReport.created_by_user)
+    ).filter(ServiceReport.id == report_id).first()
     if not report:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -472,84 +499,81 @@ async def generate_report_pdf(
             detail="Not enough permissions"
         )
     
+    filename = report_pdf_filename(report)
+    no_cache_headers = {
+        "Cache-Control": "no-cache, no-store, must-revalidate",
+        "Pragma": "no-cache",
+        "Expires": "0"
+    }
+    
+    # PDF pre-renderizado al completar el reporte
+    stored_pdf = find_stored_report_pdf(db, report)
+    if stored_pdf:
+        response = await _stored_pdf_response(stored_pdf, filename, no_cache_headers)
+        if response:
+            return response
+    
     try:
-        # Preparar datos para la generación del PDF
-        # Se estructuran todos los datos del reporte para el generador de PDF
-        pdf_data = {
-            "report_number": report.id,
-            "date": report.date if report.date else "N/A",
-            "client": {
-                "name": report.client.name if report.client else "N/A",
-                "address": report.client.address if report.client else "N/A"
-            },
-            "requested_by": {
-                "name": report.requested_by.name if report.requested_by else "N/A",
-                "position": report.requested_by.position if report.requested_by else "N/A"
-            },
-            "equipment": {
-                "type": report.equipment.type if report.equipment else "N/A",
-                "brand": report.equipment.brand if report.equipment else "N/A",
-                "model": report.equipment.model if report.equipment else "N/A",
-                "serial_number": report.equipment.serial_number if report.equipment else "N/A"
-            },
-            "technician": {
-                "name": report.technician.name if report.technician else "N/A",
-                "position": report.technician.position if report.technician else "N/A"
-            },
-            "created_by": {
-                "name": report.created_by_user.name if report.created_by_user else "N/A",
-                "position": report.created_by_user.position if report.created_by_user else "N/A"
-            },
-            "service_type": report.service_type or "N/A",
-            "billing_type": report.billing_type or "N/A",
-            "battery_percentage": report.battery_percentage,
-            "horometer_readings": report.horometer_readings or {},
-            "work_performed": report.work_performed or "N/A",
-            "detected_damages": report.detected_damages or "N/A",
-            "possible_causes": report.possible_causes or "N/A",
-            "activities_performed": report.activities_performed or "N/A",
-            "operation_points": report.operation_points or "N/A",
-            "inspection_items": report.inspection_items or [],
-            "technician_comments": report.technician_comments or "",
-            "applied_parts": report.applied_parts or [],
-            "work_time": report.work_time or {},
-            "status": report.status or "N/A"
-        }
-        
         # Generar PDF usando ReportLab - Versión Compacta
-        # El generador devuelve un BytesIO buffer con el PDF
-        from utils.pdf_generator_compact import generate_service_report_pdf_compact
-        pdf_buffer = generate_service_report_pdf_compact(pdf_data)
+        # Los datos se leen de la sesión aquí; el render corre fuera del event loop
+        report_data = build_report_pdf_data(report)
+        pdf_content = await run_in_threadpool(render_report_pdf_data, report_data)
         
-        # Crear nombre de archivo descriptivo
-        date_str = report.date.replace("-", "") if report.date else "sin_fecha"
-        filename = f"reporte_servicio_{report.id}_{date_str}.pdf"
+        # El siguiente acceso se servirá desde el almacenamiento
+        if report.status == "completed":
+            enqueue_report_pdf(db, report, created_by=current_user.id)
         
         # Retornar PDF como respuesta para descarga
         # Content-Disposition con attachment fuerza la descarga
         return Response(
-            content=pdf_buffer.getvalue(),
+            content=pdf_content,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}",
-                "Content-Length": str(len(pdf_buffer.getvalue())),
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0"
+                "Content-Length": str(len(pdf_content)),
+                **no_cache_headers
             }
         )
         
     except Exception as e:
-        # Log del error para debugging
-        print(f"Error generating PDF for report {report_id}: {str(e)}")
+        logger.exception("Error generating PDF for report %s", report_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error generating PDF: {str(e)}"
         )
 
+async def _stored_pdf_response(artifact: dict, filename: str, headers: dict):
+    """Send a stored PDF with sendfile (local) or streamed from S3. None if unavailable."""
+    if artifact.get("storage") == "local":
+        try:
+            stat_result = os.stat(artifact["path"])
+        except OSError:
+            return None
+        return RangeFileResponse(
+            artifact["path"],
+            stat_result=stat_result,
+            media_type="application/pdf",
+            filename=filename,
+            headers=headers
+        )
+    
+    opened = await s3_manager.run_in_executor(s3_manager.get_artifact_body, artifact)
+    if not opened:
+        return None
+    body, content_length = opened
+    return StreamingResponse(
+        body.iter_chunks(64 * 1024),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Content-Length": str(content_length),
+            **headers
+        }
+    )
+
 @router.get("/inspection-items/defaults")
 async def get_default_inspection_items(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get default inspection items template from database"""
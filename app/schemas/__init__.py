@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, List, Dict, Any, Literal
-from datetime import datetime
+from datetime import date as date_type, datetime
 from enum import Enum
 
 # Enums for Inspection and Operation Points
@@ -189,6 +189,34 @@ class EquipmentResponse(EquipmentBase):
     class Config:
         from_attributes = True
 
+# Equipment Telemetry Schemas (utils/equipment_telemetry.py)
+class TelemetryReading(BaseModel):
+    date: date_type
+    horometer: Optional[float] = None
+    battery_percentage: Optional[float] = None
+    preventive: bool
+
+class EquipmentTelemetryResponse(BaseModel):
+    equipment_id: int
+    type: str
+    brand: str
+    model: str
+    serial_number: str
+    reading_count: int
+    last_reading_date: Optional[date_type] = None
+    last_horometer: Optional[float] = None
+    usage_hours_per_day: Optional[float] = None
+    last_preventive_date: Optional[date_type] = None
+    hours_since_preventive: Optional[float] = None
+    next_service_horometer: Optional[float] = None
+    projected_next_service_date: Optional[date_type] = None
+    service_overdue: bool = False
+    battery_percentage: Optional[float] = None
+    battery_trend_per_30_days: Optional[float] = None
+
+class EquipmentTelemetryDetailResponse(EquipmentTelemetryResponse):
+    readings: List[TelemetryReading]
+
 # Service Report Schemas
 class ServiceReportBase(BaseModel):
     date: str
@@ -329,3 +357,22 @@ class OperationPointTemplateResponse(OperationPointTemplateBase):
     
     class Config:
         from_attributes = True
+
+# Background Job Schemas
+class JobResponse(BaseModel):
+    id: int
+    job_type: str
+    status: str  # queued, running, succeeded, failed
+    attempts: int
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    artifact_url: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+class ReportPdfExportRequest(BaseModel):
+    report_ids: List[int] = Field(..., min_length=1, max_length=500, description="Reportes a exportar")
@@ -0,0 +1,554 @@
+"""
+Datos iniciales del sistema: usuarios, clientes de ejemplo, equipos, catálogo
+de inspección y reportes de muestra. Las referencias entre secciones usan
+llaves naturales (email, nombre del cliente, número de serie) para que
+create_initial_data.py pueda sembrar cada sección por separado.
+"""
+
+USERS = [
+    {
+        "name": "Jose Alfredo Gonzalez Trigueros",
+        "email": "admin@attamontacargas.com",
+        "password": "password123",
+        "role": "admin",
+        "position": "Administrador General"
+    },
+    {
+        "name": "Omar Ivan Lopez Ramirez",
+        "email": "jefe@attamontacargas.com",
+        "password": "password123",
+        "role": "jefe",
+        "position": "Jefe de Servicio"
+    },
+    {
+        "name": "Victor Angel Lopez Romero",
+        "email": "victorlopez@attamontacargas.com",
+        "password": "password123",
+        "role": "operador",
+        "position": "Técnico de Servicio"
+    }
+]
+
+CLIENTS = [
+    {
+        "name": "Industrial Solutions S.A. de C.V.",
+        "address": "Av. Industrial #123, Zona Industrial, Guadalajara, Jalisco"
+    },
+    {
+        "name": "Logística y Transporte del Norte",
+        "address": "Blvd. Transportistas #456, Parque Industrial, Zapopan, Jalisco"
+    },
+    {
+        "name": "Almacenes Modernos de México",
+        "address": "Calle Almacén #789, Parque Empresarial, Tlaquepaque, Jalisco"
+    }
+]
+
+CONTACTS = [
+    {
+        "client": "Industrial Solutions S.A. de C.V.",
+        "name": "Juan Pérez",
+        "position": "Gerente de Mantenimiento",
+        "phone": "3312345678",
+        "email": "juan@empresa1.com"
+    },
+    {
+        "client": "Industrial Solutions S.A. de C.V.",
+        "name": "María López",
+        "position": "Jefa de Operaciones",
+        "phone": "3387654321",
+        "email": "maria@empresa1.com"
+    },
+    {
+        "client": "Logística y Transporte del Norte",
+        "name": "Carlos Gómez",
+        "position": "Coordinador de Almacén",
+        "phone": "3345678901",
+        "email": "carlos@empresa2.com"
+    },
+    {
+        "client": "Almacenes Modernos de México",
+        "name": "Ana Martínez",
+        "position": "Supervisora de Planta",
+        "phone": "3310987654",
+        "email": "ana@empresa3.com"
+    }
+]
+
+EQUIPMENT = [
+    {
+        "type": "Combustión",
+        "brand": "Toyota",
+        "model": "FG25",
+        "serial_number": "TOY-FG25-12345"
+    },
+    {
+        "type": "Eléctrico",
+        "brand": "Yale",
+        "model": "ERP030",
+        "serial_number": "YAL-ERP030-67890"
+    },
+    {
+        "type": "Eléctrico",
+        "brand": "Crown",
+        "model": "FC4500",
+        "serial_number": "CRW-FC4500-24680"
+    },
+    {
+        "type": "Combustión",
+        "brand": "Mitsubishi",
+        "model": "FG18N",
+        "serial_number": "MIT-FG18N-13579"
+    }
+]
+
+# Catálogo de inspección
+INSPECTION_CATEGORIES = [
+    {"name": "ESTRUCTURAL", "description": "Inspección de elementos estructurales", "order_index": 1},
+    {"name": "RUEDAS", "description": "Inspección de ruedas y elementos de tracción", "order_index": 2},
+    {"name": "SEGURIDAD", "description": "Elementos de seguridad del equipo", "order_index": 3},
+    {"name": "FUNCIONALES", "description": "Funciones operativas del equipo", "order_index": 4},
+    {"name": "FUGAS DE ACEITE", "description": "Inspección de fugas de aceite", "order_index": 5},
+]
+
+INSPECTION_ITEMS = [
+    # ESTRUCTURAL
+    {"category": "ESTRUCTURAL", "name": "GOLPES DEFORMACIONES", "order_index": 1},
+    {"category": "ESTRUCTURAL", "name": "TOLVAS/GUARDAS/CUBIERTAS", "order_index": 2},
+    {"category": "ESTRUCTURAL", "name": "TORNILLERÍA Y HERRAJES", "order_index": 3},
+    {"category": "ESTRUCTURAL", "name": "CONTRAPESO", "order_index": 4},
+    {"category": "ESTRUCTURAL", "name": "HORQUILLAS", "order_index": 5},
+    {"category": "ESTRUCTURAL", "name": "MÁSTIL", "order_index": 6},
+    {"category": "ESTRUCTURAL", "name": "DIRECCIÓN", "order_index": 7},
+    {"category": "ESTRUCTURAL", "name": "CHASIS", "order_index": 8},
+    {"category": "ESTRUCTURAL", "name": "MANGUERAS", "order_index": 9},
+    {"category": "ESTRUCTURAL", "name": "CADENAS", "order_index": 10},
+    {"category": "ESTRUCTURAL", "name": "PARTES SUELTAS/FRACTURADAS", "order_index": 11},
+
+    # RUEDAS
+    {"category": "RUEDAS", "name": "DELANTERAS", "order_index": 1},
+    {"category": "RUEDAS", "name": "DIRECCIONES TRASERAS", "order_index": 2},
+    {"category": "RUEDAS", "name": "TRACCIÓN", "order_index": 3},
+    {"category": "RUEDAS", "name": "CASTER (POSTERIOR DERECHA)", "order_index": 4},
+    {"category": "RUEDAS", "name": "CARGA (AL FRENTE ESTABILIZADORES)", "order_index": 5},
+
+    # SEGURIDAD
+    {"category": "SEGURIDAD", "name": "EXTINGUIDOR", "order_index": 1},
+    {"category": "SEGURIDAD", "name": "PARO DE EMERGENCIA", "order_index": 2},
+    {"category": "SEGURIDAD", "name": "TORRETA", "order_index": 3},
+    {"category": "SEGURIDAD", "name": "ALARMA DE VIAJE", "order_index": 4},
+    {"category": "SEGURIDAD", "name": "LUCES DE TRABAJO", "order_index": 5},
+    {"category": "SEGURIDAD", "name": "ESPEJO RETROVISOR", "order_index": 6},
+    {"category": "SEGURIDAD", "name": "CONECTOR A BATERÍA/GAS", "order_index": 7},
+    {"category": "SEGURIDAD", "name": "SWICH ENCENDIDO", "order_index": 8},
+
+    # FUNCIONALES
+    {"category": "FUNCIONALES", "name": "ELEVACIÓN", "order_index": 1},
+    {"category": "FUNCIONALES", "name": "INCLINACIÓN", "order_index": 2},
+    {"category": "FUNCIONALES", "name": "DESPLAZADOR LATERAL", "order_index": 3},
+    {"category": "FUNCIONALES", "name": "ACCESORIOS", "order_index": 4},
+    {"category": "FUNCIONALES", "name": "AVANCE/RETROCESO", "order_index": 5},
+    {"category": "FUNCIONALES", "name": "FRENADO", "order_index": 6},
+    {"category": "FUNCIONALES", "name": "FRENO DE ESTACIONAMIENTO", "order_index": 7},
+    {"category": "FUNCIONALES", "name": "CONTADOR DE HORAS", "order_index": 8},
+
+    # FUGAS DE ACEITE
+    {"category": "FUGAS DE ACEITE", "name": "EVIDENCIA EN PISO", "order_index": 1},
+    {"category": "FUGAS DE ACEITE", "name": "MANGUERAS Y CONEXIONES", "order_index": 2},
+    {"category": "FUGAS DE ACEITE", "name": "CILINDROS DE ELEVACIÓN", "order_index": 3},
+    {"category": "FUGAS DE ACEITE", "name": "CILINDRO DE INCLINACIÓN", "order_index": 4},
+    {"category": "FUGAS DE ACEITE", "name": "CILINDRO DESPLAZADOR LATERAL", "order_index": 5},
+    {"category": "FUGAS DE ACEITE", "name": "CILINDROS DE REACH", "order_index": 6},
+    {"category": "FUGAS DE ACEITE", "name": "ACCESORIOS", "order_index": 7},
+]
+
+OPERATION_POINTS = [
+    {
+        "name": "velocidad_avance",
+        "display_name": "Velocidad de avance",
+        "field_type": "number",
+        "validation_rules": {"min": 0, "max": 50, "unit": "Km/h"},
+        "order_index": 1
+    },
+    {
+        "name": "funciones_auxiliares_operando",
+        "display_name": "Funciones auxiliares operando",
+        "field_type": "select",
+        "options": ["SÍ", "NO", "N/A"],
+        "order_index": 2
+    },
+    {
+        "name": "paro_emergencia_especificaciones",
+        "display_name": "Paro de emergencia dentro de especificaciones",
+        "field_type": "select",
+        "options": ["SÍ", "NO", "N/A"],
+        "order_index": 3
+    }
+]
+
+# Reportes de ejemplo con todos los campos del PDF
+SAMPLE_REPORTS = [
+    {
+        "date": "2025-01-15",
+        "created_by": "victorlopez@attamontacargas.com",  # Victor (operador)
+        "client": "Industrial Solutions S.A. de C.V.",
+        "requested_by": "juan@empresa1.com",
+        "equipment": "TOY-FG25-12345",
+        "technician": "victorlopez@attamontacargas.com",
+        "service_type": "Preventivo",
+        "billing_type": "Facturación",
+        "battery_percentage": 85,
+        "horometer_readings": {"h1": 1250, "h2": 1300, "h3": 850, "h4": 1120},
+        "equipment_specifications": {
+            "model_year": "2023",
+            "capacity": "2.5 ton",
+            "fuel_type": "GLP",
+            "marca": "Toyota",
+            "modelo": "FG25", 
+            "serie": "TOY-FG25-12345"
+        },
+        "work_performed": "Reemplazo de espejo retrovisor, cambio de aceite hidráulico, filtros y inspección preventiva completa según especificaciones del fabricante",
+        "detected_damages": "Daño de espejo roto - fuga menor en sistema hidráulico en conexiones",
+        "possible_causes": [
+            {"id": "1", "name": "Daño Operativo", "selected": False},
+            {"id": "2", "name": "Desgaste por Vida Util", "selected": True},
+            {"id": "3", "name": "Vicio Oculto", "selected": False}
+        ],
+        "activities_performed": "Cambio de espejo retrovisor, reemplazo de aceite hidráulico, cambio de filtros, reparación de conexiones, inspección general completa del equipo según manual",
+        "operation_points": {
+            "velocidad_avance": 12,
+            "funciones_auxiliares_operando": "SÍ",
+            "paro_emergencia_especificaciones": "SÍ",
+            "sistema": "OBJETO DE INSPECCIÓN",
+            "objeto_inspeccion": "Montacargas Toyota FG25"
+        },
+        "inspection_items": [
+            {
+                "category": "ESTRUCTURAL",
+                "items": [
+                    {"id": "1", "name": "GOLPES DEFORMACIONES", "status": "OK", "category": "ESTRUCTURAL", "notes": "Sin daños estructurales visibles"},
+                    {"id": "2", "name": "SOLDADURA FISURADAS", "status": "N/A", "category": "ESTRUCTURAL", "notes": None},
+                    {"id": "3", "name": "TORNILLERÍA COMPLETA Y FIJA", "status": "OK", "category": "ESTRUCTURAL", "notes": None},
+                    {"id": "4", "name": "PARTES SUELTAS/FRACTURADAS", "status": "OK", "category": "ESTRUCTURAL", "notes": None},
+                    {"id": "5", "name": "DELANTERAS", "status": "OK", "category": "ESTRUCTURAL", "notes": None},
+                    {"id": "6", "name": "TRASERAS", "status": "OK", "category": "ESTRUCTURAL", "notes": None}
+                ]
+            },
+            {
+                "category": "RUEDAS", 
+                "items": [
+                    {"id": "7", "name": "TRACCIÓN", "status": "OK", "category": "RUEDAS", "notes": None},
+                    {"id": "8", "name": "DIFERENCIAL", "status": "OK", "category": "RUEDAS", "notes": None},
+                    {"id": "9", "name": "CAJA POSTERIOR DIRECCIÓN", "status": "OK", "category": "RUEDAS", "notes": None},
+                    {"id": "10", "name": "FRENOS", "status": "OK", "category": "RUEDAS", "notes": None}
+                ]
+            },
+            {
+                "category": "SEGURIDAD",
+                "items": [
+                    {"id": "11", "name": "EXTINTOR", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "12", "name": "PARO DE EMERGENCIA", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "13", "name": "TORRETA", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "14", "name": "ALARMA DE TRASLADO", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "15", "name": "SILBATO/CLAXON", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "16", "name": "ESPEJO RETROVISOR", "status": "R", "category": "SEGURIDAD", "notes": "Reemplazado por daño operativo"},
+                    {"id": "17", "name": "CONECTORES BATERÍA Y GAS", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "18", "name": "INDICADORES", "status": "OK", "category": "SEGURIDAD", "notes": None}
+                ]
+            },
+            {
+                "category": "FUNCIONALES",
+                "items": [
+                    {"id": "19", "name": "ELEVACIÓN", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "20", "name": "INCLINACIÓN", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "21", "name": "DESPLAZAMIENTO LATERAL", "status": "N/A", "category": "FUNCIONALES", "notes": "No aplica para este modelo"},
+                    {"id": "22", "name": "ACCESORIOS", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "23", "name": "DIRECCIÓN HIDRÁULICA", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "24", "name": "FRENOS", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "25", "name": "FONDO DE ESTACIONAMIENTO", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "26", "name": "FONDO DE 5 HORAS", "status": "OK", "category": "FUNCIONALES", "notes": None}
+                ]
+            },
+            {
+                "category": "FUGAS DE ACEITE",
+                "items": [
+                    {"id": "27", "name": "EMERGENCIA EN PISO", "status": "N/A", "category": "FUGAS DE ACEITE", "notes": None},
+                    {"id": "28", "name": "MANGUERAS", "status": "R", "category": "FUGAS DE ACEITE", "notes": "Fuga menor en conexiones reparada"},
+                    {"id": "29", "name": "CILINDROS DE ELEVACIÓN", "status": "OK", "category": "FUGAS DE ACEITE", "notes": None},
+                    {"id": "30", "name": "CILINDROS DE INCLINACIÓN", "status": "OK", "category": "FUGAS DE ACEITE", "notes": None},
+                    {"id": "31", "name": "DESPLAZAMIENTO LATERAL", "status": "N/A", "category": "FUGAS DE ACEITE", "notes": "No aplica"},
+                    {"id": "32", "name": "ACCESORIOS", "status": "OK", "category": "FUGAS DE ACEITE", "notes": None}
+                ]
+            }
+        ],
+        "technician_comments": "Equipo operando correctamente después del mantenimiento preventivo. Se realizaron todas las verificaciones según manual del fabricante.",
+        "client_observations": "Equipo funcionando correctamente después del servicio. Cliente satisfecho con el trabajo realizado.",
+        "applied_parts": [
+            {"type": "refacciones", "description": "Espejo retrovisor", "quantity": "1"},
+            {"type": "consumibles", "description": "Aceite hidráulico", "quantity": "4L"},
+            {"type": "consumibles", "description": "Filtro de aceite", "quantity": "1"}
+        ],
+        "work_time": {
+            "fecha": "15/01/25", 
+            "hora_entrada": "09:30",
+            "hora_salida": "11:45",
+            "total_horas": 2.25,
+            "tiempo_extra": 0.0
+        },
+        "signatures": {
+            "client": {
+                "name": "Juan Pérez",
+                "signature_url": "/signatures/client_1001.png",
+                "timestamp": "2025-01-15T11:45:00Z"
+            },
+            "technician": {
+                "name": "Victor Angel Lopez Romero", 
+                "signature_url": "/signatures/tech_1001.png",
+                "timestamp": "2025-01-15T11:50:00Z"
+            }
+        },
+        "status": "completed"
+    },
+    {
+        "date": "2025-01-16",
+        "created_by": "victorlopez@attamontacargas.com",  # Victor (operador)
+        "client": "Logística y Transporte del Norte",
+        "requested_by": "carlos@empresa2.com",
+        "equipment": "YAL-ERP030-67890",
+        "technician": "victorlopez@attamontacargas.com",
+        "service_type": "Correctivo",
+        "billing_type": "Renta",
+        "battery_percentage": 60,
+        "horometer_readings": {"h1": 3200, "h2": 3250, "h3": 3180, "h4": 3220},
+        "equipment_specifications": {
+            "model_year": "2022",
+            "capacity": "3.0 ton",
+            "fuel_type": "Eléctrico",
+            "marca": "Yale",
+            "modelo": "ERP030",
+            "serie": "YAL-ERP030-67890"
+        },
+        "work_performed": "Reparación de sistema de elevación y reemplazo completo de cilindro hidráulico principal, cambio de mangueras deterioradas",
+        "detected_damages": "Cilindro de elevación dañado con fuga severa, manguera hidráulica deteriorada por desgaste operativo",
+        "possible_causes": [
+            {"id": "1", "name": "Daño Operativo", "selected": True},
+            {"id": "2", "name": "Desgaste por Vida Util", "selected": True},
+            {"id": "3", "name": "Vicio Oculto", "selected": False}
+        ],
+        "activities_performed": "Desmontaje y reemplazo de cilindro hidráulico principal, cambio de manguera dañada, instalación de nuevos sellos, pruebas de funcionamiento y calibración del sistema",
+        "operation_points": {
+            "velocidad_avance": 10,
+            "funciones_auxiliares_operando": "SÍ",
+            "paro_emergencia_especificaciones": "SÍ",
+            "sistema": "OBJETO DE INSPECCIÓN",
+            "objeto_inspeccion": "Montacargas Yale ERP030"
+        },
+        "inspection_items": [
+            {
+                "category": "ESTRUCTURAL",
+                "items": [
+                    {"id": "1", "name": "GOLPES DEFORMACIONES", "status": "OK", "category": "ESTRUCTURAL", "notes": None},
+                    {"id": "2", "name": "SOLDADURA FISURADAS", "status": "OK", "category": "ESTRUCTURAL", "notes": None},
+                    {"id": "3", "name": "TORNILLERÍA COMPLETA Y FIJA", "status": "OK", "category": "ESTRUCTURAL", "notes": None},
+                    {"id": "4", "name": "PARTES SUELTAS/FRACTURADAS", "status": "OK", "category": "ESTRUCTURAL", "notes": None},
+                    {"id": "5", "name": "DELANTERAS", "status": "OK", "category": "ESTRUCTURAL", "notes": None},
+                    {"id": "6", "name": "TRASERAS", "status": "OK", "category": "ESTRUCTURAL", "notes": None}
+                ]
+            },
+            {
+                "category": "RUEDAS", 
+                "items": [
+                    {"id": "7", "name": "TRACCIÓN", "status": "OK", "category": "RUEDAS", "notes": None},
+                    {"id": "8", "name": "DIFERENCIAL", "status": "N/A", "category": "RUEDAS", "notes": "Equipo eléctrico"},
+                    {"id": "9", "name": "CAJA POSTERIOR DIRECCIÓN", "status": "OK", "category": "RUEDAS", "notes": None},
+                    {"id": "10", "name": "FRENOS", "status": "OK", "category": "RUEDAS", "notes": None}
+                ]
+            },
+            {
+                "category": "SEGURIDAD",
+                "items": [
+                    {"id": "11", "name": "EXTINTOR", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "12", "name": "PARO DE EMERGENCIA", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "13", "name": "TORRETA", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "14", "name": "ALARMA DE TRASLADO", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "15", "name": "SILBATO/CLAXON", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "16", "name": "ESPEJO RETROVISOR", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "17", "name": "CONECTORES BATERÍA Y GAS", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "18", "name": "INDICADORES", "status": "OK", "category": "SEGURIDAD", "notes": None}
+                ]
+            },
+            {
+                "category": "FUNCIONALES",
+                "items": [
+                    {"id": "19", "name": "ELEVACIÓN", "status": "R", "category": "FUNCIONALES", "notes": "Reparado - cilindro reemplazado"},
+                    {"id": "20", "name": "INCLINACIÓN", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "21", "name": "DESPLAZAMIENTO LATERAL", "status": "N/A", "category": "FUNCIONALES", "notes": "No aplica para este modelo"},
+                    {"id": "22", "name": "ACCESORIOS", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "23", "name": "DIRECCIÓN HIDRÁULICA", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "24", "name": "FRENOS", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "25", "name": "FONDO DE ESTACIONAMIENTO", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "26", "name": "FONDO DE 5 HORAS", "status": "OK", "category": "FUNCIONALES", "notes": None}
+                ]
+            },
+            {
+                "category": "FUGAS DE ACEITE",
+                "items": [
+                    {"id": "27", "name": "EMERGENCIA EN PISO", "status": "R", "category": "FUGAS DE ACEITE", "notes": "Limpiado después de reparación"},
+                    {"id": "28", "name": "MANGUERAS", "status": "R", "category": "FUGAS DE ACEITE", "notes": "Manguera reemplazada"},
+                    {"id": "29", "name": "CILINDROS DE ELEVACIÓN", "status": "R", "category": "FUGAS DE ACEITE", "notes": "Cilindro reemplazado - fuga severa reparada"},
+                    {"id": "30", "name": "CILINDROS DE INCLINACIÓN", "status": "OK", "category": "FUGAS DE ACEITE", "notes": None},
+                    {"id": "31", "name": "DESPLAZAMIENTO LATERAL", "status": "N/A", "category": "FUGAS DE ACEITE", "notes": "No aplica"},
+                    {"id": "32", "name": "ACCESORIOS", "status": "OK", "category": "FUGAS DE ACEITE", "notes": None}
+                ]
+            }
+        ],
+        "technician_comments": "Se reparó cilindro dañado y se reemplazó manguera deteriorada. Equipo operando correctamente después de la reparación completa y calibración del sistema hidráulico.",
+        "client_observations": "Problema resuelto satisfactoriamente. Equipo listo para operación normal. Cliente conforme con la reparación.",
+        "applied_parts": [
+            {"type": "refacciones", "description": "Cilindro hidráulico de elevación", "quantity": "1"},
+            {"type": "refacciones", "description": "Manguera hidráulica", "quantity": "1"},
+            {"type": "consumibles", "description": "Aceite hidráulico", "quantity": "2L"},
+            {"type": "consumibles", "description": "Sellos hidráulicos", "quantity": "1 kit"}
+        ],
+        "work_time": {
+            "fecha": "16/01/25",
+            "hora_entrada": "14:00",
+            "hora_salida": "18:30",
+            "total_horas": 4.5,
+            "tiempo_extra": 1.0
+        },
+        "signatures": {
+            "client": {
+                "name": "Carlos Gómez",
+                "signature_url": "/signatures/client_1002.png",
+                "timestamp": "2025-01-16T18:25:00Z"
+            },
+            "technician": {
+                "name": "Victor Angel Lopez Romero",
+                "signature_url": "/signatures/tech_1002.png", 
+                "timestamp": "2025-01-16T18:30:00Z"
+            }
+        },
+        "status": "completed"
+    },
+    {
+        "date": "2025-07-08", 
+        "created_by": "jefe@attamontacargas.com",  # Omar (jefe)
+        "client": "Almacenes Modernos de México",
+        "requested_by": "ana@empresa3.com",
+        "equipment": "CRW-FC4500-24680",
+        "technician": "victorlopez@attamontacargas.com",
+        "service_type": "Correctivo",
+        "billing_type": "Sin costo",
+        "battery_percentage": 74,
+        "horometer_readings": {"h1": 2694, "h2": 11, "h3": None, "h4": None},
+        "equipment_specifications": {
+            "model_year": "2021",
+            "capacity": "1.5 ton",
+            "fuel_type": "Eléctrico",
+            "marca": "Crown",
+            "modelo": "FC4500",
+            "serie": "CRW-FC4500-24680"
+        },
+        "work_performed": "Reemplazo de espejo retrovisor dañado por impacto operativo",
+        "detected_damages": "Daño de espejo rota",
+        "possible_causes": [
+            {"id": "1", "name": "Daño Operativo", "selected": True},
+            {"id": "2", "name": "Desgaste por Vida Util", "selected": False},
+            {"id": "3", "name": "Vicio Oculto", "selected": False}
+        ],
+        "activities_performed": "Cambio de espejo",
+        "operation_points": {
+            "velocidad_avance": 12,
+            "funciones_auxiliares_operando": "SÍ", 
+            "paro_emergencia_especificaciones": "SÍ",
+            "sistema": "OBJETO DE INSPECCIÓN",
+            "objeto_inspeccion": "montacargas"
+        },
+        "inspection_items": [
+            {
+                "category": "ESTRUCTURAL",
+                "items": [
+                    {"id": "1", "name": "GOLPES DEFORMACIONES", "status": "OK", "category": "ESTRUCTURAL", "notes": None},
+                    {"id": "2", "name": "SOLDADURA FISURADAS", "status": "N/A", "category": "ESTRUCTURAL", "notes": None},
+                    {"id": "3", "name": "TORNILLERÍA COMPLETA Y FIJA", "status": "OK", "category": "ESTRUCTURAL", "notes": None},
+                    {"id": "4", "name": "PARTES SUELTAS/FRACTURADAS", "status": "R", "category": "ESTRUCTURAL", "notes": "Espejo reparado"},
+                    {"id": "5", "name": "DELANTERAS", "status": "OK", "category": "ESTRUCTURAL", "notes": None},
+                    {"id": "6", "name": "TRASERAS", "status": "OK", "category": "ESTRUCTURAL", "notes": None}
+                ]
+            },
+            {
+                "category": "RUEDAS",
+                "items": [
+                    {"id": "7", "name": "TRACCIÓN", "status": "OK", "category": "RUEDAS", "notes": None},
+                    {"id": "8", "name": "DIFERENCIAL", "status": "N/A", "category": "RUEDAS", "notes": "Equipo eléctrico"},
+                    {"id": "9", "name": "CAJA POSTERIOR DIRECCIÓN", "status": "OK", "category": "RUEDAS", "notes": None},
+                    {"id": "10", "name": "FRENOS", "status": "OK", "category": "RUEDAS", "notes": None}
+                ]
+            },
+            {
+                "category": "SEGURIDAD",
+                "items": [
+                    {"id": "11", "name": "EXTINTOR", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "12", "name": "PARO DE EMERGENCIA", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "13", "name": "TORRETA", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "14", "name": "ALARMA DE TRASLADO", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "15", "name": "SILBATO/CLAXON", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "16", "name": "ESPEJO RETROVISOR", "status": "R", "category": "SEGURIDAD", "notes": "Reemplazado"},
+                    {"id": "17", "name": "CONECTORES BATERÍA Y GAS", "status": "OK", "category": "SEGURIDAD", "notes": None},
+                    {"id": "18", "name": "INDICADORES", "status": "OK", "category": "SEGURIDAD", "notes": None}
+                ]
+            },
+            {
+                "category": "FUNCIONALES",
+                "items": [
+                    {"id": "19", "name": "ELEVACIÓN", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "20", "name": "INCLINACIÓN", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "21", "name": "DESPLAZAMIENTO LATERAL", "status": "N/A", "category": "FUNCIONALES", "notes": "No aplica"},
+                    {"id": "22", "name": "ACCESORIOS", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "23", "name": "DIRECCIÓN HIDRÁULICA", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "24", "name": "FRENOS", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "25", "name": "FONDO DE ESTACIONAMIENTO", "status": "OK", "category": "FUNCIONALES", "notes": None},
+                    {"id": "26", "name": "FONDO DE 5 HORAS", "status": "OK", "category": "FUNCIONALES", "notes": None}
+                ]
+            },
+            {
+                "category": "FUGAS DE ACEITE",
+                "items": [
+                    {"id": "27", "name": "EMERGENCIA EN PISO", "status": "N/A", "category": "FUGAS DE ACEITE", "notes": None},
+                    {"id": "28", "name": "MANGUERAS", "status": "OK", "category": "FUGAS DE ACEITE", "notes": None},
+                    {"id": "29", "name": "CILINDROS DE ELEVACIÓN", "status": "OK", "category": "FUGAS DE ACEITE", "notes": None},
+                    {"id": "30", "name": "CILINDROS DE INCLINACIÓN", "status": "OK", "category": "FUGAS DE ACEITE", "notes": None},
+                    {"id": "31", "name": "DESPLAZAMIENTO LATERAL", "status": "N/A", "category": "FUGAS DE ACEITE", "notes": "No aplica"},
+                    {"id": "32", "name": "ACCESORIOS", "status": "OK", "category": "FUGAS DE ACEITE", "notes": None}
+                ]
+            }
+        ],
+        "technician_comments": "Equipo operando correctamente",
+        "client_observations": "Conforme con el servicio realizado. Equipo funcionando normalmente.",
+        "applied_parts": [
+            {"type": "refacciones", "description": "Espejo retrovisor", "quantity": "1"}
+        ],
+        "work_time": {
+            "fecha": "08/07/25",
+            "hora_entrada": "9:00",
+            "hora_salida": "10:30",
+            "total_horas": 1.5,
+            "tiempo_extra": 0.0
+        },
+        "signatures": {
+            "client": {
+                "name": "Roberto",
+                "signature_url": "/signatures/client_1003.png",
+                "timestamp": "2025-07-08T10:30:00Z"
+            },
+            "technician": {
+                "name": "Victor Angel Lopez Romero",
+                "signature_url": "/signatures/tech_1003.png",
+                "timestamp": "2025-07-08T10:35:00Z"
+            }
+        },
+        "status": "pending",
+        "pending_reason": "Esperando aprobación del supervisor para refacciones adicionales"
+    }
+]
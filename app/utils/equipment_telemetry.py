@@ -0,0 +1,185 @@
+"""
+Hour meter and battery trends per equipment, for scheduling preventive service.
+
+Service reports record the equipment's hour meter (horometer_readings["h1"])
+and, on electric units, battery_percentage. load_readings fetches them for
+any number of equipment in one query into columnar NumPy arrays, and
+compute_telemetry works on all the equipment at once (np.bincount per
+equipment instead of a Python loop per unit):
+
+- usage_hours_per_day: least-squares slope of the hour meter over the
+  readings of the last TELEMETRY_USAGE_WINDOW_DAYS,
+- hours_since_preventive: hour meter at the last reading minus at the last
+  Preventivo report,
+- projected_next_service_date: when the hour meter reaches that preventive
+  reading plus PREVENTIVE_SERVICE_INTERVAL_HOURS at the current usage rate.
+
+Equipment without a preventive report that has a reading gets no projection,
+and neither does equipment used less than TELEMETRY_MIN_USAGE_HOURS_PER_DAY
+or whose projection falls more than PROJECTION_HORIZON_DAYS ahead (a flat or
+mistyped series would otherwise project centuries out).
+"""
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from models import ServiceReport
+
+HOROMETER_KEY = "h1"
+PREVENTIVE_SERVICE_TYPE = "Preventivo"
+PROJECTION_HORIZON_DAYS = 5 * 365
+
+Readings = Dict[str, np.ndarray]
+
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _number(value: Any) -> float:
+    if value is None or isinstance(value, bool):
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _day(value: Any) -> np.datetime64:
+    try:
+        return np.datetime64(value, "D")
+    except (TypeError, ValueError):
+        return np.datetime64("NaT")
+
+
+def _column(values: tuple, dtype, convert) -> np.ndarray:
+    """The whole column in one conversion; element by element only when a value is malformed."""
+    try:
+        return np.array(values, dtype=dtype)
+    except (TypeError, ValueError):
+        return np.array([convert(value) for value in values], dtype=dtype)
+
+
+def load_readings(db: Session, equipment_ids: Optional[Sequence[int]] = None) -> Readings:
+    """
+    Readings of the given equipment (all when None), sorted by equipment and
+    date. Days are date ordinals; missing readings are NaN.
+    """
+    query = select(
+        ServiceReport.equipment_id,
+        ServiceReport.date,
+        ServiceReport.horometer_readings[HOROMETER_KEY].as_string(),
+        ServiceReport.battery_percentage,
+        ServiceReport.service_type
+    )
+    if equipment_ids is not None:
+        query = query.where(ServiceReport.equipment_id.in_(equipment_ids))
+    rows = db.execute(query.order_by(ServiceReport.equipment_id, ServiceReport.date, ServiceReport.id)).all()
+    equipment_id, day, horometer, battery, service_type = tuple(zip(*rows)) or ((),) * 5
+
+    days = _column(day, "datetime64[D]", _day)
+    # Without a valid date the report can't be placed on the timeline
+    dated = ~np.isnat(days)
+    readings = {
+        "equipment_id": np.array(equipment_id, dtype=np.int64),
+        "day": days.astype(np.int64) + EPOCH_ORDINAL,
+        "horometer": _column(horometer, float, _number),
+        "battery": _column(battery, float, _number),
+        "preventive": np.array(service_type, dtype=object) == PREVENTIVE_SERVICE_TYPE,
+    }
+    return {name: values[dated] for name, values in readings.items()}
+
+
+def _last_index(group: np.ndarray, mask: np.ndarray, groups: int) -> np.ndarray:
+    """Per group, index of the last row where mask is set (-1 if none). Rows are in date order."""
+    last = np.full(groups, -1)
+    np.maximum.at(last, group[mask], np.flatnonzero(mask))
+    return last
+
+
+def _take(values: np.ndarray, index: np.ndarray) -> np.ndarray:
+    return np.where(index >= 0, values[index], np.nan)
+
+
+def _slopes(group: np.ndarray, x: np.ndarray, y: np.ndarray, mask: np.ndarray, groups: int) -> np.ndarray:
+    """Per group, least-squares slope of y over x on the rows where mask is set (NaN without two distinct x)."""
+    group, x, y = group[mask], x[mask], y[mask]
+    count = np.bincount(group, minlength=groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Centered per group, so large hour meters and date ordinals don't lose precision
+        dx = x - (np.bincount(group, x, groups) / count)[group]
+        dy = y - (np.bincount(group, y, groups) / count)[group]
+        return np.bincount(group, dx * dy, groups) / np.bincount(group, dx * dx, groups)
+
+
+def _rounded(values: np.ndarray) -> List[Optional[float]]:
+    return [None if np.isnan(value) else round(value, 2) for value in values.tolist()]
+
+
+def _dates(days: np.ndarray) -> List[Optional[date]]:
+    return [None if np.isnan(day) else date.fromordinal(int(day)) for day in days.tolist()]
+
+
+def compute_telemetry(readings: Readings, today: date) -> Dict[int, Dict[str, Any]]:
+    """Usage, preventive service and battery figures per equipment id (see module docstring)."""
+    equipment_ids, group = np.unique(readings["equipment_id"], return_inverse=True)
+    groups = len(equipment_ids)
+    days = readings["day"].astype(float)
+    hours = readings["horometer"]
+    battery = readings["battery"]
+    window = settings.telemetry_usage_window_days
+    interval = settings.preventive_service_interval_hours
+
+    has_hours = ~np.isnan(hours)
+    last = _last_index(group, has_hours, groups)
+    last_day = _take(days, last)
+    last_hours = _take(hours, last)
+    usage = _slopes(group, days, hours, has_hours & (days >= last_day[group] - window), groups)
+
+    preventive = _last_index(group, has_hours & readings["preventive"], groups)
+    preventive_hours = _take(hours, preventive)
+    next_hours = preventive_hours + interval
+    with np.errstate(invalid="ignore", divide="ignore"):
+        days_left = np.floor((next_hours - last_hours) / usage)
+        projectable = (usage >= settings.telemetry_min_usage_hours_per_day) & (days_left <= PROJECTION_HORIZON_DAYS)
+        projected = np.where(projectable, last_day + days_left, np.nan)
+        overdue = (last_hours >= next_hours) | (projected <= today.toordinal())
+
+    has_battery = ~np.isnan(battery)
+    last_battery = _last_index(group, has_battery, groups)
+    battery_window = has_battery & (days >= _take(days, last_battery)[group] - window)
+    battery_trend = _slopes(group, days, battery, battery_window, groups) * 30
+
+    columns = {
+        "reading_count": np.bincount(group, minlength=groups).tolist(),
+        "last_reading_date": _dates(last_day),
+        "last_horometer": _rounded(last_hours),
+        "usage_hours_per_day": _rounded(usage),
+        "last_preventive_date": _dates(_take(days, preventive)),
+        "hours_since_preventive": _rounded(last_hours - preventive_hours),
+        "next_service_horometer": _rounded(next_hours),
+        "projected_next_service_date": _dates(projected),
+        "service_overdue": overdue.tolist(),
+        "battery_percentage": _rounded(_take(battery, last_battery)),
+        "battery_trend_per_30_days": _rounded(battery_trend),
+    }
+    return {
+        equipment_id: dict(zip(columns, values))
+        for equipment_id, *values in zip(equipment_ids.tolist(), *columns.values())
+    }
+
+
+def reading_series(readings: Readings) -> List[Dict[str, Any]]:
+    """The readings as rows, for charting one equipment's history."""
+    return [
+        {"date": day, "horometer": horometer, "battery_percentage": battery, "preventive": preventive}
+        for day, horometer, battery, preventive in zip(
+            _dates(readings["day"].astype(float)),
+            _rounded(readings["horometer"]),
+            _rounded(readings["battery"]),
+            readings["preventive"].tolist()
+        )
+    ]
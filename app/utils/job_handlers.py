@@ -0,0 +1,54 @@
+import zipfile
+from io import BytesIO
+
+from sqlalchemy.orm import Session
+
+from models import Job, ServiceReport
+from utils.job_queue import job_handler, store_job_artifact
+from utils.report_pdf import (
+    REPORT_PDF_JOB, discard_older_report_pdfs, render_report_pdf, report_pdf_filename, report_version
+)
+from utils.report_stats import REPORT_STATS_REBUILD_JOB, rebuild_report_stats
+
+
+@job_handler(REPORT_PDF_JOB)
+def prerender_report_pdf(db: Session, job: Job) -> dict:
+    """Render a completed report's PDF ahead of time and keep it in storage."""
+    report = db.query(ServiceReport).filter(ServiceReport.id == job.payload["report_id"]).first()
+    if report is None:
+        return {"report_id": job.payload["report_id"], "skipped": "Service report not found"}
+
+    # Recorded so downloads can tell whether the report changed after rendering
+    version = report_version(report)
+    filename = report_pdf_filename(report)
+    artifact = store_job_artifact(job, filename, render_report_pdf(report), "application/pdf")
+    discard_older_report_pdfs(db, report.id, job.id)
+    return {"artifact": artifact, "report_id": report.id, "filename": filename, "report_version": version}
+
+
+@job_handler("report_pdf_export")
+def export_report_pdfs(db: Session, job: Job) -> dict:
+    """Render the requested service reports and bundle the PDFs in a ZIP file."""
+    report_ids = job.payload.get("report_ids", [])
+    reports = db.query(ServiceReport).filter(
+        ServiceReport.id.in_(report_ids)
+    ).order_by(ServiceReport.id).all()
+
+    buffer = BytesIO()
+    # PDFs are already compressed, so store them as-is
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+        for report in reports:
+            archive.writestr(report_pdf_filename(report), render_report_pdf(report))
+
+    artifact = store_job_artifact(job, "reportes_servicio.zip", buffer.getvalue(), "application/zip")
+    return {
+        "artifact": artifact,
+        "report_count": len(reports),
+        "missing_report_ids": sorted(set(report_ids) - {report.id for report in reports}),
+    }
+
+
+@job_handler(REPORT_STATS_REBUILD_JOB)
+def rebuild_monthly_stats(db: Session, job: Job) -> dict:
+    """Recompute report_monthly_stats from the service reports."""
+    return {"rows": rebuild_report_stats(db)}
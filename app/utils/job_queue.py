@@ -0,0 +1,166 @@
+"""
+Postgres-backed background job queue.
+
+Jobs are rows in the ``jobs`` table. Workers (see ``worker.py``) claim them
+with ``SELECT ... FOR UPDATE SKIP LOCKED`` so any number of worker processes
+can poll the same table without handing out a job twice. Handlers are
+registered with ``@job_handler("type")`` and return a JSON-serializable
+result, usually including an artifact stored through S3Manager.
+"""
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from models import Job
+from utils.s3_manager import s3_manager
+
+logger = logging.getLogger(__name__)
+
+JOB_HANDLERS: Dict[str, Callable[[Session, Job], Optional[Dict[str, Any]]]] = {}
+
+
+def job_handler(job_type: str):
+    """Register a function as the handler for a job type."""
+    def decorator(func):
+        JOB_HANDLERS[job_type] = func
+        return func
+    return decorator
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def enqueue_job(
+    db: Session,
+    job_type: str,
+    payload: Optional[Dict[str, Any]] = None,
+    created_by: Optional[int] = None,
+    dedupe_key: Optional[str] = None,
+    commit: bool = True,
+) -> Job:
+    """
+    Add a job to the queue. When dedupe_key is given and a job with the same
+    key is still queued, that job is returned instead of a new one. The
+    check is backed by the unique index on queued dedupe keys, so two
+    requests racing to queue the same work still end up with one job.
+    """
+    if dedupe_key:
+        existing = _queued_job(db, dedupe_key)
+        if existing:
+            return existing
+
+    job = Job(
+        job_type=job_type,
+        status="queued",
+        payload=payload or {},
+        dedupe_key=dedupe_key,
+        attempts=0,
+        max_attempts=settings.job_max_attempts,
+        created_by=created_by,
+        run_after=_now(),
+    )
+    try:
+        # Savepoint: a lost race must not roll back the caller's own changes
+        with db.begin_nested():
+            db.add(job)
+    except IntegrityError:
+        existing = _queued_job(db, dedupe_key) if dedupe_key else None
+        if existing is None:
+            raise
+        job = existing
+    if commit:
+        db.commit()
+        db.refresh(job)
+    return job
+
+
+def _queued_job(db: Session, dedupe_key: str) -> Optional[Job]:
+    return db.query(Job).filter(
+        Job.dedupe_key == dedupe_key,
+        Job.status == "queued"
+    ).first()
+
+
+def claim_job(db: Session) -> Optional[Job]:
+    """
+    Claim the next runnable job, or a running job whose worker has not
+    finished it within settings.job_timeout. An abandoned job that already
+    used all its attempts (e.g. it kills its worker every time) is marked
+    failed instead of being run again.
+    """
+    while True:
+        now = _now()
+        job = db.query(Job).filter(
+            or_(
+                and_(Job.status == "queued", Job.run_after <= now),
+                and_(Job.status == "running", Job.started_at < now - timedelta(seconds=settings.job_timeout)),
+            )
+        ).order_by(Job.run_after, Job.id).with_for_update(skip_locked=True).first()
+
+        if job is None:
+            db.rollback()
+            return None
+
+        if job.status == "running" and (job.attempts or 0) >= (job.max_attempts or 1):
+            logger.error(f"Job {job.id} ({job.job_type}) abandoned on its last attempt ({job.attempts}), marking it failed")
+            job.status = "failed"
+            job.error = f"Worker did not finish the job within {settings.job_timeout}s on attempt {job.attempts}"
+            job.finished_at = now
+            db.commit()
+            continue
+
+        job.status = "running"
+        job.attempts = (job.attempts or 0) + 1
+        job.started_at = now
+        job.finished_at = None
+        db.commit()
+        return job
+
+
+def run_job(db: Session, job: Job) -> None:
+    """Run a claimed job and record its outcome, retrying with backoff on failure."""
+    handler = JOB_HANDLERS.get(job.job_type)
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for job type '{job.job_type}'")
+        result = handler(db, job)
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"Job {job.id} ({job.job_type}) failed on attempt {job.attempts}")
+        # Shown to users through the jobs API; the traceback stays in the log
+        job.error = f"Attempt {job.attempts} failed ({type(e).__name__})"
+        if handler is not None and job.attempts < (job.max_attempts or 1):
+            job.status = "queued"
+            job.run_after = _now() + timedelta(seconds=settings.job_retry_backoff * job.attempts)
+        else:
+            job.status = "failed"
+            job.finished_at = _now()
+        try:
+            db.commit()
+        except IntegrityError:
+            # The same work was queued again while this attempt ran; that job does the retry
+            db.rollback()
+            job.status = "failed"
+            job.error = f"Attempt {job.attempts} failed ({type(e).__name__}); retried by a newer job"
+            job.finished_at = _now()
+            db.commit()
+        return
+
+    job.status = "succeeded"
+    job.result = result or {}
+    job.error = None
+    job.finished_at = _now()
+    db.commit()
+
+
+def store_job_artifact(job: Job, filename: str, data: bytes, content_type: str) -> Dict[str, Any]:
+    """Store a job's output through S3Manager under an unguessable per-job key."""
+    object_name = f"jobs/{job.id}/{uuid.uuid4().hex}_{filename}"
+    return s3_manager.put_artifact(object_name, data, content_type)
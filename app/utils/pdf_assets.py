@@ -0,0 +1,215 @@
+"""
+Recursos gráficos compartidos por los generadores de PDF.
+
+Cada imagen se lee y decodifica una sola vez por proceso; los documentos la
+dibujan con canvas.drawImage a partir del mismo ImageReader, sin volver a
+tocar el archivo, y ReportLab la incluye una sola vez por documento.
+
+Las firmas subidas por los usuarios pasan por un LRU indexado por el hash
+del archivo, de modo que la firma de un cliente recurrente solo se decodifica
+y reduce la primera vez.
+"""
+import base64
+import binascii
+import hashlib
+import io
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+
+from PIL import Image as PILImage
+from reportlab import rl_config
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Flowable
+
+from core.config import settings
+from core.metrics import cache_counters
+
+logger = logging.getLogger(__name__)
+
+ASSETS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOGO_PATH = os.path.join(ASSETS_DIR, "logo-atta-pdf.png")
+
+# Streams en binario, sin ASCII85, en todos los PDF del proceso: sin el
+# acelerador en C de ReportLab, codificar el logo en ASCII85 en cada documento
+# cuesta más que armar el resto del reporte
+rl_config.useA85 = 0
+
+
+class SharedImage:
+    """
+    Imagen estática (logo, artes fijos) decodificada una vez y reutilizada
+    por todos los PDF del proceso. Seguro para renders concurrentes.
+    """
+
+    def __init__(self, source):
+        # Ruta del archivo o imagen PIL ya decodificada
+        self.source = source
+        self._lock = threading.Lock()
+        self._reader = None
+
+    def _load(self) -> ImageReader:
+        with self._lock:
+            if self._reader is None:
+                reader = ImageReader(self.source)
+                # Decodifica ahora; ImageReader guarda los pixeles para los
+                # siguientes drawImage
+                reader.getRGBData()
+                self._reader = reader
+        return self._reader
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Tamaño en pixeles."""
+        return self._load().getSize()
+
+    def draw_on(self, canv, x: float, y: float, width: float, height: float):
+        """Dibuja la imagen escalada al rectángulo dado."""
+        # mask='auto': el canal alfa viaja como máscara suave (SMask)
+        canv.drawImage(self._load(), x, y, width, height, mask='auto')
+
+    def flowable(self, width: float, height: float) -> "SharedImageFlowable":
+        return SharedImageFlowable(self, width, height)
+
+    def fitted_flowable(self, max_width: float, max_height: float) -> "SharedImageFlowable":
+        """Flowable escalado para caber en la caja dada conservando la proporción."""
+        pixel_width, pixel_height = self.size
+        scale = min(max_width / pixel_width, max_height / pixel_height)
+        return SharedImageFlowable(self, pixel_width * scale, pixel_height * scale)
+
+
+class SharedImageFlowable(Flowable):
+    """Flowable de tamaño fijo que dibuja una SharedImage."""
+
+    def __init__(self, image: SharedImage, width: float, height: float):
+        Flowable.__init__(self)
+        self.image = image
+        self.drawWidth = width
+        self.drawHeight = height
+        self.hAlign = 'CENTER'
+
+    def wrap(self, availWidth, availHeight):
+        return self.drawWidth, self.drawHeight
+
+    def draw(self):
+        self.image.draw_on(self.canv, 0, 0, self.drawWidth, self.drawHeight)
+
+
+# Artes estáticos de los reportes
+LOGO = SharedImage(LOGO_PATH)
+
+
+# === FIRMAS ===
+
+# (ruta, mtime_ns, tamaño) -> hash del contenido, para no releer archivos sin cambios
+_signature_digests: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+# hash del contenido -> firma decodificada y reducida
+_signature_images: "OrderedDict[str, SharedImage]" = OrderedDict()
+_signatures_lock = threading.Lock()
+_SIGNATURE_HITS, _SIGNATURE_MISSES = cache_counters("signature_image")
+
+
+def _lru_get(cache: OrderedDict, key):
+    with _signatures_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _lru_put(cache: OrderedDict, key, value):
+    with _signatures_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > settings.signature_image_cache_size:
+            cache.popitem(last=False)
+
+
+def _resolve_upload_path(url: str) -> Optional[str]:
+    """
+    Convierte la URL de una firma en una ruta dentro de settings.uploads_dir.
+    Acepta URLs bajo settings.uploads_url ("/uploads/signatures/x.png") y
+    rutas relativas como "/signatures/x.png".
+    """
+    path = urlparse(url).path if "://" not in url else None
+    if not path:
+        return None
+    uploads_dir = os.path.realpath(settings.uploads_dir)
+    relative = path.lstrip("/")
+    uploads_prefix = settings.uploads_url.strip("/") + "/"
+    if relative.startswith(uploads_prefix):
+        relative = relative[len(uploads_prefix):]
+    full_path = os.path.realpath(os.path.join(uploads_dir, relative))
+    if not full_path.startswith(uploads_dir + os.sep):
+        return None
+    return full_path
+
+
+def _decode_signature(data: bytes) -> SharedImage:
+    """Decodifica la firma y la reduce al tamaño máximo con el que se imprime."""
+    image = PILImage.open(io.BytesIO(data))
+    image.load()
+    if image.mode not in ("RGB", "RGBA", "L"):
+        image = image.convert("RGBA")
+    max_px = settings.signature_image_max_px
+    image.thumbnail((max_px, max_px))
+    return SharedImage(image)
+
+
+def _signature_from_bytes(data: bytes, digest: Optional[str] = None) -> SharedImage:
+    digest = digest or hashlib.sha256(data).hexdigest()
+    image = _lru_get(_signature_images, digest)
+    if image is None:
+        _SIGNATURE_MISSES.inc()
+        image = _decode_signature(data)
+        _lru_put(_signature_images, digest, image)
+    else:
+        _SIGNATURE_HITS.inc()
+    return image
+
+
+def _signature_from_file(path: str) -> Optional[SharedImage]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    # Las firmas se guardan con nombres únicos; mientras el archivo no cambie
+    # se evita leerlo y calcular su hash en cada render
+    stat_key = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _lru_get(_signature_digests, stat_key)
+    if digest is not None:
+        image = _lru_get(_signature_images, digest)
+        if image is not None:
+            _SIGNATURE_HITS.inc()
+            return image
+
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    _lru_put(_signature_digests, stat_key, digest)
+    return _signature_from_bytes(data, digest)
+
+
+def load_signature_image(url: Optional[str]) -> Optional[SharedImage]:
+    """
+    Firma lista para embeber a partir de una URL de /uploads o un data URL
+    (data:image/png;base64,...). Devuelve None si no existe o no es una imagen
+    válida; nunca descarga URLs remotas durante el render.
+    """
+    if not url:
+        return None
+    try:
+        if url.startswith("data:"):
+            header, _, encoded = url.partition(",")
+            if ";base64" not in header:
+                return None
+            return _signature_from_bytes(base64.b64decode(encoded))
+        path = _resolve_upload_path(url)
+        return _signature_from_file(path) if path else None
+    except (OSError, ValueError, binascii.Error, PILImage.DecompressionBombError) as e:
+        # PIL lanza OSError/ValueError para archivos que no son imágenes
+        logger.warning(f"Could not load signature image {url[:100]}: {e}")
+        return None
@@ -0,0 +1,95 @@
+"""
+Flowables del reporte compacto para que sus bloques se partan entre páginas
+y para dibujar sus partes fijas una sola vez por documento (ver
+generate_service_report_pdf_compact).
+"""
+from typing import Callable, List, Tuple
+
+from reportlab.platypus import Flowable, Table
+
+
+class SplitTable(Table):
+    """
+    Table que puede anidarse en celdas que se parten entre páginas
+    (splitInRow) y cuyas celdas alineadas arriba se vuelven a partir en la
+    página siguiente si todavía no caben.
+    """
+
+    def wrap(self, availWidth, availHeight):
+        width, height = Table.wrap(self, availWidth, availHeight)
+        # Table._splitCell (splitInRow) mide las tablas anidadas con .height
+        self.height = height
+        return width, height
+
+    def _splitCell(self, value, style, oldHeight, newHeight, width):
+        if style.valign == "TOP":
+            # Lo que no cabe sigue en la página siguiente, donde se vuelve a
+            # partir si hace falta. Table lo limita al alto original del renglón
+            # y falla cuando la primera parte no ocupa todo el espacio disponible.
+            oldHeight = float("inf")
+        return Table._splitCell(self, value, style, oldHeight, newHeight, width)
+
+    def split(self, availWidth, availHeight):
+        result = Table.split(self, availWidth, availHeight)
+        if not result and self.splitInRow and self._height > availHeight:
+            # Table no parte un renglón si lo que pasa a la página siguiente
+            # mide menos de splitInRow; se deja esa parte un poco más alta.
+            result = Table.split(self, availWidth, availHeight - self.splitInRow)
+        if result or not self.repeatRows:
+            return result
+        # Table no deja los títulos solos al pie de la página; el formulario
+        # original sí (la tabla de refacciones del reporte típico empieza al
+        # final de la página 1), así que se parte como una tabla sin títulos
+        # repetidos.
+        repeatRows = self.repeatRows
+        self.repeatRows = 0
+        try:
+            return Table.split(self, availWidth, availHeight)
+        finally:
+            self.repeatRows = repeatRows
+
+
+class FormOverlay(Flowable):
+    """
+    Bloque fijo del formulario con los valores del reporte encima.
+
+    frame es la parte estática, ya medida con wrap: se dibuja una vez por
+    documento como Form XObject (beginForm/doForm) y después solo se
+    referencia, así que puede reutilizarse entre renders del mismo hilo.
+    values son (x, flowable) con lo propio del reporte, dibujados sobre el
+    marco. Si el bloque no cabe en el espacio disponible se parte como
+    full(), la versión normal del bloque.
+    """
+
+    # Los bordes de las celdas se salen un poco del marco; el Form XObject
+    # recorta a su BBox
+    BLEED = 2
+
+    def __init__(self, form_name: str, frame: Flowable, size: Tuple[float, float],
+                 values: List[Tuple[float, Flowable]], full: Callable[[], Flowable]):
+        Flowable.__init__(self)
+        self.form_name = form_name
+        self.frame = frame
+        self.width, self.height = size
+        self.values = values
+        self.full = full
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        return self.full().split(availWidth, availHeight)
+
+    def draw(self):
+        canv = self.canv
+        if not canv.hasForm(self.form_name):
+            canv.beginForm(
+                self.form_name, -self.BLEED, -self.BLEED,
+                self.width + self.BLEED, self.height + self.BLEED
+            )
+            self.frame.drawOn(canv, 0, 0)
+            canv.endForm()
+        canv.doForm(self.form_name)
+        for x, value in self.values:
+            value.wrapOn(canv, self.width - x, self.height)
+            value.drawOn(canv, x, 0)
@@ -2,12 +2,271 @@ from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from io import BytesIO
 from datetime import datetime
-from typing import Dict, Any
-import os
+from typing import Dict, Any, Iterable, List, Tuple
+from collections import OrderedDict
+import itertools
+import threading
+
+from utils.pdf_assets import LOGO, load_signature_image
+from utils.pdf_flowables import FormOverlay, SplitTable
+
+
+# === ESTILOS PRECOMPILADOS ===
+# Se construyen una sola vez por proceso y se comparten entre todos los renders.
+# Son de solo lectura: no modificarlos dentro de las funciones de construcción.
+# Los flowables (Paragraph, Table) sí se crean en cada render: platypus les
+# asigna el canvas durante wrap/draw y no pueden compartirse entre hilos.
+
+SECTION_STYLE = ParagraphStyle(
+    'CompactSection',
+    fontSize=8,         # Reducido de 9 a 8
+    textColor=colors.white,
+    fontName='Helvetica-Bold',
+    spaceBefore=2,
+    spaceAfter=2,
+    alignment=TA_CENTER,
+    leading=9           # Reducido de 10 a 9
+)
+
+NORMAL_STYLE = ParagraphStyle(
+    'CompactNormal',
+    fontSize=6,         # Reducido de 7 a 6
+    fontName='Helvetica',
+    leading=7           # Reducido de 8 a 7
+)
+
+CONTACT_STYLE = ParagraphStyle('contact', fontSize=8, fontName='Helvetica', alignment=TA_CENTER)
+REPORT_TITLE_STYLE = ParagraphStyle('header', fontSize=10, fontName='Helvetica-Bold', alignment=TA_CENTER)
+
+# Tabla de inspección
+INSPECTION_HEADER_STYLE = ParagraphStyle('header', fontSize=5, fontName='Helvetica-Bold', textColor=colors.white, alignment=TA_CENTER)
+SISTEMA_FIRST_STYLE = ParagraphStyle('sistema', fontSize=4, fontName='Helvetica-Bold', alignment=TA_CENTER)
+SISTEMA_STYLE = ParagraphStyle('sistema', fontSize=4, fontName='Helvetica', alignment=TA_CENTER)
+ITEM_STYLE = ParagraphStyle('item', fontSize=4, fontName='Helvetica')
+CHECK_STYLE = ParagraphStyle('check', fontSize=6, alignment=TA_CENTER)
+
+# Inspección compacta (diseño alterno)
+CATEGORY_STYLE = ParagraphStyle('cat', fontSize=7, fontName='Helvetica-Bold', textColor=colors.white)
+OP_LABEL_STYLE = ParagraphStyle('op', fontSize=7, fontName='Helvetica-Bold')
+OP_VALUE_STYLE = ParagraphStyle('op', fontSize=7)
+
+# Firmas: la imagen debe caber junto al nombre en la fila de 0.6in
+SIGNATURE_MAX_WIDTH = 2.2*inch
+SIGNATURE_MAX_HEIGHT = 0.35*inch
+TECH_SIG_STYLE = ParagraphStyle('tech_sig', fontSize=7, fontName='Helvetica', alignment=TA_CENTER, leading=8)
+CLIENT_SIG_STYLE = ParagraphStyle('client_sig', fontSize=7, fontName='Helvetica', alignment=TA_CENTER, leading=8)
+
+# Cajas de texto libre: renglones en blanco bajo el texto para escribir a mano
+# (los mismos que dejaban los seis <br/> del formulario original)
+NARRATIVE_BLANK_LINES = 5
+# Alto mínimo (pt) de cada parte cuando un renglón de tabla se divide entre páginas
+MIN_SPLIT_HEIGHT = 0.5*inch
+
+# Checklist de inspección: SISTEMA, OBJETO DE INSPECCIÓN y las casillas
+INSPECTION_COL_WIDTHS = [0.6*inch, 1.5*inch, 0.2*inch, 0.2*inch, 0.2*inch]
+CHECK_STATUSES = ('OK', 'N/A', 'R')
+# Marcos del checklist ya medidos (ver _checklist_frame), por hilo
+CHECKLIST_FRAME_CACHE_SIZE = 8
+_checklist_frames = threading.local()
+_checklist_frame_ids = itertools.count(1)
+
+# === ESTILOS DE TABLA PRECOMPILADOS ===
+
+HEADER_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (0, -1), 'CENTER'),  # Centrado de columna izquierda
+    ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # Centrado de columna derecha
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('GRID', (2, 0), (2, 0), 0, colors.white),  # Sin bordes en el encabezado
+])
+
+DATE_BOX_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.red),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+])
+
+CLIENT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, 0), colors.red),
+    ('BACKGROUND', (2, 0), (2, 0), colors.red),
+    ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
+    ('TEXTCOLOR', (2, 0), (2, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 6),  # Reducido de 8 a 6
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('GRID', (0, 0), (0, -1), 1, colors.black),
+    ('GRID', (2, 0), (2, -1), 1, colors.black),
+])
+
+# Domicilio y datos del equipo
+INFO_ROW_TABLE_STYLE = TableStyle([
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+])
+
+OPERATION_POINTS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.red),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 6),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),  # Líneas más delgadas
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 1),    # Padding reducido
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 1), # Padding reducido
+    ('LEFTPADDING', (0, 0), (-1, -1), 2),   # Padding reducido
+    ('RIGHTPADDING', (0, 0), (-1, -1), 2),  # Padding reducido
+])
+
+AUX_FUNCTIONS_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 6),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),  # Líneas más delgadas
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 1),    # Padding reducido
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 1), # Padding reducido
+    ('LEFTPADDING', (0, 0), (-1, -1), 2),   # Padding reducido
+    ('RIGHTPADDING', (0, 0), (-1, -1), 2),  # Padding reducido
+])
+
+INSPECTION_TABLE_STYLE = TableStyle([
+    # Header principal con fondo rojo
+    ('BACKGROUND', (0, 0), (-1, 0), colors.red),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 5),  # Fuente más pequeña para headers
+    
+    # Configuración general
+    ('ALIGN', (0, 0), (0, -1), 'CENTER'),   # Columna SISTEMA centrada
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),     # OBJETO DE INSPECCIÓN alineado a la izquierda
+    ('ALIGN', (2, 0), (-1, -1), 'CENTER'),  # Checkboxes centrados
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 0),     # Padding eliminado para reducir altura
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),  # Padding eliminado para reducir altura
+    ('LEFTPADDING', (0, 0), (-1, -1), 1),    # Padding horizontal mínimo
+    ('RIGHTPADDING', (0, 0), (-1, -1), 1),   # Padding horizontal mínimo
+    ('FONTSIZE', (0, 1), (-1, -1), 4),       # Fuente muy pequeña para contenido
+])
+
+# Solo las casillas del checklist, sobre su marco: mismos alineados y márgenes
+CHECK_MARKS_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ('LEFTPADDING', (0, 0), (-1, -1), 1),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 1),
+])
+
+# Recuadros con título rojo: trabajo realizado, daños, causas, actividades y puntos de operación
+SECTION_BOX_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.red),
+    ('FONTSIZE', (0, 0), (-1, -1), 6),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('TOPPADDING', (0, 0), (-1, -1), 1),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
+    ('LEFTPADDING', (0, 0), (-1, -1), 2),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 2),
+])
+
+OPERATION_SUBTABLE_STYLE = TableStyle([
+    ('FONTSIZE', (0, 0), (-1, -1), 6),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # Columna izquierda alineada a la izquierda
+    ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # Columna derecha centrada
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+    ('LEFTPADDING', (0, 0), (-1, -1), 2),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 2),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),  # Valores en negrita
+    # Sin bordes internos para evitar doble borde
+])
+
+MAIN_CONTENT_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),    # Centrar la tabla completa
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ('LEFTPADDING', (0, 0), (0, -1), 0),      # Sin padding izquierdo en columna izquierda
+    ('RIGHTPADDING', (0, 0), (0, -1), 12),    # Más separación entre columnas
+    ('LEFTPADDING', (1, 0), (1, -1), 12),     # Más separación entre columnas
+    ('RIGHTPADDING', (1, 0), (1, -1), 0),     # Sin padding derecho en columna derecha
+])
+
+COMPACT_INSPECTION_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, 0), colors.red),
+    ('BACKGROUND', (2, 0), (2, 0), colors.red),
+    ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
+    ('TEXTCOLOR', (2, 0), (2, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 6),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 1), (1, -1), 'CENTER'),
+    ('GRID', (0, 0), (1, -1), 1, colors.black),
+    ('GRID', (2, 0), (2, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+
+COMMENTS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.red),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+
+PARTS_SUBTABLE_STYLE = TableStyle([
+    ('FONTSIZE', (0, 0), (-1, -1), 6),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),     # Columna de descripción alineada a la izquierda
+    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # Columna de cantidad centrada
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 1),    # Reducido de 2 a 1
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 1), # Reducido de 2 a 1
+    ('LEFTPADDING', (0, 0), (-1, -1), 2),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 2),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),  # Cantidad en negrita
+])
+
+TIME_SUBTABLE_STYLE = TableStyle([
+    ('FONTSIZE', (0, 0), (-1, -1), 6),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),     # Columna de concepto alineada a la izquierda
+    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # Columna de valor centrada
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 1),    # Reducido de 2 a 1
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 1), # Reducido de 2 a 1
+    ('LEFTPADDING', (0, 0), (-1, -1), 2),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 2),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),  # Valores en negrita
+])
+
+PARTS_TIME_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.red),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+
+SIGNATURES_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.red),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 6),  # Reducido de 8 a 6
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'BOTTOM'),
+])
 
 
 def generate_service_report_pdf_compact(report_data: Dict[str, Any]) -> BytesIO:
@@ -17,36 +276,48 @@ def generate_service_report_pdf_compact(report_data: Dict[str, Any]) -> BytesIO:
     """
     buffer = BytesIO()
     
-    # Configurar documento para una página compacta con márgenes mínimos
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=letter,
-        rightMargin=0.15*inch,  # Reducido de 0.25 a 0.15
-        leftMargin=0.15*inch,   # Reducido de 0.25 a 0.15
-        topMargin=0.1*inch,     # Reducido de 0.2 a 0.1
-        bottomMargin=0.1*inch   # Reducido de 0.2 a 0.1
-    )
+    # Construir el PDF
+    _create_document(buffer).build(_create_report_story(report_data))
+    
+    # Regresar al inicio del buffer
+    buffer.seek(0)
+    return buffer
+
+
+def generate_service_reports_pdf_compact(reports_data: Iterable[Dict[str, Any]], output=None):
+    """
+    Genera un solo PDF con varios reportes compactos, cada uno desde una
+    página nueva. Todo se construye en un solo build: fuentes, logo y firmas
+    repetidas se incluyen una vez en el documento.
+    
+    output es cualquier archivo binario con write (por defecto un BytesIO);
+    se devuelve posicionado al inicio.
+    """
+    output = output if output is not None else BytesIO()
     
     story = []
+    for report_data in reports_data:
+        if story:
+            story.append(PageBreak())
+        story.extend(_create_report_story(report_data))
     
-    # === CREAR ESTILOS COMPACTOS ===
-    section_style = ParagraphStyle(
-        'CompactSection',
-        fontSize=8,         # Reducido de 9 a 8
-        textColor=colors.white,
-        fontName='Helvetica-Bold',
-        spaceBefore=2,
-        spaceAfter=2,
-        alignment=TA_CENTER,
-        leading=9           # Reducido de 10 a 9
-    )
+    if not story:
+        raise ValueError("No reports to render")
     
-    normal_style = ParagraphStyle(
-        'CompactNormal',
-        fontSize=6,         # Reducido de 7 a 6
-        fontName='Helvetica',
-        leading=7           # Reducido de 8 a 7
-    )
+    _create_document(output).build(story)
+    output.seek(0)
+    return output
+
+
+def _create_report_story(report_data: Dict[str, Any]) -> list:
+    """
+    Arma los flowables de un reporte.
+    """
+    story = []
+    
+    # Estilos precompilados a nivel de módulo
+    section_style = SECTION_STYLE
+    normal_style = NORMAL_STYLE
     
     # === HEADER CORPORATIVO ===
     story.append(_create_compact_header(report_data))
@@ -63,27 +334,32 @@ def generate_service_report_pdf_compact(report_data: Dict[str, Any]) -> BytesIO:
     # === SECCIÓN INFERIOR: PARTES, TIEMPO Y FIRMAS ===
     story.extend(_create_bottom_section(report_data, section_style, normal_style))
     
-    # Construir el PDF
-    doc.build(story)
-    
-    # Regresar al inicio del buffer
-    buffer.seek(0)
-    return buffer
+    return story
+
+
+def _create_document(buffer) -> SimpleDocTemplate:
+    """
+    Configura el documento para una página compacta con márgenes mínimos.
+    """
+    return SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        rightMargin=0.15*inch,  # Reducido de 0.25 a 0.15
+        leftMargin=0.15*inch,   # Reducido de 0.25 a 0.15
+        topMargin=0.1*inch,     # Reducido de 0.2 a 0.1
+        bottomMargin=0.1*inch   # Reducido de 0.2 a 0.1
+    )
 
 
 def _create_compact_header(report_data: Dict[str, Any]) -> Table:
     """
     Crea el encabezado corporativo compacto estilo ATTA.
     """
-    # Ruta del logo
-    logo_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logo-atta-pdf.png")
-    
-    # Crear objeto de imagen con un tamaño adecuado
-    logo_image = Image(logo_path, width=1.7*inch, height=0.7*inch)
+    # Logo decodificado una sola vez por proceso y embebido por referencia
+    logo_image = LOGO.flowable(width=1.7*inch, height=0.7*inch)
     
     # Crear párrafo para información de teléfono y centrarla
-    tel_paragraph = Paragraph('TELÉFONO<br/>33 31 46 11 76<br/>www.attamontacargas.com', 
-                             ParagraphStyle('contact', fontSize=8, fontName='Helvetica', alignment=TA_CENTER))
+    tel_paragraph = Paragraph('TELÉFONO<br/>33 31 46 11 76<br/>www.attamontacargas.com', CONTACT_STYLE)
     
     # Centrar todo el encabezado y juntar los elementos
     header_data = [
@@ -100,7 +376,7 @@ def _create_compact_header(report_data: Dict[str, Any]) -> Table:
             # Columna de reporte y fecha (derecha)
             Table([
                 [Paragraph(f'<b>REPORTE DE SERVICIO</b><br/>#{report_data.get("report_number", "N/A")}', 
-                         ParagraphStyle('header', fontSize=10, fontName='Helvetica-Bold', alignment=TA_CENTER))],
+                         REPORT_TITLE_STYLE)],
                 [_create_date_box(report_data.get('date', 'N/A'))]
             ], colWidths=[2.5*inch], spaceBefore=0, spaceAfter=0)
         ]
@@ -108,12 +384,7 @@ def _create_compact_header(report_data: Dict[str, Any]) -> Table:
     
     # Crear tabla principal con menos espacio entre columnas
     header_table = Table(header_data, colWidths=[3.3*inch, 0.15*inch, 3.35*inch])
-    header_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (0, -1), 'CENTER'),  # Centrado de columna izquierda
-        ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # Centrado de columna derecha
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('GRID', (2, 0), (2, 0), 0, colors.white),  # Sin bordes en el encabezado
-    ]))
+    header_table.setStyle(HEADER_TABLE_STYLE)
     
     return header_table
 
@@ -138,14 +409,7 @@ def _create_date_box(date_str: str) -> Table:
     ]
     
     date_table = Table(date_data, colWidths=[0.8*inch, 0.8*inch, 0.9*inch])
-    date_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.red),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-    ]))
+    date_table.setStyle(DATE_BOX_TABLE_STYLE)
     
     return date_table
 
@@ -164,17 +428,7 @@ def _create_main_info_section(report_data: Dict[str, Any], normal_style: Paragra
     ]
     
     client_table = Table(client_data, colWidths=[3.5*inch, 0.2*inch, 3.8*inch])  # Aumentado el ancho total
-    client_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, 0), colors.red),
-        ('BACKGROUND', (2, 0), (2, 0), colors.red),
-        ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
-        ('TEXTCOLOR', (2, 0), (2, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 6),  # Reducido de 8 a 6
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('GRID', (0, 0), (0, -1), 1, colors.black),
-        ('GRID', (2, 0), (2, -1), 1, colors.black),
-    ]))
+    client_table.setStyle(CLIENT_TABLE_STYLE)
     
     elements.append(client_table)
     
@@ -184,11 +438,7 @@ def _create_main_info_section(report_data: Dict[str, Any], normal_style: Paragra
     ]
     
     address_table = Table(address_data, colWidths=[1.2*inch, 6.3*inch])  # Aumentado el ancho total
-    address_table.setStyle(TableStyle([
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-    ]))
+    address_table.setStyle(INFO_ROW_TABLE_STYLE)
     
     elements.append(address_table)
     
@@ -202,11 +452,7 @@ def _create_main_info_section(report_data: Dict[str, Any], normal_style: Paragra
     ]
     
     equipment_table = Table(equipment_data, colWidths=[1*inch, 1.1*inch, 0.6*inch, 0.9*inch, 0.6*inch, 0.9*inch, 0.6*inch, 1.4*inch])  # Ajustado para más ancho
-    equipment_table.setStyle(TableStyle([
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-    ]))
+    equipment_table.setStyle(INFO_ROW_TABLE_STYLE)
     
     elements.append(equipment_table)
     
@@ -230,19 +476,7 @@ def _create_operation_points_table(report_data: Dict[str, Any], section_style: P
     ]
     
     op_table = Table(op_data, colWidths=[2.5*inch, 3*inch, 2.5*inch])
-    op_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.red),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 6),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),  # Líneas más delgadas
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1),    # Padding reducido
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1), # Padding reducido
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),   # Padding reducido
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2),  # Padding reducido
-    ]))
+    op_table.setStyle(OPERATION_POINTS_TABLE_STYLE)
     
     elements.append(op_table)
     
@@ -254,17 +488,7 @@ def _create_operation_points_table(report_data: Dict[str, Any], section_style: P
     ]
     
     aux_table = Table(aux_data, colWidths=[4*inch, 4*inch])
-    aux_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 6),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),  # Líneas más delgadas
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1),    # Padding reducido
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1), # Padding reducido
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),   # Padding reducido
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2),  # Padding reducido
-    ]))
+    aux_table.setStyle(AUX_FUNCTIONS_TABLE_STYLE)
     
     elements.append(aux_table)
     
@@ -274,22 +498,135 @@ def _create_operation_points_table(report_data: Dict[str, Any], section_style: P
 def _create_separate_inspection(report_data: Dict[str, Any], section_style: ParagraphStyle) -> list:
     """
     Crea la tabla de inspección separada y compacta con 5 columnas.
-    """
-    elements = []
     
-    # Preparar datos de inspección
+    Con el catálogo habitual todo el checklist es fijo salvo las X: el marco
+    (encabezados, sistemas, puntos y cuadrícula) se arma y mide una vez por
+    hilo y se dibuja una vez por documento; de cada reporte solo se dibujan
+    las X encima. Si no cabe en la página se parte como la tabla completa.
+    """
     inspection_items = report_data.get('inspection_items', [])
+    if not any(category_data.get('items') for category_data in inspection_items):
+        return [_create_inspection_table(inspection_items)]
     
-    # Crear tabla de inspección con 5 columnas
+    key = tuple(
+        (category_data.get('category', 'N/A'), tuple(item.get('name', 'N/A') for item in category_data.get('items', [])))
+        for category_data in inspection_items
+    )
+    frame = _checklist_frame(key, inspection_items)
+    
+    marks = [['X' if item.get('status', 'N/A') == status else '' for status in CHECK_STATUSES]
+             for category_data in inspection_items for item in category_data.get('items', [])]
+    # Un renglón sin X puede medir menos que el del marco (se mide con X en todos)
+    for row_marks, static_height, row_height in zip(marks, frame['static_heights'], frame['row_heights'][1:]):
+        if not any(row_marks) and static_height != row_height:
+            return [_create_inspection_table(inspection_items)]
+    
+    mark = frame['mark']
+    marks_table = Table(
+        [['', '', '']] + [[mark if value else '' for value in row_marks] for row_marks in marks],
+        colWidths=INSPECTION_COL_WIDTHS[2:],
+        rowHeights=frame['row_heights']
+    )
+    marks_table.setStyle(CHECK_MARKS_TABLE_STYLE)
+    
+    return [FormOverlay(
+        frame['form_name'], frame['table'], frame['size'],
+        [(sum(INSPECTION_COL_WIDTHS[:2]), marks_table)],
+        lambda: _create_inspection_table(inspection_items)
+    )]
+
+
+def _checklist_frame(key: tuple, inspection_items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Marco del checklist para un catálogo (key): la tabla sin X, ya medida, y
+    el alto de cada renglón. Se guarda por hilo porque los flowables no pueden
+    compartirse entre hilos.
+    """
+    frames = getattr(_checklist_frames, 'frames', None)
+    if frames is None:
+        frames = _checklist_frames.frames = OrderedDict()
+    frame = frames.get(key)
+    if frame is not None:
+        frames.move_to_end(key)
+        return frame
+    
+    data, span_commands = _inspection_rows(inspection_items, marks=False)
+    mark = Paragraph('X', CHECK_STYLE)
+    mark_height = mark.wrap(INSPECTION_COL_WIDTHS[2] - 2, float('inf'))[1]
+    static_heights = _row_heights(data, span_commands)
+    # Con X en todos los renglones, como en los reportes completos
+    row_heights = static_heights[:1] + [max(height, mark_height) for height in static_heights[1:]]
+    
+    table = Table(data, colWidths=INSPECTION_COL_WIDTHS, rowHeights=row_heights)
+    table.setStyle(INSPECTION_TABLE_STYLE)
+    if span_commands:
+        table.setStyle(span_commands)
+    size = table.wrap(sum(INSPECTION_COL_WIDTHS), float('inf'))
+    
+    frame = {
+        'form_name': f'ChecklistFrame{next(_checklist_frame_ids)}',
+        'table': table,
+        'size': size,
+        'row_heights': row_heights,
+        'static_heights': static_heights[1:],
+        'mark': mark,
+    }
+    frames[key] = frame
+    if len(frames) > CHECKLIST_FRAME_CACHE_SIZE:
+        frames.popitem(last=False)
+    return frame
+
+
+def _row_heights(data: List[list], span_commands: List[tuple]) -> List[float]:
+    """
+    Alto de cada renglón como lo calcula Table con TOPPADDING y BOTTOMPADDING
+    en 0: el del párrafo más alto, sin contar las celdas unidas con SPAN.
+    """
+    spanned = set()
+    for command in span_commands:
+        if command[0] == 'SPAN':
+            (col, first_row), (_, last_row) = command[1], command[2]
+            spanned.update((row, col) for row in range(first_row, last_row + 1))
+    heights = []
+    for row_index, row in enumerate(data):
+        heights.append(max(
+            [cell.wrap(width - 2, float('inf'))[1]
+             for col, (cell, width) in enumerate(zip(row, INSPECTION_COL_WIDTHS))
+             if (row_index, col) not in spanned] or [0]
+        ))
+    return heights
+
+
+def _create_inspection_table(inspection_items: List[Dict[str, Any]]) -> SplitTable:
+    """
+    Tabla de inspección completa; se parte entre páginas repitiendo los
+    encabezados.
+    """
+    inspection_data, span_commands = _inspection_rows(inspection_items, marks=True)
+    
+    # Crear la tabla con anchos optimizados según el contenido
+    inspection_table = SplitTable(inspection_data, colWidths=INSPECTION_COL_WIDTHS, repeatRows=1)
+    inspection_table.setStyle(INSPECTION_TABLE_STYLE)
+    if span_commands:
+        inspection_table.setStyle(span_commands)
+    
+    return inspection_table
+
+
+def _inspection_rows(inspection_items: List[Dict[str, Any]], marks: bool) -> Tuple[List[list], List[tuple]]:
+    """
+    Renglones de la tabla de inspección y los SPAN que agrupan cada sistema.
+    Con marks=False las casillas quedan vacías (marco del checklist).
+    """
     inspection_data = []
     
     # Headers principales de la tabla
     inspection_data.append([
-        Paragraph('<b>SISTEMA</b>', ParagraphStyle('header', fontSize=5, fontName='Helvetica-Bold', textColor=colors.white, alignment=TA_CENTER)),
-        Paragraph('<b>OBJETO DE INSPECCIÓN</b>', ParagraphStyle('header', fontSize=5, fontName='Helvetica-Bold', textColor=colors.white, alignment=TA_CENTER)),
-        Paragraph('<b>OK</b>', ParagraphStyle('header', fontSize=5, fontName='Helvetica-Bold', textColor=colors.white, alignment=TA_CENTER)),
-        Paragraph('<b>N/A</b>', ParagraphStyle('header', fontSize=5, fontName='Helvetica-Bold', textColor=colors.white, alignment=TA_CENTER)),
-        Paragraph('<b>R</b>', ParagraphStyle('header', fontSize=5, fontName='Helvetica-Bold', textColor=colors.white, alignment=TA_CENTER))
+        Paragraph('<b>SISTEMA</b>', INSPECTION_HEADER_STYLE),
+        Paragraph('<b>OBJETO DE INSPECCIÓN</b>', INSPECTION_HEADER_STYLE),
+        Paragraph('<b>OK</b>', INSPECTION_HEADER_STYLE),
+        Paragraph('<b>N/A</b>', INSPECTION_HEADER_STYLE),
+        Paragraph('<b>R</b>', INSPECTION_HEADER_STYLE)
     ])
     
     # Procesar todas las categorías y sus elementos
@@ -299,68 +636,33 @@ def _create_separate_inspection(report_data: Dict[str, Any], section_style: Para
         
         # Agregar items de la categoría
         for i, item in enumerate(items):
-            status = item.get('status', 'N/A')
+            status = item.get('status', 'N/A') if marks else None
             item_name = item.get('name', 'N/A')
             
-            # Determinar qué checkbox marcar según el status
-            # Solo mostrar X cuando está marcado, vacío cuando no
-            checkbox_ok = 'X' if status == 'OK' else ''
-            checkbox_na = 'X' if status == 'N/A' else ''
-            checkbox_r = 'X' if status == 'R' else ''
-            
             # Solo mostrar el nombre del sistema en la primera fila de cada categoría
-            sistema_text = category_name if i == 0 else ''
+            if i == 0:
+                sistema_cell = Paragraph(category_name, SISTEMA_FIRST_STYLE)
+            else:
+                sistema_cell = Paragraph('', SISTEMA_STYLE)
             
-            item_row = [
-                Paragraph(sistema_text, ParagraphStyle('sistema', fontSize=4, fontName='Helvetica-Bold' if i == 0 else 'Helvetica', alignment=TA_CENTER)),
-                Paragraph(item_name, ParagraphStyle('item', fontSize=4, fontName='Helvetica')),
-                Paragraph(checkbox_ok, ParagraphStyle('check', fontSize=6, alignment=TA_CENTER)),
-                Paragraph(checkbox_na, ParagraphStyle('check', fontSize=6, alignment=TA_CENTER)), 
-                Paragraph(checkbox_r, ParagraphStyle('check', fontSize=6, alignment=TA_CENTER))
-            ]
-            inspection_data.append(item_row)
-    
-    # Crear la tabla con anchos optimizados según el contenido
-    # Crear tabla con altura reducida en las filas
-    # Definir alturas específicas para cada fila (header y filas de contenido)
-    inspection_table = Table(inspection_data, colWidths=[0.6*inch, 1.5*inch, 0.2*inch, 0.2*inch, 0.2*inch])
-
-    
-    inspection_table.setStyle(TableStyle([
-        # Header principal con fondo rojo
-        ('BACKGROUND', (0, 0), (-1, 0), colors.red),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 5),  # Fuente más pequeña para headers
-        
-        # Configuración general
-        ('ALIGN', (0, 0), (0, -1), 'CENTER'),   # Columna SISTEMA centrada
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),     # OBJETO DE INSPECCIÓN alineado a la izquierda
-        ('ALIGN', (2, 0), (-1, -1), 'CENTER'),  # Checkboxes centrados
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 0),     # Padding eliminado para reducir altura
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),  # Padding eliminado para reducir altura
-        ('LEFTPADDING', (0, 0), (-1, -1), 1),    # Padding horizontal mínimo
-        ('RIGHTPADDING', (0, 0), (-1, -1), 1),   # Padding horizontal mínimo
-        ('FONTSIZE', (0, 1), (-1, -1), 4),       # Fuente muy pequeña para contenido
-    ]))
+            # Solo mostrar X cuando está marcado, vacío cuando no
+            inspection_data.append(
+                [sistema_cell, Paragraph(item_name, ITEM_STYLE)] +
+                [Paragraph('X' if status == check_status else '', CHECK_STYLE) for check_status in CHECK_STATUSES]
+            )
     
     # Aplicar spans para agrupar visualmente cada sistema
+    span_commands = []
     current_row = 1
     for category_data in inspection_items:
         items_count = len(category_data.get('items', []))
         if items_count > 1:
             # Hacer span vertical para el nombre del sistema cuando hay múltiples items
-            inspection_table.setStyle(TableStyle([
-                ('SPAN', (0, current_row), (0, current_row + items_count - 1)),
-                ('VALIGN', (0, current_row), (0, current_row + items_count - 1), 'MIDDLE'),
-            ]))
+            span_commands.append(('SPAN', (0, current_row), (0, current_row + items_count - 1)))
+            span_commands.append(('VALIGN', (0, current_row), (0, current_row + items_count - 1), 'MIDDLE'))
         current_row += items_count
     
-    elements.append(inspection_table)
-    
-    return elements
+    return inspection_data, span_commands
 
 
 def _create_work_section(report_data: Dict[str, Any], section_style: ParagraphStyle, normal_style: ParagraphStyle) -> list:
@@ -373,104 +675,24 @@ def _create_work_section(report_data: Dict[str, Any], section_style: ParagraphSt
     left_column_elements = []
     
     # Trabajo realizado
-    work_content = report_data.get('work_performed', 'N/A')
-    # Agregar espacio predeterminado
-    work_content += '<br/><br/><br/><br/><br/><br/>'
-    
-    work_data = [
-        [Paragraph('TRABAJO REALIZADO', section_style)],
-        [Paragraph(work_content, normal_style)]
-    ]
-    
-    work_table = Table(work_data, colWidths=[3.3*inch])
-    work_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.red),
-        ('FONTSIZE', (0, 0), (-1, -1), 6),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-    ]))
-    
-    left_column_elements.append(work_table)
+    left_column_elements.append(_create_narrative_box(
+        'TRABAJO REALIZADO', report_data.get('work_performed', 'N/A'), section_style, normal_style
+    ))
     
     # Daños detectados
-    damage_content = report_data.get('detected_damages', 'N/A')
-    # Agregar espacio predeterminado
-    damage_content += '<br/><br/><br/><br/><br/><br/>'
-    
-    damage_data = [
-        [Paragraph('DAÑOS DETECTADOS', section_style)],
-        [Paragraph(damage_content, normal_style)]
-    ]
-    
-    damage_table = Table(damage_data, colWidths=[3.3*inch])
-    damage_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.red),
-        ('FONTSIZE', (0, 0), (-1, -1), 6),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-    ]))
-    
-    left_column_elements.append(damage_table)
+    left_column_elements.append(_create_narrative_box(
+        'DAÑOS DETECTADOS', report_data.get('detected_damages', 'N/A'), section_style, normal_style
+    ))
     
     # Posibles causas
-    causes_content = _format_possible_causes(report_data.get('possible_causes', []))
-    # Agregar espacio predeterminado
-    causes_content += '<br/><br/><br/><br/><br/><br/>'
-    
-    causes_data = [
-        [Paragraph('POSIBLES CAUSAS', section_style)],
-        [Paragraph(causes_content, normal_style)]
-    ]
-    
-    causes_table = Table(causes_data, colWidths=[3.3*inch])
-    causes_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.red),
-        ('FONTSIZE', (0, 0), (-1, -1), 6),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-    ]))
-    
-    left_column_elements.append(causes_table)
+    left_column_elements.append(_create_narrative_box(
+        'POSIBLES CAUSAS', _format_possible_causes(report_data.get('possible_causes', [])), section_style, normal_style
+    ))
     
     # Actividades realizadas
-    activities_content = report_data.get('activities_performed', 'N/A')
-    # Agregar espacio predeterminado
-    activities_content += '<br/><br/><br/><br/><br/><br/>'
-    
-    activities_data = [
-        [Paragraph('ACTIVIDADES REALIZADAS', section_style)],
-        [Paragraph(activities_content, normal_style)]
-    ]
-    
-    activities_table = Table(activities_data, colWidths=[3.3*inch])
-    activities_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.red),
-        ('FONTSIZE', (0, 0), (-1, -1), 6),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-    ]))
-    
-    left_column_elements.append(activities_table)
+    left_column_elements.append(_create_narrative_box(
+        'ACTIVIDADES REALIZADAS', report_data.get('activities_performed', 'N/A'), section_style, normal_style
+    ))
     
     # Puntos de operación en la columna izquierda
     op_points = report_data.get('operation_points', {})
@@ -482,19 +704,8 @@ def _create_work_section(report_data: Dict[str, Any], section_style: ParagraphSt
         ['PARO EMERGENCIA DENTRO DE ESPECIFICACIONES', op_points.get("paro_emergencia_especificaciones", "N/A")]
     ]
     
-    operation_subtable = Table(operation_subtable_data, colWidths=[2.0*inch, 1.3*inch])
-    operation_subtable.setStyle(TableStyle([
-        ('FONTSIZE', (0, 0), (-1, -1), 6),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # Columna izquierda alineada a la izquierda
-        ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # Columna derecha centrada
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 2),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),  # Valores en negrita
-        # Sin bordes internos para evitar doble borde
-    ]))
+    operation_subtable = SplitTable(operation_subtable_data, colWidths=[2.0*inch, 1.3*inch])
+    operation_subtable.setStyle(OPERATION_SUBTABLE_STYLE)
     
     # Tabla principal que contiene el título y la subtabla
     operation_data = [
@@ -502,18 +713,8 @@ def _create_work_section(report_data: Dict[str, Any], section_style: ParagraphSt
         [operation_subtable]
     ]
     
-    operation_table = Table(operation_data, colWidths=[3.3*inch])
-    operation_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.red),
-        ('FONTSIZE', (0, 0), (-1, -1), 6),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),  # Solo la tabla externa tiene bordes
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-    ]))
+    operation_table = SplitTable(operation_data, colWidths=[3.3*inch])
+    operation_table.setStyle(SECTION_BOX_TABLE_STYLE)  # Solo la tabla externa tiene bordes
     
     left_column_elements.append(operation_table)
     
@@ -525,23 +726,33 @@ def _create_work_section(report_data: Dict[str, Any], section_style: ParagraphSt
         [left_column_elements, right_column_elements]
     ]
     
-    main_content_table = Table(main_content_data, colWidths=[3.5*inch, 3.8*inch])
-    main_content_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),    # Centrar la tabla completa
-        ('TOPPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-        ('LEFTPADDING', (0, 0), (0, -1), 0),      # Sin padding izquierdo en columna izquierda
-        ('RIGHTPADDING', (0, 0), (0, -1), 12),    # Más separación entre columnas
-        ('LEFTPADDING', (1, 0), (1, -1), 12),     # Más separación entre columnas
-        ('RIGHTPADDING', (1, 0), (1, -1), 0),     # Sin padding derecho en columna derecha
-    ]))
+    # Si no cabe en la página, el renglón se parte y ambas columnas siguen en la siguiente
+    main_content_table = SplitTable(main_content_data, colWidths=[3.5*inch, 3.8*inch], splitInRow=MIN_SPLIT_HEIGHT)
+    main_content_table.setStyle(MAIN_CONTENT_TABLE_STYLE)
     
     elements.append(main_content_table)
     
     return elements
 
 
+def _create_narrative_box(title: str, content: str, section_style: ParagraphStyle, normal_style: ParagraphStyle) -> Table:
+    """
+    Recuadro de texto libre con título: el texto y NARRATIVE_BLANK_LINES
+    renglones en blanco debajo. Si no cabe en la página, continúa en la
+    siguiente.
+    """
+    data = [
+        [Paragraph(title, section_style)],
+        # Celda como lista: Table solo parte celdas con listas de flowables
+        [[Paragraph(content, normal_style), Spacer(1, NARRATIVE_BLANK_LINES * normal_style.leading)]]
+    ]
+    
+    # splitByRow=0: se parte el texto antes que separar el título de su contenido
+    table = SplitTable(data, colWidths=[3.3*inch], splitByRow=0, splitInRow=MIN_SPLIT_HEIGHT)
+    table.setStyle(SECTION_BOX_TABLE_STYLE)
+    return table
+
+
 def _create_compact_inspection(report_data: Dict[str, Any], section_style: ParagraphStyle) -> list:
     """
     Crea la sección de inspección compacta con checkboxes.
@@ -571,8 +782,7 @@ def _create_compact_inspection(report_data: Dict[str, Any], section_style: Parag
     for category, items in inspection_categories.items():
         if items:
             # Agregar header de categoría
-            category_row = [Paragraph(f'<b>{category}</b>', 
-                                    ParagraphStyle('cat', fontSize=7, fontName='Helvetica-Bold', textColor=colors.white)), '']
+            category_row = [Paragraph(f'<b>{category}</b>', CATEGORY_STYLE), '']
             inspection_data.append(category_row)
             
             # Agregar items de la categoría
@@ -599,42 +809,24 @@ def _create_compact_inspection(report_data: Dict[str, Any], section_style: Parag
         right_col = ''
         
         if i == 0:
-            right_col = Paragraph('VELOCIDAD DE AVANCE', 
-                                 ParagraphStyle('op', fontSize=7, fontName='Helvetica-Bold'))
+            right_col = Paragraph('VELOCIDAD DE AVANCE', OP_LABEL_STYLE)
         elif i == 1 and len(op_data) > 0:
-            right_col = Paragraph(f"{operation_points.get('velocidad_avance', 'N/A')} Km/h", 
-                                 ParagraphStyle('op', fontSize=7))
+            right_col = Paragraph(f"{operation_points.get('velocidad_avance', 'N/A')} Km/h", OP_VALUE_STYLE)
         elif i == 2:
-            right_col = Paragraph('FUNCIONES AUXILIARES OPERANDO', 
-                                 ParagraphStyle('op', fontSize=7, fontName='Helvetica-Bold'))
+            right_col = Paragraph('FUNCIONES AUXILIARES OPERANDO', OP_LABEL_STYLE)
         elif i == 3:
-            right_col = Paragraph(operation_points.get('funciones_auxiliares_operando', 'N/A'), 
-                                 ParagraphStyle('op', fontSize=7))
+            right_col = Paragraph(operation_points.get('funciones_auxiliares_operando', 'N/A'), OP_VALUE_STYLE)
         elif i == 4:
-            right_col = Paragraph('PARO EMERGENCIA ESPECIFICACIONES', 
-                                 ParagraphStyle('op', fontSize=7, fontName='Helvetica-Bold'))
+            right_col = Paragraph('PARO EMERGENCIA ESPECIFICACIONES', OP_LABEL_STYLE)
         elif i == 5:
-            right_col = Paragraph(operation_points.get('paro_emergencia_especificaciones', 'N/A'), 
-                                 ParagraphStyle('op', fontSize=7))
+            right_col = Paragraph(operation_points.get('paro_emergencia_especificaciones', 'N/A'), OP_VALUE_STYLE)
         
         combined_data.append([left_col[0] if len(left_col) > 0 else '', 
                              left_col[1] if len(left_col) > 1 else '', 
                              right_col])
     
     inspection_table = Table(combined_data, colWidths=[3.5*inch, 0.5*inch, 3.5*inch])  # Aumentado el ancho total
-    inspection_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, 0), colors.red),
-        ('BACKGROUND', (2, 0), (2, 0), colors.red),
-        ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
-        ('TEXTCOLOR', (2, 0), (2, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 6),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 1), (1, -1), 'CENTER'),
-        ('GRID', (0, 0), (1, -1), 1, colors.black),
-        ('GRID', (2, 0), (2, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
+    inspection_table.setStyle(COMPACT_INSPECTION_TABLE_STYLE)
     
     elements.append(inspection_table)
     
@@ -651,17 +843,11 @@ def _create_bottom_section(report_data: Dict[str, Any], section_style: Paragraph
     if report_data.get('technician_comments'):
         comments_data = [
             [Paragraph('COMENTARIOS DEL TÉCNICO', section_style)],
-            [Paragraph(report_data.get('technician_comments', ''), normal_style)]
+            [[Paragraph(report_data.get('technician_comments', ''), normal_style)]]
         ]
         
-        comments_table = Table(comments_data, colWidths=[7.5*inch])  # Aumentado de 6.5 a 7.5
-        comments_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.red),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
+        comments_table = SplitTable(comments_data, colWidths=[7.5*inch], splitByRow=0, splitInRow=MIN_SPLIT_HEIGHT)  # Aumentado de 6.5 a 7.5
+        comments_table.setStyle(COMMENTS_TABLE_STYLE)
         
         elements.append(comments_table)
     
@@ -687,18 +873,8 @@ def _create_bottom_section(report_data: Dict[str, Any], section_style: Paragraph
     else:
         parts_subtable_data = [['No se aplicaron refacciones ni consumibles', '']]
     
-    parts_subtable = Table(parts_subtable_data, colWidths=[2.8*inch, 0.95*inch])
-    parts_subtable.setStyle(TableStyle([
-        ('FONTSIZE', (0, 0), (-1, -1), 6),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),     # Columna de descripción alineada a la izquierda
-        ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # Columna de cantidad centrada
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1),    # Reducido de 2 a 1
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1), # Reducido de 2 a 1
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),  # Cantidad en negrita
-    ]))
+    parts_subtable = SplitTable(parts_subtable_data, colWidths=[2.8*inch, 0.95*inch])
+    parts_subtable.setStyle(PARTS_SUBTABLE_STYLE)
     
     # Subtabla de tiempo (dos columnas: concepto y valor)
     work_time = report_data.get('work_time', {})
@@ -709,42 +885,29 @@ def _create_bottom_section(report_data: Dict[str, Any], section_style: Paragraph
         ['Total Horas', work_time.get('total_horas', 'N/A')]
     ]
     
-    time_subtable = Table(time_subtable_data, colWidths=[1.8*inch, 1.95*inch])
-    time_subtable.setStyle(TableStyle([
-        ('FONTSIZE', (0, 0), (-1, -1), 6),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),     # Columna de concepto alineada a la izquierda
-        ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # Columna de valor centrada
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1),    # Reducido de 2 a 1
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1), # Reducido de 2 a 1
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),  # Valores en negrita
-    ]))
-    
-    # Contenido con las subtablas
+    time_subtable = SplitTable(time_subtable_data, colWidths=[1.8*inch, 1.95*inch])
+    time_subtable.setStyle(TIME_SUBTABLE_STYLE)
+    
+    # Contenido con las subtablas (en listas para que el renglón pueda partirse)
     parts_time_data.append([
-        parts_subtable,
-        time_subtable
+        [parts_subtable],
+        [time_subtable]
     ])
     
-    parts_time_table = Table(parts_time_data, colWidths=[3.75*inch, 3.75*inch])  # Aumentado de 3.25 a 3.75
-    parts_time_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.red),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
+    # Con muchas refacciones continúa en la página siguiente, repitiendo los títulos
+    parts_time_table = SplitTable(parts_time_data, colWidths=[3.75*inch, 3.75*inch], repeatRows=1, splitInRow=MIN_SPLIT_HEIGHT)  # Aumentado de 3.25 a 3.75
+    parts_time_table.setStyle(PARTS_TIME_TABLE_STYLE)
     
     elements.append(parts_time_table)
     
     # Firmas con información del creador del reporte
-    signatures = report_data.get('signatures', {})
+    signatures = report_data.get('signatures') or {}
+    technician_signature = signatures.get('technician') or {}
+    client_signature = signatures.get('client') or {}
     created_by = report_data.get('created_by', {})
     creator_name = created_by.get('name', 'N/A')
-    technician_name = signatures.get('technician', {}).get('name', 'TÉCNICO')
-    client_name = signatures.get('client', {}).get('name', 'CLIENTE')
+    technician_name = technician_signature.get('name', 'TÉCNICO')
+    client_name = client_signature.get('name', 'CLIENTE')
     
     # Crear texto combinado para el técnico con el creador del reporte
     tech_text = f"Técnico de servicio que valoró la inspección:\n{technician_name}"
@@ -754,27 +917,39 @@ def _create_bottom_section(report_data: Dict[str, Any], section_style: Paragraph
     sig_data = [
         ['SELLO DE LA EMPRESA', 'CONFORMIDAD AUTORIZADA'],
         [
-            Paragraph(tech_text, ParagraphStyle('tech_sig', fontSize=7, fontName='Helvetica', alignment=TA_CENTER, leading=8)),
-            Paragraph(client_name, ParagraphStyle('client_sig', fontSize=7, fontName='Helvetica', alignment=TA_CENTER, leading=8))
+            _signature_cell(
+                Paragraph(tech_text, TECH_SIG_STYLE),
+                technician_signature.get('signature_url'),
+                report_data.get('technician_signature')
+            ),
+            _signature_cell(
+                Paragraph(client_name, CLIENT_SIG_STYLE),
+                client_signature.get('signature_url'),
+                report_data.get('client_signature')
+            )
         ]
     ]
     
     sig_table = Table(sig_data, colWidths=[3.75*inch, 3.75*inch], rowHeights=[0.25*inch, 0.6*inch])  # Reducido de 0.3 a 0.25
-    sig_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.red),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 6),  # Reducido de 8 a 6
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'BOTTOM'),
-    ]))
+    sig_table.setStyle(SIGNATURES_TABLE_STYLE)
     
     elements.append(sig_table)
     
     return elements
 
 
+def _signature_cell(name_paragraph: Paragraph, *signature_urls):
+    """
+    Celda de firma: la imagen de la firma sobre el nombre del firmante. Se usa
+    la primera URL que resuelva a una imagen; si ninguna existe, solo el nombre.
+    """
+    for url in signature_urls:
+        signature = load_signature_image(url)
+        if signature is not None:
+            return [signature.fitted_flowable(SIGNATURE_MAX_WIDTH, SIGNATURE_MAX_HEIGHT), name_paragraph]
+    return name_paragraph
+
+
 def _format_possible_causes(causes) -> str:
     """Formatea las posibles causas - solo muestra la causa seleccionada."""
     if not causes:
@@ -0,0 +1,110 @@
+"""
+Sampling profiler for a running API process.
+
+A background thread wakes up every settings.profiler_interval seconds, reads
+the current stack of every other thread with sys._current_frames() and
+counts identical stacks. Nothing is installed in the profiled code (no
+sys.setprofile), so requests run at full speed; the cost is one stack walk
+per thread per sample.
+
+The result uses the collapsed stack format (one "frame;frame;frame count"
+line per distinct stack) read by flamegraph.pl, speedscope and Grafana's
+flame graph panel.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+# Leaf functions of threads that are waiting for work (thread pools, the
+# event loop selector); left out unless idle stacks are requested
+IDLE_FUNCTIONS = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("selectors.py", "select"),
+    ("thread.py", "_worker"),
+    ("handlers.py", "dequeue"),  # logging QueueListener
+}
+
+_profile_lock = threading.Lock()
+
+
+class ProfilerBusy(RuntimeError):
+    """Another profile is already running in this process."""
+
+
+def _path_prefixes() -> Tuple[str, ...]:
+    # Longest first, so frames are shown relative to the most specific entry
+    paths = {os.path.abspath(path) + os.sep for path in sys.path if path}
+    return tuple(sorted(paths, key=len, reverse=True))
+
+
+class _FrameLabels:
+    """'function (module/file.py:line)' per code object, computed once."""
+
+    def __init__(self):
+        self._labels: Dict[object, str] = {}
+        self._prefixes = _path_prefixes()
+
+    def __call__(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            for prefix in self._prefixes:
+                if filename.startswith(prefix):
+                    filename = filename[len(prefix):]
+                    break
+            label = self._labels[code] = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+        return label
+
+
+def _is_idle(code) -> bool:
+    return (os.path.basename(code.co_filename), code.co_name) in IDLE_FUNCTIONS
+
+
+def sample_stacks(seconds: float, interval: float, include_idle: bool = False) -> Tuple[str, int]:
+    """
+    Sample every thread of this process for the given time. Returns the
+    collapsed stacks and the number of samples taken. Blocks the calling
+    thread; raises ProfilerBusy if a profile is already running.
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusy("A profile is already running")
+    try:
+        labels = _FrameLabels()
+        thread_names: Dict[int, str] = {}
+        stacks: Counter = Counter()
+        own_id = threading.get_ident()
+        samples = 0
+        deadline = time.monotonic() + seconds
+
+        while time.monotonic() < deadline:
+            frames = sys._current_frames()
+            if frames.keys() - thread_names.keys():
+                thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in frames.items():
+                if thread_id == own_id:
+                    continue
+                if not include_idle and _is_idle(frame.f_code):
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(labels(frame.f_code))
+                    frame = frame.f_back
+                stack.append(thread_names.get(thread_id, str(thread_id)))
+                stacks[tuple(reversed(stack))] += 1
+            samples += 1
+            time.sleep(interval)
+    finally:
+        _profile_lock.release()
+
+    lines = [f"{';'.join(stack)} {count}" for stack, count in stacks.most_common()]
+    return "\n".join(lines) + "\n", samples
+
+
+def profile_filename(started: Optional[float] = None) -> str:
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(started or time.time()))
+    return f"profile-{os.getpid()}-{stamp}.collapsed"
@@ -0,0 +1,229 @@
+import hashlib
+import json
+import tempfile
+from typing import Dict, Any, Iterator, List, Optional
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Query, Session, joinedload
+
+from core.config import settings
+from core.metrics import PDF_RENDER_DURATION
+from models import Job, ServiceReport, User
+from utils.job_queue import enqueue_job
+from utils.s3_manager import s3_manager
+
+REPORT_PDF_JOB = "report_pdf"
+
+
+def build_report_pdf_data(report: ServiceReport) -> Dict[str, Any]:
+    """
+    Estructura todos los datos del reporte para el generador de PDF.
+    """
+    return {
+        "report_number": report.id,
+        "date": report.date if report.date else "N/A",
+        "client": {
+            "name": report.client.name if report.client else "N/A",
+            "address": report.client.address if report.client else "N/A"
+        },
+        "requested_by": {
+            "name": report.requested_by.name if report.requested_by else "N/A",
+            "position": report.requested_by.position if report.requested_by else "N/A"
+        },
+        "equipment": {
+            "type": report.equipment.type if report.equipment else "N/A",
+            "brand": report.equipment.brand if report.equipment else "N/A",
+            "model": report.equipment.model if report.equipment else "N/A",
+            "serial_number": report.equipment.serial_number if report.equipment else "N/A"
+        },
+        "technician": {
+            "name": report.technician.name if report.technician else "N/A",
+            "position": report.technician.position if report.technician else "N/A"
+        },
+        "created_by": {
+            "name": report.created_by_user.name if report.created_by_user else "N/A",
+            "position": report.created_by_user.position if report.created_by_user else "N/A"
+        },
+        "service_type": report.service_type or "N/A",
+        "billing_type": report.billing_type or "N/A",
+        "battery_percentage": report.battery_percentage,
+        "horometer_readings": report.horometer_readings or {},
+        "work_performed": report.work_performed or "N/A",
+        "detected_damages": report.detected_damages or "N/A",
+        "possible_causes": report.possible_causes or "N/A",
+        "activities_performed": report.activities_performed or "N/A",
+        "operation_points": report.operation_points or "N/A",
+        "inspection_items": report.inspection_items or [],
+        "technician_comments": report.technician_comments or "",
+        "applied_parts": report.applied_parts or [],
+        "work_time": report.work_time or {},
+        "signatures": report.signatures or {},
+        "client_signature": report.client_signature,
+        "technician_signature": report.technician_signature,
+        "status": report.status or "N/A"
+    }
+
+
+def report_pdf_filename(report: ServiceReport) -> str:
+    """Nombre de archivo descriptivo para el PDF del reporte."""
+    date_str = report.date.replace("-", "") if report.date else "sin_fecha"
+    return f"reporte_servicio_{report.id}_{date_str}.pdf"
+
+
+def render_report_pdf_data(report_data: Dict[str, Any]) -> bytes:
+    """
+    Genera el PDF compacto a partir de build_report_pdf_data. No usa la
+    sesión, así que puede correr en un hilo fuera del event loop.
+    """
+    from utils.pdf_generator_compact import generate_service_report_pdf_compact
+    with PDF_RENDER_DURATION.labels("report").time():
+        return generate_service_report_pdf_compact(report_data).getvalue()
+
+
+def render_report_pdf(report: ServiceReport) -> bytes:
+    """Genera el PDF compacto del reporte y devuelve su contenido."""
+    return render_report_pdf_data(build_report_pdf_data(report))
+
+
+def render_reports_pdf(reports_data: List[Dict[str, Any]]):
+    """
+    Genera un solo PDF con varios reportes. El resultado se escribe en un
+    archivo temporal que pasa a disco si crece más de settings.history_pdf_spool_size.
+    """
+    from utils.pdf_generator_compact import generate_service_reports_pdf_compact
+    output = tempfile.SpooledTemporaryFile(max_size=settings.history_pdf_spool_size)
+    try:
+        with PDF_RENDER_DURATION.labels("history").time():
+            return generate_service_reports_pdf_compact(reports_data, output=output)
+    except Exception:
+        output.close()
+        raise
+
+
+def _iter_file(file, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    try:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        file.close()
+
+
+async def reports_pdf_response(query: Query, current_user: User, filename: str) -> StreamingResponse:
+    """
+    Historial en un solo PDF con los reportes de query (más antiguos primero).
+    Los operadores solo reciben los reportes que crearon.
+    """
+    if current_user.role == "operador":
+        query = query.filter(ServiceReport.created_by == current_user.id)
+
+    reports = query.options(
+        joinedload(ServiceReport.client),
+        joinedload(ServiceReport.requested_by),
+        joinedload(ServiceReport.equipment),
+        joinedload(ServiceReport.technician),
+        joinedload(ServiceReport.created_by_user)
+    ).order_by(ServiceReport.date, ServiceReport.id).limit(settings.history_pdf_max_reports + 1).all()
+
+    if not reports:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No service reports found"
+        )
+    if len(reports) > settings.history_pdf_max_reports:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many reports for a single PDF (max {settings.history_pdf_max_reports})"
+        )
+
+    # Los datos se leen de la sesión aquí; el render corre fuera del event loop
+    reports_data = [build_report_pdf_data(report) for report in reports]
+    pdf = await run_in_threadpool(render_reports_pdf, reports_data)
+    size = pdf.seek(0, 2)
+    pdf.seek(0)
+
+    return StreamingResponse(
+        _iter_file(pdf),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Content-Length": str(size),
+            "Cache-Control": "no-cache, no-store, must-revalidate"
+        }
+    )
+
+
+def report_version(report: ServiceReport) -> str:
+    """
+    Identifica la versión del PDF del reporte: un hash de los datos que
+    muestra, así cambia con cada modificación del reporte y también del
+    cliente, contacto, equipo o usuarios que aparecen en él.
+    """
+    report_data = json.dumps(build_report_pdf_data(report), sort_keys=True, default=str)
+    return hashlib.sha256(report_data.encode()).hexdigest()
+
+
+def _report_pdf_job_key(report_id: int) -> str:
+    return f"{REPORT_PDF_JOB}:{report_id}"
+
+
+def enqueue_report_pdf(
+    db: Session,
+    report: ServiceReport,
+    created_by: Optional[int] = None,
+    commit: bool = True
+) -> Job:
+    """Encola el pre-renderizado del PDF para que quede listo en el almacenamiento."""
+    return enqueue_job(
+        db,
+        REPORT_PDF_JOB,
+        payload={"report_id": report.id},
+        created_by=created_by,
+        dedupe_key=_report_pdf_job_key(report.id),
+        commit=commit
+    )
+
+
+def find_stored_report_pdf(db: Session, report: ServiceReport) -> Optional[Dict[str, Any]]:
+    """
+    Busca el PDF pre-renderizado más reciente del reporte. Solo se devuelve si
+    se generó a partir de la versión actual del reporte.
+    """
+    job = db.query(Job).filter(
+        Job.dedupe_key == _report_pdf_job_key(report.id),
+        Job.status == "succeeded"
+    ).order_by(Job.finished_at.desc()).first()
+    if not job or not (job.result or {}).get("artifact"):
+        return None
+
+    if job.result.get("report_version") != report_version(report):
+        return None
+
+    return job.result["artifact"]
+
+
+def discard_older_report_pdfs(db: Session, report_id: int, keep_job_id: int) -> int:
+    """
+    Borra del almacenamiento los PDFs pre-renderizados anteriores del reporte
+    y los quita del resultado de sus trabajos; solo se sirve el más reciente.
+    Devuelve cuántos se borraron.
+    """
+    jobs = db.query(Job).filter(
+        Job.dedupe_key == _report_pdf_job_key(report_id),
+        Job.status == "succeeded",
+        Job.id != keep_job_id
+    ).all()
+    discarded = 0
+    for job in jobs:
+        artifact = (job.result or {}).get("artifact")
+        if not artifact:
+            continue
+        if s3_manager.delete_artifact(artifact):
+            # JSON column: assign a new dict so the change is detected
+            job.result = {key: value for key, value in job.result.items() if key != "artifact"}
+            discarded += 1
+    return discarded
@@ -0,0 +1,175 @@
+"""
+Monthly rollup of service reports (report_monthly_stats) for analytics.
+
+Each row counts the reports of one month with one value of one dimension
+(status, service type, billing type, client or technician) and sums their
+work_time.total_horas, so a report is counted in five rows. Dimensions are
+rolled up separately and by month because their combinations per day are
+nearly as many as the reports themselves (about one rollup row per report on
+the synthetic dataset); per month and dimension they compress by the number
+of reports a value gets in a month. Analytics queries read these rows instead
+of scanning service_reports.
+
+The table is kept up to date incrementally: mapper events on ServiceReport
+turn every insert, update and delete into +1/-1 deltas that are upserted in
+the same transaction as the report. Bulk writes that bypass the ORM (the
+synthetic dataset generator, manual SQL) must call rebuild_report_stats,
+which is also a background job (report_stats_rebuild) for periodic
+reconciliation.
+"""
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import String, cast, delete, event, func, inspect, insert, literal, select, text, tuple_
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from models import ReportMonthlyStats, ServiceReport
+
+logger = logging.getLogger(__name__)
+
+REPORT_STATS_REBUILD_JOB = "report_stats_rebuild"
+
+# Rollup dimension -> ServiceReport attribute
+DIMENSIONS = {
+    "status": "status",
+    "service_type": "service_type",
+    "billing_type": "billing_type",
+    "client": "client_id",
+    "technician": "technician_id",
+}
+DEFAULT_STATUS = "pending"
+KEY_COLUMNS = ["month", "dimension", "value"]
+# ServiceReport attributes that place a report in the rollup
+ATTRIBUTES = ["date", *DIMENSIONS.values()]
+
+StatsKey = Tuple[str, str, str]
+
+
+def _hours(work_time: Optional[dict]) -> float:
+    try:
+        return float((work_time or {}).get("total_horas") or 0)
+    except (AttributeError, TypeError, ValueError):
+        return 0.0
+
+
+def _keys(values: Dict[str, Any]) -> List[StatsKey]:
+    """The rollup rows a report with these attribute values is counted in."""
+    month = values["date"][:7]
+    # status has a Python-side default; the row must match what was stored
+    values = {**values, "status": values["status"] or DEFAULT_STATUS}
+    return [(month, dimension, str(values[attribute])) for dimension, attribute in DIMENSIONS.items()]
+
+
+def _current(report: ServiceReport) -> Tuple[List[StatsKey], float]:
+    values = {attribute: getattr(report, attribute) for attribute in ATTRIBUTES}
+    return _keys(values), _hours(report.work_time)
+
+
+def _previous(report: ServiceReport) -> Tuple[List[StatsKey], float]:
+    """Keys and hours the report had before the changes being flushed."""
+    state = inspect(report)
+
+    def before(attribute):
+        history = state.attrs[attribute].history
+        if history.deleted:
+            return history.deleted[0]
+        return getattr(report, attribute)
+
+    values = {attribute: before(attribute) for attribute in ATTRIBUTES}
+    return _keys(values), _hours(before("work_time"))
+
+
+def _upsert_statement(connection: Connection):
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise RuntimeError(f"report_monthly_stats upserts are not supported for {dialect}")
+    return dialect_insert(ReportMonthlyStats)
+
+
+def apply_deltas(connection: Connection, deltas: List[Tuple[List[StatsKey], int, float]]):
+    """Add (keys, report count, hours) deltas to the rollup in one upsert."""
+    merged: Dict[StatsKey, List[float]] = {}
+    for keys, count, hours in deltas:
+        for key in keys:
+            totals = merged.setdefault(key, [0, 0.0])
+            totals[0] += count
+            totals[1] += hours
+    rows = [
+        {**dict(zip(KEY_COLUMNS, key)), "report_count": count, "total_hours": hours}
+        for key, (count, hours) in merged.items()
+        if count or hours
+    ]
+    if not rows:
+        return
+
+    table = ReportMonthlyStats.__table__
+    statement = _upsert_statement(connection).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=KEY_COLUMNS,
+        set_={
+            "report_count": table.c.report_count + statement.excluded.report_count,
+            "total_hours": table.c.total_hours + statement.excluded.total_hours,
+        }
+    )
+    connection.execute(statement)
+
+    # Values left without reports in a month are removed
+    emptied = [key for key, (count, _) in merged.items() if count < 0]
+    if emptied:
+        columns = [table.c[column] for column in KEY_COLUMNS]
+        connection.execute(
+            delete(table).where(tuple_(*columns).in_(emptied), table.c.report_count <= 0)
+        )
+
+
+@event.listens_for(ServiceReport, "after_insert")
+def _report_inserted(mapper, connection, report):
+    keys, hours = _current(report)
+    apply_deltas(connection, [(keys, 1, hours)])
+
+
+@event.listens_for(ServiceReport, "after_update")
+def _report_updated(mapper, connection, report):
+    old_keys, old_hours = _previous(report)
+    new_keys, new_hours = _current(report)
+    if old_keys == new_keys and old_hours == new_hours:
+        return
+    apply_deltas(connection, [(old_keys, -1, -old_hours), (new_keys, 1, new_hours)])
+
+
+@event.listens_for(ServiceReport, "after_delete")
+def _report_deleted(mapper, connection, report):
+    keys, hours = _previous(report)
+    apply_deltas(connection, [(keys, -1, -hours)])
+
+
+def rebuild_report_stats(db: Session, commit: bool = True) -> int:
+    """
+    Recompute the whole rollup from service_reports with one
+    INSERT ... SELECT ... GROUP BY per dimension. Returns the number of
+    rollup rows.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        # Report writes wait until the rebuild commits, so none is lost or counted twice
+        db.execute(text("LOCK TABLE report_monthly_stats IN EXCLUSIVE MODE"))
+
+    month = func.substr(ServiceReport.date, 1, 7)
+    hours = func.coalesce(func.sum(ServiceReport.work_time["total_horas"].as_float()), 0)
+    db.query(ReportMonthlyStats).delete(synchronize_session=False)
+    for dimension, attribute in DIMENSIONS.items():
+        value = getattr(ServiceReport, attribute)
+        if dimension == "status":
+            value = func.coalesce(value, DEFAULT_STATUS)
+        rollup = select(month, literal(dimension), cast(value, String), func.count(), hours).group_by(month, value)
+        db.execute(insert(ReportMonthlyStats).from_select([*KEY_COLUMNS, "report_count", "total_hours"], rollup))
+    if commit:
+        db.commit()
+
+    rows = db.query(func.count(ReportMonthlyStats.id)).scalar()
+    logger.info("Rebuilt report_monthly_stats: %s rows", rows)
+    return rows
@@ -1,23 +1,85 @@
+import asyncio
+import math
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import boto3
-from botocore.exceptions import ClientError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 from core.config import settings
+from core.metrics import cache_counters
 import logging
 
 logger = logging.getLogger(__name__)
 
+# DeleteObjects accepts at most 1000 keys per request
+DELETE_BATCH_SIZE = 1000
+
+_PRESIGNED_URL_HITS, _PRESIGNED_URL_MISSES = cache_counters("s3_presigned_url")
+
 class S3Manager:
     def __init__(self):
         self.s3_client = None
         self.bucket_name = settings.aws_s3_bucket
-        
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # LRU of presigned URLs: (object_name, expiration, window_start) -> url
+        self._presigned_urls: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self._presigned_urls_lock = threading.Lock()
+
+        # Multipart thresholds for upload_file/upload_fileobj
+        self.transfer_config = TransferConfig(
+            multipart_threshold=settings.s3_multipart_threshold,
+            multipart_chunksize=settings.s3_multipart_chunksize,
+            max_concurrency=settings.s3_transfer_max_concurrency,
+        )
+
         if settings.aws_access_key_id and settings.aws_secret_access_key:
+            # boto3 clients are thread-safe, so a single pooled client is
+            # shared by every request and by the executor threads below
             self.s3_client = boto3.client(
                 's3',
                 aws_access_key_id=settings.aws_access_key_id,
                 aws_secret_access_key=settings.aws_secret_access_key,
-                region_name=settings.aws_region
+                region_name=settings.aws_region,
+                config=Config(
+                    max_pool_connections=settings.s3_max_pool_connections,
+                    connect_timeout=settings.s3_connect_timeout,
+                    read_timeout=settings.s3_read_timeout,
+                    retries={
+                        'max_attempts': settings.s3_max_attempts,
+                        'mode': settings.s3_retry_mode,
+                    },
+                )
             )
-    
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Dedicated thread pool for blocking S3 calls."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.s3_executor_workers,
+                thread_name_prefix="s3"
+            )
+        return self._executor
+
+    async def run_in_executor(self, func, *args, **kwargs):
+        """Run a blocking S3 call on the dedicated executor without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    def shutdown(self):
+        """Stop the executor, waiting for in-flight calls to finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def upload_file(self, file_path: str, object_name: str) -> bool:
         """Upload a file to S3 bucket."""
         if not self.s3_client:
@@ -25,7 +87,9 @@ class S3Manager:
             return False
         
         try:
-            self.s3_client.upload_file(file_path, self.bucket_name, object_name)
+            self.s3_client.upload_file(
+                file_path, self.bucket_name, object_name, Config=self.transfer_config
+            )
             return True
         except ClientError as e:
             logger.error(f"Error uploading file to S3: {e}")
@@ -38,34 +102,70 @@ class S3Manager:
             return False
         
         try:
-            self.s3_client.upload_fileobj(file_obj, self.bucket_name, object_name)
+            self.s3_client.upload_fileobj(
+                file_obj, self.bucket_name, object_name, Config=self.transfer_config
+            )
             return True
         except ClientError as e:
             logger.error(f"Error uploading file object to S3: {e}")
             return False
     
     def generate_presigned_url(self, object_name: str, expiration: int = 3600) -> str:
-        """Generate a presigned URL for an S3 object."""
+        """
+        Generate a presigned URL for an S3 object.
+
+        Expiry times are aligned to S3_PRESIGNED_URL_BUCKET_SECONDS windows:
+        every call in the same window gets the same URL, valid until the end
+        of the window plus `expiration`. Browsers and CDNs can cache the object
+        behind it, and callers always get at least the lifetime they asked for.
+        """
         if not self.s3_client:
             return None
         
+        now = time.time()
+        window = settings.s3_presigned_url_bucket_seconds
+        window_start = int(now // window) * window
+        key = (object_name, expiration, window_start)
+        with self._presigned_urls_lock:
+            cached = self._presigned_urls.get(key)
+            if cached:
+                self._presigned_urls.move_to_end(key)
+                _PRESIGNED_URL_HITS.inc()
+                return cached
+        _PRESIGNED_URL_MISSES.inc()
+
+        expires_at = window_start + window + expiration
         try:
             response = self.s3_client.generate_presigned_url(
                 'get_object',
                 Params={'Bucket': self.bucket_name, 'Key': object_name},
-                ExpiresIn=expiration
+                ExpiresIn=math.ceil(expires_at - now)
             )
-            return response
         except ClientError as e:
             logger.error(f"Error generating presigned URL: {e}")
             return None
+
+        with self._presigned_urls_lock:
+            self._presigned_urls[key] = response
+            self._presigned_urls.move_to_end(key)
+            while len(self._presigned_urls) > settings.s3_presigned_url_cache_size:
+                self._presigned_urls.popitem(last=False)
+        return response
     
+    def _invalidate_presigned_urls(self, object_names: Iterable[str]):
+        """Drop cached presigned URLs for deleted objects."""
+        object_names = set(object_names)
+        with self._presigned_urls_lock:
+            for key in [key for key in self._presigned_urls if key[0] in object_names]:
+                del self._presigned_urls[key]
+
     def delete_file(self, object_name: str) -> bool:
         """Delete a file from S3 bucket."""
         if not self.s3_client:
             logger.warning("S3 client not configured")
             return False
         
+        self._invalidate_presigned_urls([object_name])
         try:
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=object_name)
             return True
@@ -73,5 +173,122 @@ class S3Manager:
             logger.error(f"Error deleting file from S3: {e}")
             return False
 
+    def delete_many(self, object_names: Iterable[str]) -> List[str]:
+        """Delete files in batches using DeleteObjects. Returns the keys that could not be deleted."""
+        object_names = list(object_names)
+        if not self.s3_client:
+            logger.warning("S3 client not configured")
+            return object_names
+
+        failed = []
+        for start in range(0, len(object_names), DELETE_BATCH_SIZE):
+            failed.extend(self._delete_batch(object_names[start:start + DELETE_BATCH_SIZE]))
+        return failed
+
+    def _delete_batch(self, batch: List[str]) -> List[str]:
+        """Delete up to DELETE_BATCH_SIZE keys in a single request."""
+        self._invalidate_presigned_urls(batch)
+        try:
+            response = self.s3_client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={
+                    'Objects': [{'Key': key} for key in batch],
+                    'Quiet': True,  # Only errors are returned
+                }
+            )
+        except (ClientError, BotoCoreError) as e:
+            # Connection errors and timeouts fail the batch, not the whole delete_many
+            logger.error(f"Error deleting {len(batch)} files from S3: {e}")
+            return batch
+
+        errors = response.get('Errors', [])
+        for error in errors:
+            logger.error(f"Error deleting {error.get('Key')} from S3: {error.get('Message')}")
+        return [error['Key'] for error in errors]
+
+    def put_artifact(self, object_name: str, data: bytes, content_type: str = "application/octet-stream") -> Dict[str, Any]:
+        """
+        Store a generated artifact (PDFs, exports). Uses S3 when configured and
+        falls back to settings.artifacts_dir otherwise, which is not served
+        statically: local artifacts are only sent by authorized endpoints.
+        Returns the location.
+        """
+        if self.s3_client:
+            try:
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name, Key=object_name, Body=data, ContentType=content_type
+                )
+                return {"storage": "s3", "key": object_name}
+            except ClientError as e:
+                logger.error(f"Error uploading artifact to S3, storing locally: {e}")
+
+        path = os.path.join(settings.artifacts_dir, object_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so readers never see a partial file; the temporary
+        # name is unique so concurrent writers of the same key don't collide
+        tmp = tempfile.NamedTemporaryFile(dir=os.path.dirname(path), prefix=".", suffix=".tmp", delete=False)
+        try:
+            with tmp:
+                tmp.write(data)
+            os.replace(tmp.name, path)
+        except Exception:
+            os.remove(tmp.name)
+            raise
+        return {"storage": "local", "key": object_name, "path": path}
+
+    def artifact_url(self, artifact: Dict[str, Any], expiration: int = 3600) -> Optional[str]:
+        """Short-lived presigned URL for an S3 artifact; None for local ones."""
+        if artifact.get("storage") == "s3":
+            return self.generate_presigned_url(artifact["key"], expiration)
+        return None
+
+    def delete_artifact(self, artifact: Dict[str, Any]) -> bool:
+        """Delete an artifact returned by put_artifact."""
+        if artifact.get("storage") == "s3":
+            return self.delete_file(artifact["key"])
+        try:
+            os.remove(artifact["path"])
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Error deleting local artifact {artifact['path']}: {e}")
+            return False
+        return True
+
+    def get_artifact_body(self, artifact: Dict[str, Any]) -> Optional[Tuple[Any, int]]:
+        """Open an S3 artifact for streaming. Returns (body, content_length) or None."""
+        if artifact.get("storage") != "s3" or not self.s3_client:
+            return None
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=artifact["key"])
+        except ClientError as e:
+            logger.error(f"Error reading artifact from S3: {e}")
+            return None
+        return response["Body"], response["ContentLength"]
+
+    # Async variants, executed on the dedicated executor
+
+    async def upload_file_async(self, file_path: str, object_name: str) -> bool:
+        return await self.run_in_executor(self.upload_file, file_path, object_name)
+
+    async def upload_fileobj_async(self, file_obj, object_name: str) -> bool:
+        return await self.run_in_executor(self.upload_fileobj, file_obj, object_name)
+
+    async def delete_file_async(self, object_name: str) -> bool:
+        return await self.run_in_executor(self.delete_file, object_name)
+
+    async def delete_many_async(self, object_names: Iterable[str]) -> List[str]:
+        """Delete files with the DeleteObjects batches sent concurrently."""
+        object_names = list(object_names)
+        if not self.s3_client:
+            logger.warning("S3 client not configured")
+            return object_names
+
+        results = await asyncio.gather(*[
+            self.run_in_executor(self._delete_batch, object_names[start:start + DELETE_BATCH_SIZE])
+            for start in range(0, len(object_names), DELETE_BATCH_SIZE)
+        ])
+        return [key for failed in results for key in failed]
+
 # Global S3 manager instance
 s3_manager = S3Manager()
@@ -0,0 +1,165 @@
+import os
+import re
+from email.utils import formatdate
+from typing import Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from core.config import settings
+
+# Uploaded files are named with a uuid4 hex, so their content never changes
+IMMUTABLE_NAME = re.compile(r"[0-9a-f]{32}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+RANGE_HEADER = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeFileResponse(FileResponse):
+    """
+    FileResponse that can send a byte range and uses the server's zero-copy
+    extensions (sendfile) when available.
+    """
+
+    def __init__(self, *args, byte_range: Optional[Tuple[int, int]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.byte_range = byte_range
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.send_header_only:
+            await super().__call__(scope, receive, send)
+            return
+
+        size = self.stat_result.st_size
+        start, end = self.byte_range or (0, size - 1)
+        count = end - start + 1
+        extensions = scope.get("extensions") or {}
+
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+
+        if "http.response.zerocopysend" in extensions:
+            with open(self.path, "rb") as file:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": file,
+                    "offset": start,
+                    "count": count,
+                    "more_body": False,
+                })
+        elif "http.response.pathsend" in extensions and self.byte_range is None:
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+        else:
+            async with await anyio.open_file(self.path, mode="rb") as file:
+                await file.seek(start)
+                remaining = count
+                while remaining > 0:
+                    chunk = await file.read(min(self.chunk_size, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                # File shrank underneath us; close the body anyway
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        if self.background is not None:
+            await self.background()
+
+
+class UploadsStaticFiles(StaticFiles):
+    """
+    StaticFiles for /uploads with long-lived caching, conditional requests
+    and single byte-range support.
+    """
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope, status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+        headers = {
+            "etag": etag,
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            "accept-ranges": "bytes",
+            "cache-control": self._cache_control(full_path),
+        }
+
+        if self._etag_matches(request_headers.get("if-none-match"), etag):
+            return NotModifiedResponse(Headers(headers))
+        if "if-none-match" not in request_headers and self.is_not_modified(Headers(headers), request_headers):
+            return NotModifiedResponse(Headers(headers))
+
+        byte_range = None
+        range_header = request_headers.get("range")
+        if range_header and status_code == 200 and self._if_range_matches(request_headers.get("if-range"), headers):
+            byte_range = self._parse_range(range_header, stat_result.st_size)
+            if byte_range == ():
+                return Response(
+                    status_code=416,
+                    headers={**headers, "content-range": f"bytes */{stat_result.st_size}"}
+                )
+
+        if byte_range:
+            start, end = byte_range
+            headers["content-range"] = f"bytes {start}-{end}/{stat_result.st_size}"
+            headers["content-length"] = str(end - start + 1)
+            status_code = 206
+
+        return RangeFileResponse(
+            full_path,
+            status_code=status_code,
+            headers=headers,
+            stat_result=stat_result,
+            method=scope["method"],
+            byte_range=byte_range,
+        )
+
+    @staticmethod
+    def _cache_control(full_path) -> str:
+        if IMMUTABLE_NAME.search(os.path.basename(str(full_path))):
+            return f"public, max-age={settings.uploads_cache_max_age}, immutable"
+        return "public, no-cache"
+
+    @staticmethod
+    def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison, as required for If-None-Match
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return etag in candidates
+
+    @staticmethod
+    def _if_range_matches(if_range: Optional[str], headers: dict) -> bool:
+        if not if_range:
+            return True
+        return if_range.strip() in (headers["etag"], headers["last-modified"])
+
+    @staticmethod
+    def _parse_range(range_header: str, size: int):
+        """
+        Parse a single "bytes=" range. Returns (start, end), None to ignore the
+        header (multiple or malformed ranges, including a last byte before the
+        first) or () when it is valid but outside the file.
+        """
+        match = RANGE_HEADER.match(range_header.strip())
+        if not match:
+            return None
+        first, last = match.groups()
+        if not first and not last:
+            return None
+        if not first:
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length == 0 or size == 0:
+                return ()
+            return max(size - length, 0), size - 1
+        start = int(first)
+        if last and int(last) < start:
+            # Syntactically invalid (RFC 7233 2.1): served as a plain 200
+            return None
+        if start >= size:
+            return ()
+        end = min(int(last), size - 1) if last else size - 1
+        return start, end
@@ -0,0 +1,73 @@
+import argparse
+import logging
+import multiprocessing
+import signal
+import time
+
+from core.config import settings
+from core.logging_config import setup_logging
+from database import SessionLocal, engine
+from utils.job_queue import claim_job, run_job
+import utils.job_handlers  # noqa: F401 - registers the job handlers
+
+logger = logging.getLogger("worker")
+
+
+def work(stop_event, poll_interval: float):
+    """Claim and run jobs until stop_event is set."""
+    # Connections inherited from the parent process must not be reused
+    engine.dispose(close=False)
+    # The parent's log listener thread does not exist in this process
+    setup_logging()
+    # The parent process handles Ctrl+C and asks children to stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+
+    while not stop_event.is_set():
+        db = SessionLocal()
+        try:
+            job = claim_job(db)
+            if job is None:
+                stop_event.wait(poll_interval)
+                continue
+            logger.info("Running job %s (%s), attempt %s", job.id, job.job_type, job.attempts)
+            started = time.perf_counter()
+            run_job(db, job)
+            logger.info("Job %s %s in %.2fs", job.id, job.status, time.perf_counter() - started)
+        except Exception as e:
+            logger.exception("Worker error: %s", e)
+            stop_event.wait(poll_interval)
+        finally:
+            db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run background job workers")
+    parser.add_argument("--processes", type=int, default=settings.job_worker_processes)
+    parser.add_argument("--poll-interval", type=float, default=settings.job_poll_interval)
+    args = parser.parse_args()
+
+    setup_logging()
+
+    stop_event = multiprocessing.Event()
+    processes = [
+        multiprocessing.Process(target=work, args=(stop_event, args.poll_interval), name=f"worker-{i}")
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    logger.info("Started %d job worker processes", len(processes))
+
+    def shutdown(*_):
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+
+    # Running jobs are finished before the workers exit
+    for process in processes:
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
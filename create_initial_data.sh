@@ -22,10 +22,17 @@ fi
 # Wait for database
 wait_for_database
 
-# Run initial data creation
-echo "Creating initial data..."
+# Release step: schema migrations and initial data
+echo "Applying migrations and creating initial data..."
 python create_initial_data.py
 
 # Start the FastAPI application
+if [ "$APP_ENV" = "development" ]; then
+    # Single auto-reloading process; never used in production
+    echo "Starting FastAPI application (development, auto-reload)..."
+    exec uvicorn main:app --host 0.0.0.0 --port 8000 --reload
+fi
+
+# Gunicorn with Uvicorn workers; see gunicorn.conf.py and the SERVER_* settings
 echo "Starting FastAPI application..."
-exec uvicorn main:app --host 0.0.0.0 --port 8000 --reload
+exec gunicorn main:app -c gunicorn.conf.py